@@ -81,17 +81,25 @@
 from .drawing_support import make_transparent_color
 from .drawing_support import rotate_point
 
+from .texture import HitBoxCache
 from .texture import Matrix3x3
 from .texture import Texture
+from .texture import TextureCache
 from .texture import cleanup_texture_cache
+from .texture import get_texture_cache
 from .texture import load_spritesheet
 from .texture import load_texture
 from .texture import load_textures
+from .texture import load_textures_async
 from .texture import make_circle_texture
 from .texture import make_soft_circle_texture
 from .texture import make_soft_square_texture
+from .texture import set_hit_box_cache
 from .texture import trim_image
 
+from .texture_atlas import TextureAtlas
+from .texture_atlas import get_default_atlas
+
 from .buffered_draw_commands import TShape
 from .buffered_draw_commands import Shape
 from .buffered_draw_commands import ShapeElementList
@@ -146,7 +154,10 @@
 from .draw_commands import get_pixel
 
 from .geometry import are_polygons_intersecting
+from .geometry import are_polygons_intersecting_batch
+from .geometry import get_segment_polygon_intersection
 from .geometry import is_point_in_polygon
+from .geometry import pad_polygons
 
 from .gui import DialogueBox
 from .gui import SubmitButton
@@ -201,13 +212,17 @@
 
 from .sprite_list import SpriteList
 from .sprite_list import check_for_collision
+from .sprite_list import check_for_collision_between_lists
 from .sprite_list import check_for_collision_with_list
 from .sprite_list import get_closest_sprite
 from .sprite_list import get_sprites_at_exact_point
 from .sprite_list import get_sprites_at_point
+from .sprite_list import has_line_of_sight
 
 from .physics_engines import PhysicsEnginePlatformer
+from .physics_engines import PhysicsEnginePlatformerMulti
 from .physics_engines import PhysicsEngineSimple
+from .physics_engines import PhysicsEngineSimpleMulti
 
 from .read_tiled_map import GridLocation
 from .read_tiled_map import Tile
@@ -264,6 +279,7 @@
            'FadeParticle',
            'FilenameOrTexture',
            'GridLocation',
+           'HitBoxCache',
            'LifetimeParticle',
            'MOUSE_BUTTON_LEFT',
            'MOUSE_BUTTON_MIDDLE',
@@ -272,7 +288,9 @@
            'NoOpenGLException',
            'Particle',
            'PhysicsEnginePlatformer',
+           'PhysicsEnginePlatformerMulti',
            'PhysicsEngineSimple',
+           'PhysicsEngineSimpleMulti',
            'Point',
            'Point',
            'PointList',
@@ -295,6 +313,8 @@
            'TextLabel',
            'TextStorage',
            'Texture',
+           'TextureAtlas',
+           'TextureCache',
            'Theme',
            'Tile',
            'TiledMap',
@@ -304,8 +324,10 @@
            'View',
            'Window',
            'are_polygons_intersecting',
+           'are_polygons_intersecting_batch',
            'calculate_points',
            'check_for_collision',
+           'check_for_collision_between_lists',
            'check_for_collision_with_list',
            'clamp',
            'cleanup_texture_cache',
@@ -363,6 +385,7 @@
            'finish_render',
            'generate_sprites',
            'get_closest_sprite',
+           'get_default_atlas',
            'get_distance_between_sprites',
            'get_four_byte_color',
            'get_four_float_color',
@@ -374,11 +397,14 @@
            'get_projection',
            'get_rectangle_points',
            'get_scaling_factor',
+           'get_segment_polygon_intersection',
            'get_sprites_at_exact_point',
            'get_sprites_at_point',
+           'get_texture_cache',
            'get_tilemap_layer',
            'get_viewport',
            'get_window',
+           'has_line_of_sight',
            'is_point_in_polygon',
            'isometric_grid_to_screen',
            'lerp',
@@ -389,6 +415,7 @@
            'load_spritesheet',
            'load_texture',
            'load_textures',
+           'load_textures_async',
            'make_burst_emitter',
            'make_circle_texture',
            'make_interval_emitter',
@@ -396,6 +423,7 @@
            'make_soft_square_texture',
            'make_transparent_color',
            'open_window',
+           'pad_polygons',
            'pause',
            'play_sound',
            'process_layer',
@@ -424,6 +452,7 @@
            'schedule',
            'screen_to_isometric_grid',
            'set_background_color',
+           'set_hit_box_cache',
            'set_viewport',
            'set_window',
            'start_render',
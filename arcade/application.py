@@ -24,6 +24,9 @@
 MOUSE_BUTTON_MIDDLE = 2
 MOUSE_BUTTON_RIGHT = 4
 
+# Most fixed updates run in one go when the game falls behind
+_MAX_FIXED_UPDATES = 5
+
 _window: 'Window'
 
 
@@ -43,7 +46,7 @@ class Window(pyglet.window.Window):
     def __init__(self, width: int = 800, height: int = 600,
                  title: str = 'Arcade Window', fullscreen: bool = False,
                  resizable: bool = False, update_rate: Optional[float] = 1/60,
-                 antialiasing: bool = True):
+                 antialiasing: bool = True, fixed_update_rate: Optional[float] = None):
         """
         Construct a new window
 
@@ -54,6 +57,8 @@ def __init__(self, width: int = 800, height: int = 600,
         :param bool resizable: Can the user resize the window?
         :param float update_rate: How frequently to update the window.
         :param bool antialiasing: Should OpenGL's anti-aliasing be enabled?
+        :param float fixed_update_rate: Length of the steps ``on_fixed_update``
+               is called with, in seconds. None to not call it at all.
         """
         if antialiasing:
             config = pyglet.gl.Config(major_version=3,
@@ -83,6 +88,15 @@ def __init__(self, width: int = 800, height: int = 600,
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
 
+        # Fixed updates. _fixed_update_time is the time left over after the
+        # last step, as of _fixed_update_clock.
+        self.fixed_update_rate: Optional[float] = None
+        self.max_fixed_updates = _MAX_FIXED_UPDATES
+        self._fixed_update_time = 0.0
+        self._fixed_update_clock = time.perf_counter()
+        if fixed_update_rate:
+            self.set_fixed_update_rate(fixed_update_rate)
+
         if update_rate:
             from pyglet import compat_platform
             if compat_platform == 'darwin' or compat_platform == 'linux':
@@ -137,6 +151,70 @@ def on_update(self, delta_time: float):
         except AttributeError:
             pass
 
+    def on_fixed_update(self, delta_time: float):
+        """
+        Move everything by one step of a fixed length. Physics engines and
+        particles behave the same however fast the game runs when they are
+        updated here.
+
+        Only called once :meth:`set_fixed_update_rate` was given a rate. If
+        frames take longer than a step, this is called several times before
+        the next ``on_update``, to catch up. Positions can be drawn part of
+        the way into the next step with :attr:`fixed_update_alpha`, see
+        :meth:`SpriteList.store_positions`.
+
+        :param float delta_time: Length of a step, in seconds.
+        """
+        if self.current_view is not None:
+            self.current_view.on_fixed_update(delta_time)
+
+    def set_fixed_update_rate(self, rate: Optional[float], max_updates: int = _MAX_FIXED_UPDATES):
+        """
+        Set how long the steps of ``on_fixed_update`` are.
+        For example, self.set_fixed_update_rate(1 / 120) runs the game logic
+        in steps of 1/120th of a second, however fast frames are drawn.
+
+        :param float rate: Length of a step in seconds, None to stop calling ``on_fixed_update``
+        :param int max_updates: Most steps to take at once. When the game
+               falls further behind than that, the time is dropped and the game
+               slows down, instead of spending ever more time catching up.
+        """
+        pyglet.clock.unschedule(self._run_fixed_updates)
+        self.fixed_update_rate = rate
+        self.max_fixed_updates = max_updates
+        self._fixed_update_time = 0.0
+        self._fixed_update_clock = time.perf_counter()
+        if rate:
+            pyglet.clock.schedule_interval(self._run_fixed_updates, rate)
+
+    def _run_fixed_updates(self, delta_time: float):
+        """ Call on_fixed_update for every whole step that passed since the last call. """
+        rate = self.fixed_update_rate
+        self._fixed_update_time += delta_time
+        updates = 0
+        while self._fixed_update_time >= rate:
+            if updates == self.max_fixed_updates:
+                # Too far behind, drop the steps we can't take
+                self._fixed_update_time %= rate
+                break
+            self.on_fixed_update(rate)
+            self._fixed_update_time -= rate
+            updates += 1
+        self._fixed_update_clock = time.perf_counter()
+
+    @property
+    def fixed_update_alpha(self) -> float:
+        """
+        How far the time not simulated yet is into the next fixed step, from 0 to 1.
+        Worked out from the clock when read, so in ``on_draw`` it matches the
+        moment the frame is drawn.
+        """
+        rate = self.fixed_update_rate
+        if not rate:
+            return 0.0
+        time_left = self._fixed_update_time + time.perf_counter() - self._fixed_update_clock
+        return min(max(time_left / rate, 0.0), 1.0)
+
     def set_update_rate(self, rate: float):
         """
         Set how often the screen should be updated.
@@ -574,6 +652,10 @@ def on_update(self, delta_time: float):
         """To be overridden"""
         pass
 
+    def on_fixed_update(self, delta_time: float):
+        """To be overridden, see :meth:`Window.on_fixed_update`"""
+        pass
+
     def on_draw(self):
         """Called when this view should draw"""
         try:
@@ -6,6 +6,8 @@
 
 from typing import List, Tuple, cast
 
+import numpy as np
+
 from arcade import Color
 from arcade import RGBA
 
@@ -116,86 +118,51 @@ def rotate_point(x: float, y: float, cx: float, cy: float,
     return [x, y]
 
 
-def calculate_points(image):
+def calculate_points(image, hit_box_algorithm: str = "Simple"):
     """
     Given an image, this returns points that make up a hit box around it. Attempts
     to trim out transparent pixels.
 
+    The "Simple" hit box is the smallest rectangle around the visible pixels,
+    with its corners cut off diagonally as far as they are transparent. The
+    "Hull" hit box is the convex hull of the visible pixels, which fits round
+    and slanted shapes more tightly, at the cost of more points. Use it with
+    :meth:`Sprite.set_hit_box`.
+
     :param Image image:
+    :param str hit_box_algorithm: "Simple" or "Hull"
 
     :Returns: List of points
 
     """
-    left_border = 0
-    good = True
-    while good and left_border < image.width:
-        for row in range(image.height):
-            pos = (left_border, row)
-            pixel = image.getpixel(pos)
-            if type(pixel) is int or len(pixel) != 4:
-                raise TypeError("Error, calculate_points called on image not in RGBA format")
-            else:
-                if pixel[3] != 0:
-                    good = False
-                    break
-        if good:
-            left_border += 1
-
-    right_border = image.width - 1
-    good = True
-    while good and right_border > 0:
-        for row in range(image.height):
-            pos = (right_border, row)
-            pixel = image.getpixel(pos)
-            if pixel[3] != 0:
-                good = False
-                break
-        if good:
-            right_border -= 1
-
-    top_border = 0
-    good = True
-    while good and top_border < image.height:
-        for column in range(image.width):
-            pos = (column, top_border)
-            pixel = image.getpixel(pos)
-            if pixel[3] != 0:
-                good = False
-                break
-        if good:
-            top_border += 1
-
-    bottom_border = image.height - 1
-    good = True
-    while good and bottom_border > 0:
-        for column in range(image.width):
-            pos = (column, bottom_border)
-            pixel = image.getpixel(pos)
-            if pixel[3] != 0:
-                good = False
-                break
-        if good:
-            bottom_border -= 1
+    if hit_box_algorithm not in ("Simple", "Hull"):
+        raise ValueError(f"Unknown hit box algorithm {hit_box_algorithm}, use 'Simple' or 'Hull'.")
 
-    def _check_corner_offset(start_x, start_y, x_direction, y_direction):
+    pixel = image.getpixel((0, 0))
+    if type(pixel) is int or len(pixel) != 4:
+        raise TypeError("Error, calculate_points called on image not in RGBA format")
 
-        bad = False
-        offset = 0
-        while not bad:
-            y = start_y + (offset * y_direction)
-            x = start_x
-            for count in range(offset + 1):
-                my_pixel = image.getpixel((x, y))
-                # print(f"({x}, {y}) = {pixel} | ", end="")
-                if my_pixel[3] != 0:
-                    bad = True
-                    break
-                y -= y_direction
-                x += x_direction
-            # print(f" - {bad}")
-            offset += 1
-        # print(f"offset: {offset}")
-        return offset
+    # Rows and columns of the pixels that aren't fully transparent
+    rows, columns = np.nonzero(np.asarray(image)[:, :, 3])
+    if len(rows) == 0:
+        raise ValueError("Error, calculate_points called on a fully transparent image")
+
+    h = image.height
+    w = image.width
+
+    if hit_box_algorithm == "Hull":
+        return _calculate_hull_points(rows, columns, h, w)
+
+    left_border = int(columns.min())
+    right_border = int(columns.max())
+    top_border = int(rows.min())
+    bottom_border = int(rows.max())
+
+    def _check_corner_offset(start_x, start_y, x_direction, y_direction):
+        # Diagonals out of a corner are scanned until one has a visible
+        # pixel on it. The n-th diagonal holds the pixels n steps away.
+        distances = (columns - start_x) * x_direction + (rows - start_y) * y_direction
+        return int(distances.min()) + 1
 
     def _r(point, height, width):
         return point[0] - width / 2, (height - point[1]) - height / 2
@@ -216,8 +183,6 @@ def _r(point, height, width):
 
     result = []
 
-    h = image.height
-    w = image.width
     result.append(_r(p1, h, w))
     if top_left_corner_offset:
         result.append(_r(p2, h, w))
@@ -238,3 +203,35 @@ def _r(point, height, width):
     result = list(dict.fromkeys(result))
 
     return result
+
+
+def _calculate_hull_points(rows, columns, height: int, width: int) -> List[Tuple[float, float]]:
+    """
+    Convex hull around visible pixels, given by their rows and columns.
+    The hull goes around the outer corners of the pixels, centered on the image.
+    """
+    # Only the outer corners of the first and last pixel of each row can be on the hull
+    row_starts = np.full(height, width)
+    row_ends = np.full(height, -1)
+    np.minimum.at(row_starts, rows, columns)
+    np.maximum.at(row_ends, rows, columns)
+    used = np.nonzero(row_ends >= 0)[0]
+    xs = np.concatenate((row_starts[used], row_starts[used], row_ends[used] + 1, row_ends[used] + 1))
+    ys = np.concatenate((used, used + 1, used, used + 1))
+    points = sorted(set(zip((xs - width / 2).tolist(), (height / 2 - ys).tolist())))
+
+    # Andrew's monotone chain, dropping points in line with their neighbours
+    def _half_hull(sorted_points):
+        hull = []
+        for point in sorted_points:
+            while len(hull) >= 2:
+                (x1, y1), (x2, y2) = hull[-2], hull[-1]
+                if (x2 - x1) * (point[1] - y1) - (y2 - y1) * (point[0] - x1) > 0:
+                    break
+                hull.pop()
+            hull.append(point)
+        return hull
+
+    lower = _half_hull(points)
+    upper = _half_hull(reversed(points))
+    return lower[:-1] + upper[:-1]
@@ -5,7 +5,7 @@
 
 import arcade
 from arcade.particle import Particle
-from typing import Callable, cast
+from typing import Callable, Optional, cast
 from arcade.utils import _Vec2
 from arcade.arcade_types import Point, Vector
 
@@ -148,17 +148,29 @@ def get_pos(self) -> Point:
         # TODO: should this be a property so a method call isn't needed?
         return self.center_x, self.center_y
 
-    def update(self):
-        # update emitter
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        self.angle += self.change_angle
+    def update(self, delta_time: Optional[float] = None):
+        """
+        Move the emitter, emit new particles and advance the ones it has.
+
+        :param float delta_time: Time the step lasts, in seconds, such as the
+               step length of ``on_fixed_update``. By default a step is 1/60th
+               of a second, and the particles are updated without being told.
+        """
+        # update emitter, its change in position and angle are per 1/60th of a second
+        steps = 1 if delta_time is None else delta_time * 60
+        self.center_x += self.change_x * steps
+        self.center_y += self.change_y * steps
+        self.angle += self.change_angle * steps
 
         # update particles
-        emit_count = self.rate_factory.how_many(1 / 60, len(self._particles))
+        emit_count = self.rate_factory.how_many(1 / 60 if delta_time is None else delta_time, len(self._particles))
         for _ in range(emit_count):
             self._emit()
-        self._particles.update()
+        if delta_time is None:
+            self._particles.update()
+        else:
+            for particle in self._particles:
+                particle.update(delta_time)
         particles_to_reap = [p for p in self._particles if cast(Particle, p).can_reap()]
         for dead_particle in particles_to_reap:
             dead_particle.kill()
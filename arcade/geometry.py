@@ -3,6 +3,13 @@
 """
 
 from typing import cast
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from arcade import Point
 from arcade import PointList
 
 _PRECISION = 2
@@ -54,6 +61,122 @@ def are_polygons_intersecting(poly_a: PointList,
     return True
 
 
+def pad_polygons(polygons: Sequence[PointList]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack polygons into one array, for :func:`are_polygons_intersecting_batch`.
+
+    Polygons with fewer points than the largest one are padded by repeating
+    their first point.
+
+    :param polygons: Polygons, each a list of points
+    :Returns: Array of shape (number of polygons, most points, 2) and an array
+              with the number of points of each polygon.
+    """
+    counts = np.fromiter((len(polygon) for polygon in polygons), dtype=np.intp, count=len(polygons))
+    if len(counts) == 0:
+        return np.empty((0, 0, 2)), counts
+
+    most_points = int(counts.max())
+    if counts.min() == most_points:
+        return np.array(polygons, dtype=np.float64).reshape(len(counts), most_points, 2), counts
+
+    padded = np.empty((len(counts), most_points, 2))
+    for i, polygon in enumerate(polygons):
+        padded[i, :len(polygon)] = polygon
+        padded[i, len(polygon):] = polygon[0]
+    return padded, counts
+
+
+def are_polygons_intersecting_batch(poly_a: PointList,
+                                    polygons: np.ndarray,
+                                    point_counts: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Check one polygon against many others at once. Gives the same answers
+    as calling :func:`are_polygons_intersecting` for every pair.
+
+    :param PointList poly_a: List of points that define the first polygon.
+    :param np.ndarray polygons: Polygons to check against, as returned by :func:`pad_polygons`.
+    :param np.ndarray point_counts: Number of points of each polygon. Leave out if none are padded.
+    :Returns: Array with True for each polygon that intersects the first one.
+    """
+    poly_a = np.asarray(poly_a, dtype=np.float64)
+    polygons = np.asarray(polygons, dtype=np.float64)
+    if len(polygons) == 0:
+        return np.zeros(0, dtype=bool)
+
+    # Edge normals of the first polygon, projected on by both sides
+    edges_a = np.roll(poly_a, -1, axis=0) - poly_a
+    normals_x = edges_a[:, 1]
+    normals_y = -edges_a[:, 0]
+    projected_a = normals_x[:, None] * poly_a[:, 0] + normals_y[:, None] * poly_a[:, 1]
+    min_a = projected_a.min(axis=1)
+    max_a = projected_a.max(axis=1)
+    projected_b = normals_x[None, :, None] * polygons[:, None, :, 0] + normals_y[None, :, None] * polygons[:, None, :, 1]
+    min_b = projected_b.min(axis=2)
+    max_b = projected_b.max(axis=2)
+    separated = ((max_a <= min_b) | (max_b <= min_a)).any(axis=1)
+
+    # Edge normals of the other polygons. The edges between padding points
+    # have no length and don't count.
+    edges_b = np.roll(polygons, -1, axis=1) - polygons
+    normals_x = edges_b[:, :, 1]
+    normals_y = -edges_b[:, :, 0]
+    projected_a = normals_x[:, :, None] * poly_a[:, 0] + normals_y[:, :, None] * poly_a[:, 1]
+    min_a = projected_a.min(axis=2)
+    max_a = projected_a.max(axis=2)
+    projected_b = normals_x[:, :, None] * polygons[:, None, :, 0] + normals_y[:, :, None] * polygons[:, None, :, 1]
+    min_b = projected_b.min(axis=2)
+    max_b = projected_b.max(axis=2)
+    separated_b = (max_a <= min_b) | (max_b <= min_a)
+    if point_counts is not None:
+        separated_b &= np.arange(polygons.shape[1]) < np.asarray(point_counts)[:, None]
+    separated |= separated_b.any(axis=1)
+
+    return ~separated
+
+
+def get_segment_polygon_intersection(start: Point, end: Point, polygon: PointList) -> Optional[float]:
+    """
+    Find where a line segment first touches a polygon, going from start to end.
+
+    :param Point start: Start of the segment
+    :param Point end: End of the segment
+    :param PointList polygon: List of points that define the polygon.
+    :Returns: How far along the segment the first hit is, from 0 at start to
+              1 at end. 0 if the segment starts inside the polygon. None if
+              the segment misses the polygon.
+    """
+    if is_point_in_polygon(start[0], start[1], polygon):
+        return 0.0
+
+    start_x, start_y = start
+    delta_x = end[0] - start_x
+    delta_y = end[1] - start_y
+
+    first_hit = None
+    point_count = len(polygon)
+    for i in range(point_count):
+        edge_start_x, edge_start_y = polygon[i]
+        edge_end_x, edge_end_y = polygon[(i + 1) % point_count]
+        edge_x = edge_end_x - edge_start_x
+        edge_y = edge_end_y - edge_start_y
+
+        denominator = delta_x * edge_y - delta_y * edge_x
+        if denominator == 0:
+            # Parallel to this edge. If it runs along the edge, it hits a neighbouring edge too.
+            continue
+
+        offset_x = edge_start_x - start_x
+        offset_y = edge_start_y - start_y
+        fraction = (offset_x * edge_y - offset_y * edge_x) / denominator
+        edge_fraction = (offset_x * delta_y - offset_y * delta_x) / denominator
+        if 0 <= fraction <= 1 and 0 <= edge_fraction <= 1:
+            if first_hit is None or fraction < first_hit:
+                first_hit = fraction
+
+    return first_hit
+
+
 def is_point_in_polygon(x, y, polygon_point_list):
     """
     Use ray-tracing to see if point is inside a polygon
@@ -41,9 +41,21 @@ def __init__(
         self.alpha = alpha
         self.mutation_callback = mutation_callback
 
-    def update(self):
-        """Advance the Particle's simulation"""
-        super().update()
+    def update(self, delta_time: float = 1 / 60):
+        """
+        Advance the Particle's simulation
+
+        :param float delta_time: Time the step lasts, in seconds. The change
+               in position and angle is how much the particle moves in 1/60th of a second.
+        """
+        # Sprite.update() moves by one 1/60th of a second worth of change
+        change = self.change_x, self.change_y, self.change_angle
+        steps = delta_time * 60
+        self.change_x, self.change_y, self.change_angle = (value * steps for value in change)
+        try:
+            super().update()
+        finally:
+            self.change_x, self.change_y, self.change_angle = change
         if self.mutation_callback:
             self.mutation_callback(self)
 
@@ -97,10 +109,14 @@ def __init__(
         self.lifetime_original = lifetime
         self.lifetime_elapsed = 0.0
 
-    def update(self):
-        """Advance the Particle's simulation"""
-        super().update()
-        self.lifetime_elapsed += 1 / 60
+    def update(self, delta_time: float = 1 / 60):
+        """
+        Advance the Particle's simulation
+
+        :param float delta_time: Time the step lasts, in seconds
+        """
+        super().update(delta_time)
+        self.lifetime_elapsed += delta_time
 
     def can_reap(self):
         """Determine if Particle can be deleted"""
@@ -135,9 +151,13 @@ def __init__(
         self.start_alpha = start_alpha
         self.end_alpha = end_alpha
 
-    def update(self):
-        """Advance the Particle's simulation"""
-        super().update()
+    def update(self, delta_time: float = 1 / 60):
+        """
+        Advance the Particle's simulation
+
+        :param float delta_time: Time the step lasts, in seconds
+        """
+        super().update(delta_time)
         a = arcade.utils.lerp(self.start_alpha,
                               self.end_alpha,
                               self.lifetime_elapsed / self.lifetime_original)
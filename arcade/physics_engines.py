@@ -3,10 +3,23 @@
 """
 # pylint: disable=too-many-arguments, too-many-locals, too-few-public-methods
 
+import math
+import weakref
+
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from arcade import check_for_collision_between_lists
 from arcade import check_for_collision_with_list
 from arcade import check_for_collision
 from arcade import Sprite
 from arcade import SpriteList
+from arcade.sprite_list import _get_rect_overlap
+
+# Times overlapping moving sprites are pushed apart and checked again
+_BODY_SEPARATION_PASSES = 4
 
 
 def _circular_check(player, walls):
@@ -41,37 +54,208 @@ def _circular_check(player, walls):
                 return
         vary *= 2
 
+
+def _get_penetration(moving_sprite: Sprite, wall: Sprite, axis: int, direction: int) -> float:
+    """
+    How far a sprite has to move along an axis to get clear of a wall.
+
+    :param Sprite moving_sprite: Sprite to move
+    :param Sprite wall: Wall it overlaps
+    :param int axis: 0 to move along x, 1 to move along y
+    :param int direction: 1 to move right or up, -1 to move left or down
+    """
+    if axis == 0:
+        if direction > 0:
+            return wall.right - moving_sprite.left
+        return moving_sprite.right - wall.left
+    if direction > 0:
+        return wall.top - moving_sprite.bottom
+    return moving_sprite.top - wall.bottom
+
+
+def _get_distance_out(moving_sprite: Sprite, wall: Sprite, axis: int, direction: int) -> float:
+    """
+    How far a sprite has to move along an axis to get clear of a wall, for
+    hit boxes of any shape. Convex polygons are separated along the axes of
+    their edges, the same ones collisions are checked with.
+
+    :param Sprite moving_sprite: Sprite to move
+    :param Sprite wall: Wall it overlaps
+    :param int axis: 0 to move along x, 1 to move along y
+    :param int direction: 1 to move right or up, -1 to move left or down
+    """
+    if _get_rect_overlap(moving_sprite, wall) is not None:
+        return _get_penetration(moving_sprite, wall, axis, direction)
+
+    points_a = np.array(moving_sprite.get_adjusted_hit_box(), dtype=np.float64)
+    points_b = np.array(wall.get_adjusted_hit_box(), dtype=np.float64)
+    normals = []
+    for points in (points_a, points_b):
+        edges = np.roll(points, -1, axis=0) - points
+        normals.append(np.stack((edges[:, 1], -edges[:, 0]), axis=1))
+    normals = np.concatenate(normals)
+
+    # Moving by t changes every projection on a normal by t * speed. The
+    # sprite is clear once the projections stop overlapping on any normal.
+    speeds = normals[:, axis] * direction
+    moving = speeds != 0
+    normals, speeds = normals[moving], speeds[moving]
+    projected_a = points_a @ normals.T
+    projected_b = points_b @ normals.T
+    distances = np.where(speeds > 0,
+                         projected_b.max(axis=0) - projected_a.min(axis=0),
+                         projected_b.min(axis=0) - projected_a.max(axis=0)) / speeds
+    return float(distances.min())
+
+
+def _get_steps_out(moving_sprite: Sprite, hit_list, axis: int, direction: int, step: float) -> int:
+    """
+    Count the steps along an axis it takes the sprite to get clear of all the
+    walls it hits. Ending up right against a wall counts as clear.
+    """
+    distance = max((_get_distance_out(moving_sprite, wall, axis, direction) for wall in hit_list), default=0.0)
+    return max(math.ceil(distance / step), 0)
+
+
+def _step_sprite(moving_sprite: Sprite, axis: int, step: float, steps: int):
+    """ Move a sprite a number of steps along an axis. """
+    if axis == 0:
+        moving_sprite.center_x += step * steps
+    else:
+        moving_sprite.center_y += step * steps
+
+
+def _push_out(moving_sprite: Sprite, walls: SpriteList, hit_list) -> bool:
+    """
+    Move a sprite the shortest way out of the walls it overlaps, up, down,
+    right or left. Only works when all the hit boxes are rectangles lined
+    up with the axes.
+
+    :returns: True if the sprite is free, False if it was left where it was.
+    """
+    pushes = []
+    for axis, direction in ((1, 1), (1, -1), (0, 1), (0, -1)):
+        distance = 0.0
+        for wall in hit_list:
+            overlap = _get_rect_overlap(moving_sprite, wall)
+            if overlap is None or overlap[0] <= 0 or overlap[1] <= 0:
+                return False
+            distance = max(distance, _get_penetration(moving_sprite, wall, axis, direction))
+        pushes.append((distance, axis, direction))
+
+    original_x, original_y = moving_sprite.position
+    # Sorting is stable, so ties keep the order the kludge tries them in
+    for distance, axis, direction in sorted(pushes, key=lambda push: push[0]):
+        if axis == 0:
+            moving_sprite.center_x = original_x + distance * direction
+        else:
+            moving_sprite.center_y = original_y + distance * direction
+        if len(check_for_collision_with_list(moving_sprite, walls)) == 0:
+            return True
+        moving_sprite.position = original_x, original_y
+    return False
+
+
+def _get_wall_passed_through(moving_sprite: Sprite, walls: SpriteList, axis: int, distance: float):
+    """
+    Sweep a sprite along an axis, and see if the move would carry it right
+    through a wall without ending up inside it. That happens to fast sprites,
+    moving further in one update than their own size.
+
+    The sprites are swept by the boxes around their hit boxes, so walls of
+    any shape are found. A sprite stopped by one ends up against its box.
+
+    :returns: ``(wall, distance to the wall)`` for the first wall in the way,
+              or None if moving the whole distance is safe to resolve afterwards.
+    """
+    if distance == 0:
+        return None
+
+    left, bottom, right, top = moving_sprite.left, moving_sprite.bottom, moving_sprite.right, moving_sprite.top
+    size = right - left if axis == 0 else top - bottom
+    if abs(distance) <= size:
+        # Nothing can be jumped over without overlapping it at the end
+        return None
+
+    # Box covering the whole move
+    if axis == 0:
+        sweep = min(left, left + distance), bottom, max(right, right + distance), top
+    else:
+        sweep = left, min(bottom, bottom + distance), right, max(top, top + distance)
+
+    if walls.use_spatial_hash:
+        candidates = walls.spatial_hash.get_objects_for_rect(*sweep)
+    else:
+        candidates = walls
+
+    direction = 1 if distance > 0 else -1
+    first_wall = None
+    first_gap = None
+    for wall in candidates:
+        if wall is moving_sprite:
+            continue
+        if axis == 0:
+            overlap = min(top, wall.top) - max(bottom, wall.bottom)
+        else:
+            overlap = min(right, wall.right) - max(left, wall.left)
+        if overlap <= 0:
+            # Not in the way
+            continue
+        gap = -_get_penetration(moving_sprite, wall, axis, -direction)
+        if 0 <= gap < abs(distance) and (first_gap is None or gap < first_gap):
+            first_wall = wall
+            first_gap = gap
+
+    if first_wall is None:
+        return None
+
+    wall_size = first_wall.right - first_wall.left if axis == 0 else first_wall.top - first_wall.bottom
+    if abs(distance) - first_gap < size + wall_size:
+        # The sprite ends up inside the wall, the usual resolution deals with that
+        return None
+    return first_wall, first_gap
+
+
 def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
     # Rotate
     moving_sprite.angle += moving_sprite.change_angle
 
     hit_list = check_for_collision_with_list(moving_sprite, walls)
 
-    if len(hit_list) > 0:
+    if len(hit_list) > 0 and not _push_out(moving_sprite, walls, hit_list):
         # Resolve any collisions by this weird kludge
         _circular_check(moving_sprite, walls)
 
     # --- Move in the y direction
-    moving_sprite.center_y += moving_sprite.change_y
+    passed_wall = _get_wall_passed_through(moving_sprite, walls, 1, moving_sprite.change_y)
+    if passed_wall is None:
+        moving_sprite.center_y += moving_sprite.change_y
+    else:
+        # Stop against the wall instead of going through it
+        gap = passed_wall[1]
+        moving_sprite.center_y += gap if moving_sprite.change_y > 0 else -gap
 
     # Check for wall hit
     hit_list_x = check_for_collision_with_list(moving_sprite, walls)
+    if passed_wall is not None and passed_wall[0] not in hit_list_x:
+        hit_list_x.append(passed_wall[0])
     # print(f"Post-y move {hit_list_x}")
     complete_hit_list = hit_list_x
 
-    # If we hit a wall, move so the edges are at the same point
+    # If we hit a wall, move so the edges are at the same point. Walls still
+    # overlapped after that are pushed out of at the start of the next update.
     if len(hit_list_x) > 0:
         if moving_sprite.change_y > 0:
-            while len(check_for_collision_with_list(moving_sprite, walls)) > 0:
-                moving_sprite.center_y -= 1
+            check_hit_list = check_for_collision_with_list(moving_sprite, walls)
+            _step_sprite(moving_sprite, 1, -1, _get_steps_out(moving_sprite, check_hit_list, 1, -1, 1))
             # print(f"Spot X ({self.player_sprite.center_x}, {self.player_sprite.center_y})"
             #       f" {self.player_sprite.change_y}")
         elif moving_sprite.change_y < 0:
             # Reset number of jumps
             for item in hit_list_x:
-                while check_for_collision(moving_sprite, item):
-                    # self.player_sprite.bottom = item.top <- Doesn't work for ramps
-                    moving_sprite.center_y += 0.25
+                # self.player_sprite.bottom = item.top <- Doesn't work for ramps
+                if check_for_collision(moving_sprite, item):
+                    _step_sprite(moving_sprite, 1, 0.25, _get_steps_out(moving_sprite, [item], 1, 1, 0.25))
 
                 if item.change_x != 0:
                     moving_sprite.center_x += item.change_x
@@ -94,7 +278,14 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
     # print(f"Spot Q ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
 
     # --- Move in the x direction
-    moving_sprite.center_x += moving_sprite.change_x
+    passed_wall = _get_wall_passed_through(moving_sprite, walls, 0, moving_sprite.change_x)
+    if passed_wall is None:
+        moving_sprite.center_x += moving_sprite.change_x
+    else:
+        wall, gap = passed_wall
+        moving_sprite.center_x += gap if moving_sprite.change_x > 0 else -gap
+        if wall not in hit_list_x:
+            hit_list_x.append(wall)
 
     check_again = True
     while check_again:
@@ -116,10 +307,14 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
                         # print(f"Spot 1 ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
                         # See if we can "run up" a ramp
                         moving_sprite.center_y += change_x
-                        if len(check_for_collision_with_list(moving_sprite, walls)) > 0:
+                        ramp_hit_list = check_for_collision_with_list(moving_sprite, walls)
+                        if len(ramp_hit_list) > 0:
                             # No, ramp run-up doesn't work.
+                            # Back off until we are clear, or can run up the ramp.
+                            ramp_steps = _get_steps_out(moving_sprite, ramp_hit_list, 0, -1, 1)
                             moving_sprite.center_y -= change_x
-                            moving_sprite.center_x -= 1
+                            steps = min(ramp_steps, _get_steps_out(moving_sprite, hit_list_y, 0, -1, 1))
+                            _step_sprite(moving_sprite, 0, -1, max(steps, 1))
                             # print(f"Spot R ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
                             check_again = True
                             break
@@ -127,8 +322,7 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
                         # print("Run up ok 1")
                         # print(f"Spot 2 ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
                 else:
-                    while len(check_for_collision_with_list(moving_sprite, walls)) > 0:
-                        moving_sprite.center_x -= 1
+                    _step_sprite(moving_sprite, 0, -1, _get_steps_out(moving_sprite, hit_list_y, 0, -1, 1))
 
             elif change_x < 0:
                 if ramp_up:
@@ -145,8 +339,7 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
                             break
                         # print(f"Spot 4 ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
                 else:
-                    while len(check_for_collision_with_list(moving_sprite, walls)) > 0:
-                        moving_sprite.center_x += 1
+                    _step_sprite(moving_sprite, 0, 1, _get_steps_out(moving_sprite, hit_list_y, 0, 1, 1))
 
             else:
                 print("Error, x collision while player wasn't moving.\n"
@@ -157,6 +350,195 @@ def _move_sprite(moving_sprite: Sprite, walls: SpriteList, ramp_up: bool):
     return complete_hit_list
 
 
+def _move_platforms(platforms: SpriteList, bodies):
+    """
+    Move the platforms that have a speed, turning them around at their
+    boundaries. Sprites a platform runs into sideways are pushed along.
+
+    :param SpriteList platforms: Platforms to move
+    :param bodies: The moving sprite, or a SpriteList of them
+    """
+    for platform in platforms:
+        if platform.change_x != 0 or platform.change_y != 0:
+            platform.center_x += platform.change_x
+
+            if platform.boundary_left is not None \
+                    and platform.left <= platform.boundary_left:
+                platform.left = platform.boundary_left
+                if platform.change_x < 0:
+                    platform.change_x *= -1
+
+            if platform.boundary_right is not None \
+                    and platform.right >= platform.boundary_right:
+                platform.right = platform.boundary_right
+                if platform.change_x > 0:
+                    platform.change_x *= -1
+
+            # Push along whatever the platform runs into
+            if isinstance(bodies, SpriteList):
+                pushed = check_for_collision_with_list(platform, bodies)
+            elif check_for_collision(bodies, platform):
+                pushed = [bodies]
+            else:
+                pushed = []
+            for body in pushed:
+                if platform.change_x < 0:
+                    body.right = platform.left
+                if platform.change_x > 0:
+                    body.left = platform.right
+
+            platform.center_y += platform.change_y
+
+            if platform.boundary_top is not None \
+                    and platform.top >= platform.boundary_top:
+                platform.top = platform.boundary_top
+                if platform.change_y > 0:
+                    platform.change_y *= -1
+
+            if platform.boundary_bottom is not None \
+                    and platform.bottom <= platform.boundary_bottom:
+                platform.bottom = platform.boundary_bottom
+                if platform.change_y < 0:
+                    platform.change_y *= -1
+
+
+def _get_bounds(sprites) -> np.ndarray:
+    """ Edges of the hit boxes of sprites, one ``(left, bottom, right, top)`` row each. """
+    return np.array([(sprite.left, sprite.bottom, sprite.right, sprite.top) for sprite in sprites],
+                    dtype=np.float64).reshape(-1, 4)
+
+
+def _move_bodies(bodies: SpriteList, walls: SpriteList, ramp_up: bool) -> List[Tuple[Sprite, Sprite]]:
+    """
+    Move every sprite of a list the way :func:`_move_sprite` moves one.
+
+    All the sprites are first checked against the walls in one pass, with the
+    box each one sweeps through during this update. A sprite that can't reach
+    a wall is simply moved, only the others get their collisions resolved.
+
+    :returns: ``(body, wall)`` pairs for every wall a body hit.
+    """
+    hits = []
+    if len(bodies) == 0:
+        return hits
+
+    # Boxes covering where each body starts and ends up
+    change = np.array([(body.change_x, body.change_y) for body in bodies], dtype=np.float64)
+    swept = _get_bounds(bodies)
+    swept[:, :2] += np.minimum(change, 0.0)
+    swept[:, 2:] += np.maximum(change, 0.0)
+
+    if walls.use_spatial_hash:
+        wall_bounds = None
+    else:
+        wall_bounds = _get_bounds(walls)
+
+    for body, (left, bottom, right, top) in zip(bodies, swept.tolist()):
+        if body.change_angle == 0:
+            if wall_bounds is not None:
+                near = ((wall_bounds[:, 0] <= right) & (wall_bounds[:, 2] >= left)
+                        & (wall_bounds[:, 1] <= top) & (wall_bounds[:, 3] >= bottom)).any()
+            else:
+                near = any(wall.left <= right and wall.right >= left and wall.bottom <= top and wall.top >= bottom
+                           for wall in walls.spatial_hash.get_objects_for_rect(left, bottom, right, top)
+                           if wall is not body)
+            if not near:
+                # Same steps _move_sprite takes when nothing is hit
+                body.center_y = round(body.center_y + body.change_y, 2)
+                body.center_x += body.change_x
+                continue
+
+        for wall in _move_sprite(body, walls, ramp_up):
+            hits.append((body, wall))
+    return hits
+
+
+def _separate_bodies(bodies: SpriteList, walls: SpriteList) -> List[Tuple[Sprite, Sprite]]:
+    """
+    Push apart the sprites of a list that overlap each other.
+
+    Two sprites are moved apart along the axis they overlap the least on.
+    Side by side, each goes half the way. A sprite landing on top of another
+    one is moved up the whole way and stops falling, like it does on a platform.
+    When a push would move a sprite into a wall, the other sprite goes the
+    whole way instead.
+
+    Contacts are resolved from the lowest up, so stacks settle in one go.
+    Pushing sprites apart can make them overlap others, which is checked
+    again, up to ``_BODY_SEPARATION_PASSES`` times.
+
+    :returns: ``(body, other body)`` pairs for every contact, listed both ways.
+    """
+    contacts = []
+    touching = set()
+    order = {body: i for i, body in enumerate(bodies)}
+    for _ in range(_BODY_SEPARATION_PASSES):
+        pairs = [(body_1, body_2)
+                 for body_1, body_2 in check_for_collision_between_lists(bodies, bodies)
+                 if order[body_1] < order[body_2]]
+        if not pairs:
+            break
+        pairs.sort(key=lambda pair: min(pair[0].bottom, pair[1].bottom))
+
+        for body_1, body_2 in pairs:
+            # An earlier push may have moved them apart already
+            if not check_for_collision(body_1, body_2):
+                continue
+            if (body_1, body_2) not in touching:
+                touching.add((body_1, body_2))
+                contacts.append((body_1, body_2))
+                contacts.append((body_2, body_1))
+
+            overlap_x = min(body_1.right, body_2.right) - max(body_1.left, body_2.left)
+            overlap_y = min(body_1.top, body_2.top) - max(body_1.bottom, body_2.bottom)
+            if overlap_x < overlap_y:
+                # Side by side, share the push
+                if body_1.center_x < body_2.center_x:
+                    body_1, body_2 = body_2, body_1
+                _push_apart(body_1, body_2, 0, overlap_x, 0.5, walls)
+            else:
+                upper, lower = (body_1, body_2) if body_1.center_y >= body_2.center_y else (body_2, body_1)
+                _push_apart(upper, lower, 1, overlap_y, 1.0, walls)
+                if upper.change_y < lower.change_y:
+                    upper.change_y = min(0.0, lower.change_y)
+    return contacts
+
+
+def _push_apart(body_1: Sprite, body_2: Sprite, axis: int, distance: float, share: float, walls: SpriteList):
+    """
+    Move two sprites apart along an axis, body_1 up or right by its share of
+    the distance and body_2 the other way by the rest. A sprite that would end
+    up in a wall stays, and the other one goes the whole distance if it can.
+    """
+    start_1 = body_1.position
+    start_2 = body_2.position
+    _shift_sprite(body_1, axis, distance * share)
+    _shift_sprite(body_2, axis, -distance * (1 - share))
+    blocked_1 = share > 0 and len(check_for_collision_with_list(body_1, walls)) > 0
+    blocked_2 = share < 1 and len(check_for_collision_with_list(body_2, walls)) > 0
+    if not (blocked_1 or blocked_2):
+        return
+
+    body_1.position = start_1
+    body_2.position = start_2
+    if not blocked_1:
+        _shift_sprite(body_1, axis, distance)
+        if len(check_for_collision_with_list(body_1, walls)) > 0:
+            body_1.position = start_1
+    elif not blocked_2:
+        _shift_sprite(body_2, axis, -distance)
+        if len(check_for_collision_with_list(body_2, walls)) > 0:
+            body_2.position = start_2
+
+
+def _shift_sprite(sprite: Sprite, axis: int, distance: float):
+    """ Move a sprite along the x (0) or y (1) axis. """
+    if axis == 0:
+        sprite.center_x += distance
+    else:
+        sprite.center_y += distance
+
+
 class PhysicsEngineSimple:
     """
     Simplistic physics engine for use in games without gravity, such as top-down
@@ -309,42 +691,191 @@ def update(self):
 
         complete_hit_list = _move_sprite(self.player_sprite, self.platforms, ramp_up=True)
 
-        for platform in self.platforms:
-            if platform.change_x != 0 or platform.change_y != 0:
-                platform.center_x += platform.change_x
-
-                if platform.boundary_left is not None \
-                        and platform.left <= platform.boundary_left:
-                    platform.left = platform.boundary_left
-                    if platform.change_x < 0:
-                        platform.change_x *= -1
-
-                if platform.boundary_right is not None \
-                        and platform.right >= platform.boundary_right:
-                    platform.right = platform.boundary_right
-                    if platform.change_x > 0:
-                        platform.change_x *= -1
-
-                if check_for_collision(self.player_sprite, platform):
-                    if platform.change_x < 0:
-                        self.player_sprite.right = platform.left
-                    if platform.change_x > 0:
-                        self.player_sprite.left = platform.right
-
-                platform.center_y += platform.change_y
-
-                if platform.boundary_top is not None \
-                        and platform.top >= platform.boundary_top:
-                    platform.top = platform.boundary_top
-                    if platform.change_y > 0:
-                        platform.change_y *= -1
-
-                if platform.boundary_bottom is not None \
-                        and platform.bottom <= platform.boundary_bottom:
-                    platform.bottom = platform.boundary_bottom
-                    if platform.change_y < 0:
-                        platform.change_y *= -1
+        _move_platforms(self.platforms, self.player_sprite)
 
         # print(f"Spot Z ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
         # Return list of encountered sprites
         return complete_hit_list
+
+
+class PhysicsEngineSimpleMulti:
+    """
+    Simple physics engine moving a whole list of sprites, such as the
+    enemies of a top-down game. Each sprite moves like the player sprite of
+    :class:`PhysicsEngineSimple`, but the walls are checked for all of them
+    in one pass and the sprites don't walk through each other.
+    """
+
+    def __init__(self, bodies: SpriteList, walls: SpriteList, collide_bodies: bool = True):
+        """
+        Create a simple physics engine for many sprites.
+
+        :param SpriteList bodies: The moving sprites
+        :param SpriteList walls: The sprites they can't move through
+        :param bool collide_bodies: Keep the moving sprites from overlapping each other
+        """
+        if not isinstance(bodies, SpriteList):
+            raise TypeError("First parameter should be a SpriteList of moving sprites")
+        if not isinstance(walls, SpriteList):
+            raise TypeError("Second parameter should be a SpriteList of walls")
+
+        self.bodies = bodies
+        self.walls = walls
+        self.collide_bodies = collide_bodies
+
+    def update(self) -> List[Tuple[Sprite, Sprite]]:
+        """
+        Move everything and resolve collisions.
+
+        :Returns: ``(body, sprite)`` pairs for every wall or other body a
+                  moving sprite touched. Empty list if none.
+        """
+        hits = _move_bodies(self.bodies, self.walls, ramp_up=False)
+        if self.collide_bodies:
+            hits.extend(_separate_bodies(self.bodies, self.walls))
+        return hits
+
+
+class PhysicsEnginePlatformerMulti:
+    """
+    Platformer physics engine moving a whole list of sprites, such as
+    all the enemies of a level. Each sprite moves like the player sprite of
+    :class:`PhysicsEnginePlatformer`, with ladders, ramps and jump counters
+    kept per sprite. The platforms and ladders are checked for all the sprites
+    in one pass, moving platforms are moved once, and the sprites can stand
+    on each other.
+    """
+
+    def __init__(self,
+                 bodies: SpriteList,
+                 platforms: SpriteList,
+                 gravity_constant: float = 0.5,
+                 ladders: SpriteList = None,
+                 collide_bodies: bool = True,
+                 ):
+        """
+        Create a platformer physics engine for many sprites.
+
+        :param SpriteList bodies: The moving sprites
+        :param SpriteList platforms: The sprites they can't move through
+        :param float gravity_constant: Downward acceleration per frame
+        :param SpriteList ladders: Ladders the sprites can climb on
+        :param bool collide_bodies: Keep the moving sprites from overlapping each other
+        """
+        if not isinstance(bodies, SpriteList):
+            raise TypeError("First parameter should be a SpriteList of moving sprites")
+        if not isinstance(platforms, SpriteList):
+            raise TypeError("Second parameter should be a SpriteList of platforms")
+        if ladders is not None and not isinstance(ladders, SpriteList):
+            raise TypeError("Fourth parameter should be a SpriteList of ladders")
+
+        self.bodies = bodies
+        self.platforms = platforms
+        self.gravity_constant = gravity_constant
+        self.ladders = ladders
+        self.collide_bodies = collide_bodies
+        self.allowed_jumps = 1
+        self.allow_multi_jump = False
+        # Jumps of each sprite since it was last on the ground
+        self.jumps_since_ground = weakref.WeakKeyDictionary()
+
+    def is_on_ladder(self, body: Sprite) -> bool:
+        """
+        Check if a sprite is touching a ladder.
+
+        :param Sprite body: Sprite to check
+        :rtype: bool
+        """
+        if self.ladders:
+            hit_list = check_for_collision_with_list(body, self.ladders)
+            if len(hit_list) > 0:
+                return True
+        return False
+
+    def can_jump(self, body: Sprite, y_distance=5) -> bool:
+        """
+        Check if there is a floor under a sprite, which can be a platform
+        or another moving sprite. If there is, the sprite can jump.
+
+        :param Sprite body: Sprite that wants to jump
+        :param float y_distance: How far below the sprite to look for a floor
+
+        :returns: True if the sprite can jump
+        :rtype: bool
+        """
+        body.center_y -= y_distance
+        on_ground = len(check_for_collision_with_list(body, self.platforms)) > 0
+        if not on_ground and self.collide_bodies:
+            on_ground = len(check_for_collision_with_list(body, self.bodies)) > 0
+        body.center_y += y_distance
+
+        if on_ground:
+            self.jumps_since_ground[body] = 0
+
+        return on_ground or self.allow_multi_jump and self.jumps_since_ground.get(body, 0) < self.allowed_jumps
+
+    def enable_multi_jump(self, allowed_jumps: int):
+        """
+        Enables multi-jump for all the sprites.
+        allowed_jumps should include the initial jump.
+        (1 allows only a single jump, 2 enables double-jump, etc)
+
+        If you enable multi-jump, you MUST call increment_jump_counter()
+        every time a sprite jumps. Otherwise it can jump infinitely.
+
+        :param int allowed_jumps:
+        """
+        self.allowed_jumps = allowed_jumps
+        self.allow_multi_jump = True
+
+    def disable_multi_jump(self):
+        """
+        Disables multi-jump.
+
+        Calling this function also removes the requirement to
+        call increment_jump_counter() every time a sprite jumps.
+        """
+        self.allow_multi_jump = False
+        self.allowed_jumps = 1
+        self.jumps_since_ground.clear()
+
+    def jump(self, body: Sprite, velocity: int):
+        """
+        Make a sprite jump.
+
+        :param Sprite body: Sprite to jump
+        :param int velocity: Upward speed to give it
+        """
+        body.change_y = velocity
+        self.increment_jump_counter(body)
+
+    def increment_jump_counter(self, body: Sprite):
+        """
+        Updates the jump counter of a sprite for multi-jump tracking
+
+        :param Sprite body: Sprite that jumped
+        """
+        if self.allow_multi_jump:
+            self.jumps_since_ground[body] = self.jumps_since_ground.get(body, 0) + 1
+
+    def update(self) -> List[Tuple[Sprite, Sprite]]:
+        """
+        Move everything and resolve collisions.
+
+        :Returns: ``(body, sprite)`` pairs for every platform or other body a
+                  moving sprite touched. Empty list if none.
+        """
+        # --- Add gravity to the sprites that aren't on a ladder
+        on_ladder = set()
+        if self.ladders:
+            on_ladder = {body for body, _ in check_for_collision_between_lists(self.bodies, self.ladders)}
+        for body in self.bodies:
+            if body not in on_ladder:
+                body.change_y -= self.gravity_constant
+
+        hits = _move_bodies(self.bodies, self.platforms, ramp_up=True)
+        if self.collide_bodies:
+            hits.extend(_separate_bodies(self.bodies, self.platforms))
+
+        _move_platforms(self.platforms, self.bodies)
+        return hits
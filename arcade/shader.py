@@ -301,7 +301,17 @@ def release(buffer_id):
             gl.glDeleteBuffers(1, byref(buffer_id))
             buffer_id.value = 0
 
-    def write(self, data: bytes, offset: int = 0):
+    def write(self, data, offset: int = 0):
+        """Write data into the buffer.
+
+        :param data: Bytes, or any contiguous object supporting the buffer
+                     protocol, such as a NumPy array. The latter is passed
+                     to OpenGL without being copied.
+        :param int offset: Byte offset in the buffer to start writing at
+        """
+        if not isinstance(data, bytes):
+            view = memoryview(data).cast('B')
+            data = (c_char * view.nbytes).from_buffer(view)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.buffer_id)
         gl.glBufferSubData(gl.GL_ARRAY_BUFFER, gl.GLintptr(offset), len(data), data)
         # print(f"Writing data:\n{data[:60]}")
@@ -540,6 +550,28 @@ def use(self, texture_unit: int = 0):
         gl.glActiveTexture(gl.GL_TEXTURE0 + texture_unit)
         gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
 
+    def write(self, data: bytes, x: int = 0, y: int = 0, width: int = None, height: int = None):
+        """Write pixel data into a region of the texture.
+
+        :param bytes data: Pixel data in the format of the texture
+        :param int x: Left edge of the region
+        :param int y: First row of the region
+        :param int width: Width of the region. Defaults to the texture width.
+        :param int height: Height of the region. Defaults to the texture height.
+        """
+        if width is None:
+            width = self.width
+        if height is None:
+            height = self.height
+
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        gl.glTexSubImage2D(
+            gl.GL_TEXTURE_2D, 0, x, y, width, height,
+            self.format, gl.GL_UNSIGNED_BYTE, data
+        )
+
 
 def texture(size: Tuple[int, int], component: int, data) -> Texture:
     return Texture(size, component, data)
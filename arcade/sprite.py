@@ -21,11 +21,11 @@
 from typing import cast
 
 import PIL.Image
+import numpy as np
 
 from arcade import load_texture
 from arcade import Texture
 from arcade import Matrix3x3
-from arcade import rotate_point
 from arcade import draw_polygon_outline
 from arcade import Color
 from arcade.color import BLACK
@@ -183,6 +183,9 @@ def __init__(self,
             self._points = self._texture.hit_box_points
 
         self._point_list_cache: Optional[List[List[float]]] = None
+        self._local_hit_box_cache: Optional[np.ndarray] = None
+        self._local_hit_box_bounds = (0.0, 0.0, 0.0, 0.0)
+        self._local_hit_box_is_rect = False
 
         self.force = [0, 0]
         self.guid: Optional[str] = None
@@ -251,6 +254,7 @@ def set_points(self, points: List[List[float]]):
         warn('set_points has been deprecated. Use set_hit_box instead.', DeprecationWarning)
 
         self._points = points
+        self._clear_hit_box_cache()
 
     def get_points(self) -> List[List[float]]:
         """
@@ -271,6 +275,7 @@ def set_hit_box(self, points: List[List[float]]):
         Points will be scaled with get_adjusted_hit_box.
         """
         self._points = points
+        self._clear_hit_box_cache()
 
     def get_hit_box(self) -> Optional[List[List[float]]]:
         """
@@ -290,6 +295,22 @@ def get_adjusted_hit_box(self) -> List[List[float]]:
         if self._point_list_cache is not None:
             return self._point_list_cache
 
+        # Offset the scaled and rotated points
+        self._point_list_cache = (self._get_local_hit_box() + self._position).tolist()
+
+        return self._point_list_cache
+
+    def _get_local_hit_box(self) -> np.ndarray:
+        """
+        Get the points of the hit box scaled and rotated, but relative to the
+        center of the sprite, as an array of shape (n, 2).
+
+        This is kept when the sprite moves, so only changes to the scale,
+        angle or hit box make it be calculated again.
+        """
+        if self._local_hit_box_cache is not None:
+            return self._local_hit_box_cache
+
         # If there is no hitbox, use the width/height to get one
         if self._points is None and self._texture:
             self._points = self._texture.hit_box_points
@@ -310,33 +331,39 @@ def get_adjusted_hit_box(self) -> List[List[float]]:
                              "Sprite.texture is set to a texture before trying to draw or do collision testing.\n"
                              "Alternatively, manually call Sprite.set_hit_box with points for your hitbox.")
 
-        # Adjust the hitbox
-        point_list = []
-        for point in self._points:
-            # Get a copy of the point
-            point = [point[0], point[1]]
-
-            # Scale the point
-            if self.scale != 1:
-                point[0] *= self.scale
-                point[1] *= self.scale
-
-            # Rotate the point
-            if self.angle:
-                point = rotate_point(point[0], point[1], 0, 0, self.angle)
-
-            # Offset the point
-            point = [point[0] + self.center_x,
-                     point[1] + self.center_y]
-            point_list.append(point)
-
-        # Cache the results
-        self._point_list_cache = point_list
-
-        # if self.texture:
-        #     print(self.texture.name, self._point_list_cache)
-
-        return self._point_list_cache
+        # Scale the points
+        points = [[point[0], point[1]] for point in self._points]
+        if self.scale != 1:
+            points = [[x * self.scale, y * self.scale] for x, y in points]
+
+        # Rotate the points, rounded the same way as rotate_point
+        if self.angle:
+            angle_radians = math.radians(self.angle)
+            cos_angle = math.cos(angle_radians)
+            sin_angle = math.sin(angle_radians)
+            points = [[round(x * cos_angle - y * sin_angle, 2),
+                       round(x * sin_angle + y * cos_angle, 2)]
+                      for x, y in points]
+
+        self._local_hit_box_cache = np.array(points, dtype=np.float64).reshape(-1, 2)
+
+        # Extent of the hit box, for the left, right, bottom and top properties
+        min_x, min_y = self._local_hit_box_cache.min(axis=0).tolist()
+        max_x, max_y = self._local_hit_box_cache.max(axis=0).tolist()
+        self._local_hit_box_bounds = min_x, min_y, max_x, max_y
+
+        # A hit box that fills its extent, such as an unrotated rectangle,
+        # can be checked for collisions with the extent alone.
+        corners = {(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)}
+        self._local_hit_box_is_rect = (len(points) == 4 and min_x < max_x and min_y < max_y
+                                       and {(x, y) for x, y in points} == corners)
+
+        return self._local_hit_box_cache
+
+    def _clear_hit_box_cache(self):
+        """ Forget the hit box, after the scale, angle or hit box points changed. """
+        self._point_list_cache = None
+        self._local_hit_box_cache = None
 
     def forward(self, speed: float = 1.0):
         """
@@ -441,11 +468,8 @@ def _get_bottom(self) -> float:
         """
         Return the y coordinate of the bottom of the sprite.
         """
-        points = self.get_adjusted_hit_box()
-        my_min = points[0][1]
-        for point in range(1, len(points)):
-            my_min = min(my_min, points[point][1])
-        return my_min
+        self._get_local_hit_box()
+        return self._local_hit_box_bounds[1] + self._position[1]
 
     def _set_bottom(self, amount: float):
         """
@@ -461,11 +485,8 @@ def _get_top(self) -> float:
         """
         Return the y coordinate of the top of the sprite.
         """
-        points = self.get_adjusted_hit_box()
-        my_max = points[0][1]
-        for i in range(1, len(points)):
-            my_max = max(my_max, points[i][1])
-        return my_max
+        self._get_local_hit_box()
+        return self._local_hit_box_bounds[3] + self._position[1]
 
     def _set_top(self, amount: float):
         """ The highest y coordinate. """
@@ -483,7 +504,7 @@ def _set_width(self, new_value: float):
         """ Set the width in pixels of the sprite. """
         if new_value != self._width:
             self.clear_spatial_hashes()
-            self._point_list_cache = None
+            self._clear_hit_box_cache()
             self._width = new_value
             self.add_spatial_hashes()
 
@@ -500,7 +521,7 @@ def _set_height(self, new_value: float):
         """ Set the center x coordinate of the sprite. """
         if new_value != self._height:
             self.clear_spatial_hashes()
-            self._point_list_cache = None
+            self._clear_hit_box_cache()
             self._height = new_value
             self.add_spatial_hashes()
 
@@ -517,7 +538,7 @@ def _set_scale(self, new_value: float):
         """ Set the center x coordinate of the sprite. """
         if new_value != self._scale:
             self.clear_spatial_hashes()
-            self._point_list_cache = None
+            self._clear_hit_box_cache()
             self._scale = new_value
             if self._texture:
                 self._width = self._texture.width * self._scale
@@ -598,7 +619,7 @@ def _set_angle(self, new_value: float):
         if new_value != self._angle:
             self.clear_spatial_hashes()
             self._angle = new_value
-            self._point_list_cache = None
+            self._clear_hit_box_cache()
 
             for sprite_list in self.sprite_lists:
                 sprite_list.update_angle(self)
@@ -626,11 +647,8 @@ def _get_left(self) -> float:
         """
         Return the x coordinate of the left-side of the sprite's hit box.
         """
-        points = self.get_adjusted_hit_box()
-        my_min = points[0][0]
-        for i in range(1, len(points)):
-            my_min = min(my_min, points[i][0])
-        return my_min
+        self._get_local_hit_box()
+        return self._local_hit_box_bounds[0] + self._position[0]
 
     def _set_left(self, amount: float):
         """ The left most x coordinate. """
@@ -644,12 +662,8 @@ def _get_right(self) -> float:
         """
         Return the x coordinate of the right-side of the sprite's hit box.
         """
-
-        points = self.get_adjusted_hit_box()
-        my_max = points[0][0]
-        for point in range(1, len(points)):
-            my_max = max(my_max, points[point][0])
-        return my_max
+        self._get_local_hit_box()
+        return self._local_hit_box_bounds[2] + self._position[0]
 
     def _set_right(self, amount: float):
         """ The right most x coordinate. """
@@ -670,7 +684,7 @@ def set_texture(self, texture_no: int):
 
         texture = self.textures[texture_no]
         self.clear_spatial_hashes()
-        self._point_list_cache = None
+        self._clear_hit_box_cache()
         self._texture = texture
         self._width = texture.width * self.scale
         self._height = texture.height * self.scale
@@ -687,7 +701,7 @@ def _set_texture2(self, texture: Texture):
         assert(isinstance(texture, Texture))
 
         self.clear_spatial_hashes()
-        self._point_list_cache = None
+        self._clear_hit_box_cache()
         self._texture = texture
         self._width = texture.width * self.scale
         self._height = texture.height * self.scale
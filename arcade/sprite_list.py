@@ -4,30 +4,79 @@
 """
 
 from typing import Iterable
-from typing import Any
 from typing import TypeVar
 from typing import Generic
 from typing import List
 from typing import Tuple
 from typing import Optional
+from typing import Set
+from typing import Dict
+from typing import Hashable
+
+from contextlib import contextmanager
 
 import pyglet.gl as gl
 
 import math
 import array
+import weakref
 
-from PIL import Image
+import numpy as np
 
 from arcade import Matrix3x3
 from arcade import Sprite
-from arcade import get_distance_between_sprites
 from arcade import are_polygons_intersecting
+from arcade import are_polygons_intersecting_batch
+from arcade import pad_polygons
 from arcade import is_point_in_polygon
+from arcade import get_segment_polygon_intersection
 
 from arcade import rotate_point
 from arcade import get_projection
 from arcade import shader
 from arcade import Point
+from arcade import load_texture
+from arcade import TextureAtlas
+from arcade import get_default_atlas
+
+# Number of sprites the instance buffers have room for when first built.
+# The capacity doubles whenever it runs out.
+_INITIAL_BUFFER_CAPACITY = 16
+
+# When more than this fraction of the slots changed, the whole instance
+# buffer is orphaned and re-sent instead of writing the changed spans.
+_FULL_UPLOAD_FRACTION = 0.25
+
+# Dirty spans closer together than this many slots are sent in one write.
+_DIRTY_SPAN_GAP = 16
+
+# Candidates passing the collision radius check, from which on
+# check_for_collision_with_list compares hit boxes with NumPy in one go.
+_BATCH_COLLISION_THRESHOLD = 32
+
+# Cell size of a spatial hash that picks its own, until it has enough
+# sprites to measure.
+_DEFAULT_CELL_SIZE = 128
+
+# Sprites a spatial hash needs before it picks its own cell size
+_AUTO_CELL_SIZE_MIN_SPRITES = 16
+
+# Length, in cells, of the pieces a ray is looked up in the spatial hash,
+# so the cells past the first hit don't need to be searched.
+_RAYCAST_CHUNK_CELLS = 8
+
+# Fewest cells a static spatial index is allowed to use, however few sprites
+# it holds. Larger grids are limited to a few cells per sprite.
+_STATIC_INDEX_MIN_CELLS = 1024
+
+# Layout of one sprite in the instance buffer
+_SPRITE_DTYPE = np.dtype([
+    ('pos', 'f4', 2),
+    ('size', 'f4', 2),
+    ('angle', 'f4'),
+    ('sub_tex', 'f4', 4),
+    ('color', 'u1', 4),
+])
 
 _VERTEX_SHADER = """
 #version 330
@@ -46,6 +95,7 @@
 in vec4 in_color;
 
 out vec2 v_texture;
+flat out vec4 v_sub_tex_coords;
 out vec4 v_color;
 
 void main() {
@@ -57,12 +107,11 @@
     pos = in_pos + vec2(rotate * (in_vert * (in_size / 2)));
     gl_Position = Projection * vec4(pos, 0.0, 1.0);
 
-    vec2 tex_offset = in_sub_tex_coords.xy;
-    vec2 tex_size = in_sub_tex_coords.zw;
-
-    v_texture = (in_texture * tex_size + tex_offset) * vec2(1, -1);
-    vec3 temp = TextureTransform * vec3(v_texture, 1.0);
+    // The texture transform works on the sprite's own image. The result
+    // is wrapped and mapped into the atlas by the fragment shader.
+    vec3 temp = TextureTransform * vec3(in_texture * vec2(1, -1), 1.0);
     v_texture = temp.xy / temp.z;
+    v_sub_tex_coords = in_sub_tex_coords;
     v_color = in_color;
 }
 """
@@ -70,14 +119,25 @@
 _FRAGMENT_SHADER = """
 #version 330
 uniform sampler2D Texture;
+uniform float Margin;
 
 in vec2 v_texture;
+flat in vec4 v_sub_tex_coords;
 in vec4 v_color;
 
 out vec4 f_color;
 
 void main() {
-    vec4 basecolor = texture(Texture, v_texture);
+    // Repeat the image inside its own region of the atlas. The transparent
+    // margin right of and below the image is part of the repeat, so the
+    // edges of the sprite blend the same as with a texture of its own.
+    vec2 tex_offset = v_sub_tex_coords.xy;
+    vec2 tex_size = v_sub_tex_coords.zw;
+    vec2 period = 1.0 + Margin / (tex_size * vec2(textureSize(Texture, 0)));
+    vec2 uv = mod(v_texture + vec2(0.0, 1.0), period) * tex_size;
+    uv = vec2(tex_offset.x + uv.x, 1.0 - tex_offset.y - tex_size.y + uv.y);
+
+    vec4 basecolor = texture(Texture, uv);
     basecolor = basecolor * v_color;
     if (basecolor.a == 0.0){
         discard;
@@ -118,62 +178,197 @@ def _create_rects(rect_list: Iterable[Sprite]) -> List[float]:
     return v2f
 
 
+def _get_dirty_spans(dirty: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    Turn a collection of dirty slots into sorted ``(start, end)`` spans.
+    Spans separated by small gaps are merged to save on buffer writes.
+    """
+    spans: List[Tuple[int, int]] = []
+    start = end = -1
+    for slot in sorted(dirty):
+        if start < 0:
+            start, end = slot, slot + 1
+        elif slot - end < _DIRTY_SPAN_GAP:
+            end = slot + 1
+        else:
+            spans.append((start, end))
+            start, end = slot, slot + 1
+    if start >= 0:
+        spans.append((start, end))
+    return spans
+
+
+def _get_rgba(sprite: Sprite) -> Tuple[int, int, int, int]:
+    """ Color and alpha of a sprite, as stored in the instance buffer. """
+    color = sprite.color
+    return int(color[0]), int(color[1]), int(color[2]), int(sprite.alpha)
+
+
 class _SpatialHash:
     """
     Structure for fast collision checking.
 
     See: https://www.gamedev.net/articles/programming/general-and-gameplay-programming/spatial-hashing-r2697/
+
+    Each cell holds its sprites in a dict used as an ordered set, so adding
+    and removing a sprite doesn't depend on how crowded the cell is. Empty
+    cells are dropped, and the range of cells every sprite was put in is
+    remembered, so it can be removed without working out its old location.
     """
 
-    def __init__(self, cell_size):
-        self.cell_size = cell_size
+    def __init__(self, cell_size: Optional[float]):
+        """
+        :param float cell_size: Width and height of the cells. If None, the
+            cells are sized after the sprites in the hash, and resized
+            whenever the sprites become much larger or smaller.
+        """
+        self.auto_cell_size = cell_size is None
+        self.cell_size = _DEFAULT_CELL_SIZE if cell_size is None else cell_size
         self.contents = {}
 
+        # Sprite -> (min_x, min_y, max_x, max_y) of the cells it is in
+        self._cell_ranges = {}
+
+        # Sprite -> size, and the total of the sizes, for picking a cell size
+        self._sprite_sizes = {}
+        self._size_total = 0.0
+
+        # While not None, sprites taken out of the hash are kept here
+        # and only put back when the deferral ends.
+        self._deferred = None
+
     def _hash(self, point):
         return int(point[0] / self.cell_size), int(point[1] / self.cell_size)
 
+    def _get_cell_range(self, sprite: Sprite) -> Tuple[int, int, int, int]:
+        """
+        Range of cells covered by the bounding box of a sprite. The range
+        also takes in the center, in case the hit box is off center, so
+        the sprite can always be found by its position.
+        """
+        x, y = sprite.position
+        min_x, min_y = self._hash((min(sprite.left, x), min(sprite.bottom, y)))
+        max_x, max_y = self._hash((max(sprite.right, x), max(sprite.top, y)))
+        return min_x, min_y, max_x, max_y
+
     def reset(self):
         """
         Clear the spatial hash
         """
         self.contents = {}
+        self._cell_ranges = {}
+        self._sprite_sizes = {}
+        self._size_total = 0.0
 
-    def insert_object_for_box(self, new_object: Sprite):
+    def _get_ideal_cell_size(self) -> Optional[float]:
         """
-        Insert a sprite.
+        Cell size for the sprites in the hash: twice their average size, which
+        puts most sprites in one to four cells without crowding the cells.
         """
-        # Get the corners
-        min_x = new_object.left
-        max_x = new_object.right
-        min_y = new_object.bottom
-        max_y = new_object.top
+        if not self._sprite_sizes:
+            return None
+        return max(float(round(2 * self._size_total / len(self._sprite_sizes))), 1.0)
 
-        # print(f"New - Center: ({new_object.center_x}, {new_object.center_y}), Angle: {new_object.angle}, "
-        #       f"Left: {new_object.left}, Right {new_object.right}")
+    def _check_cell_size(self):
+        """ Resize the cells if they no longer suit the sprites. """
+        if len(self._sprite_sizes) < _AUTO_CELL_SIZE_MIN_SPRITES:
+            return
+        ideal = self._get_ideal_cell_size()
+        if ideal > 2 * self.cell_size or 2 * ideal < self.cell_size:
+            self.set_cell_size(ideal)
 
-        min_point = (min_x, min_y)
-        max_point = (max_x, max_y)
+    def set_cell_size(self, cell_size: float):
+        """
+        Change the size of the cells, and put every sprite in the new cells.
 
-        # print(f"Add 1: {min_point} {max_point}")
+        :param float cell_size: Width and height of the cells
+        """
+        self.cell_size = cell_size
+        sprites = list(self._cell_ranges)
+        self.contents = {}
+        self._cell_ranges = {}
+        for sprite in sprites:
+            self.insert_object_for_box(sprite)
 
-        # hash the minimum and maximum points
-        min_point, max_point = self._hash(min_point), self._hash(max_point)
+    def tune_cell_size(self) -> float:
+        """
+        Size the cells after the sprites in the hash now.
+
+        :return: The new cell size
+        """
+        ideal = self._get_ideal_cell_size()
+        if ideal is not None and ideal != self.cell_size:
+            self.set_cell_size(ideal)
+        return self.cell_size
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Measure how full the cells are, to check the cell size suits the sprites.
+
+        :return: Dict with the ``cell_size``, number of ``sprites`` and
+                 non-empty ``cells``, the ``mean_bucket_size`` and
+                 ``max_bucket_size`` of the cells in sprites, and the
+                 average ``cells_per_sprite``.
+        """
+        bucket_sizes = [len(bucket) for bucket in self.contents.values()]
+        entries = sum(bucket_sizes)
+        return {
+            'cell_size': self.cell_size,
+            'sprites': len(self._cell_ranges),
+            'cells': len(bucket_sizes),
+            'mean_bucket_size': entries / len(bucket_sizes) if bucket_sizes else 0.0,
+            'max_bucket_size': max(bucket_sizes, default=0),
+            'cells_per_sprite': entries / len(self._cell_ranges) if self._cell_ranges else 0.0,
+        }
+
+    def defer_updates(self):
+        """
+        Stop re-inserting sprites that were removed, until :meth:`end_deferred_updates`
+        is called. A sprite moving several times is then only hashed once.
+        """
+        if self._deferred is None:
+            self._deferred = set()
+
+    def end_deferred_updates(self) -> Set[Sprite]:
+        """
+        Go back to updating the hash right away.
+
+        :return: Sprites that were taken out while updates were deferred.
+                 They need to be inserted again.
+        """
+        deferred = self._deferred
+        self._deferred = None
+        return deferred if deferred is not None else set()
+
+    def insert_object_for_box(self, new_object: Sprite):
+        """
+        Insert a sprite.
+        """
+        if self._deferred is not None and new_object in self._deferred:
+            return
 
-        # print(f"Add 2: {min_point} {max_point}")
-        # print("Add: ", min_point, max_point)
+        size = max(new_object.width, new_object.height)
+        self._size_total += size - self._sprite_sizes.get(new_object, 0)
+        self._sprite_sizes[new_object] = size
 
-        # iterate over the rectangular region
-        for i in range(min_point[0], max_point[0] + 1):
-            for j in range(min_point[1], max_point[1] + 1):
-                # append to each intersecting cell
-                bucket = self.contents.setdefault((i, j), [])
-                if new_object in bucket:
-                    # print(f"Error, {new_object.guid} already in ({i}, {j}) bucket. ")
-                    pass
+        cell_range = self._get_cell_range(new_object)
+        old_range = self._cell_ranges.get(new_object)
+        if old_range == cell_range:
+            return
+        if old_range is not None:
+            # Inserted again without being removed first. Don't leave it behind in its old cells.
+            self._remove_from_cells(new_object, old_range)
+
+        min_x, min_y, max_x, max_y = cell_range
+        contents = self.contents
+        for i in range(min_x, max_x + 1):
+            for j in range(min_y, max_y + 1):
+                bucket = contents.get((i, j))
+                if bucket is None:
+                    contents[(i, j)] = {new_object: None}
                 else:
-                    bucket.append(new_object)
-                    # print(f"Adding {new_object.guid} to ({i}, {j}) bucket. "
-                    #       f"{new_object._position} {min_point} {max_point}")
+                    bucket[new_object] = None
+        self._cell_ranges[new_object] = cell_range
 
     def remove_object(self, sprite_to_delete: Sprite):
         """
@@ -181,44 +376,91 @@ def remove_object(self, sprite_to_delete: Sprite):
 
         :param Sprite sprite_to_delete: Pointer to sprite to be removed.
         """
-        # Get the corners
-        min_x = sprite_to_delete.left
-        max_x = sprite_to_delete.right
-        min_y = sprite_to_delete.bottom
-        max_y = sprite_to_delete.top
+        if self._deferred is not None:
+            if sprite_to_delete in self._deferred:
+                return
+            self._deferred.add(sprite_to_delete)
+
+        self._size_total -= self._sprite_sizes.pop(sprite_to_delete, 0)
+        cell_range = self._cell_ranges.pop(sprite_to_delete, None)
+        if cell_range is None:
+            print(f"Warning, tried to remove item {sprite_to_delete.guid} from spatial hash when "
+                  f"it wasn't there.")
+            return
 
-        # print(f"Del - Center: ({sprite_to_delete.center_x}, {sprite_to_delete.center_y}), "
-        #       f"Angle: {sprite_to_delete.angle}, Left: {sprite_to_delete.left}, Right {sprite_to_delete.right}")
+        self._remove_from_cells(sprite_to_delete, cell_range)
 
-        min_point = (min_x, min_y)
-        max_point = (max_x, max_y)
+    def _remove_from_cells(self, sprite: Sprite, cell_range: Tuple[int, int, int, int]):
+        """ Take a sprite out of a range of cells, dropping the cells left empty. """
+        min_x, min_y, max_x, max_y = cell_range
+        contents = self.contents
+        for i in range(min_x, max_x + 1):
+            for j in range(min_y, max_y + 1):
+                bucket = contents[(i, j)]
+                del bucket[sprite]
+                if not bucket:
+                    del contents[(i, j)]
 
-        # print(f"Remove 1: {min_point} {max_point}")
+    def get_objects_for_box(self, check_object: Sprite) -> List[Sprite]:
+        """
+        Returns colliding Sprites.
 
-        # hash the minimum and maximum points
-        min_point, max_point = self._hash(min_point), self._hash(max_point)
+        :param Sprite check_object: Sprite we are checking to see if there are
+            other sprites in the same box(es)
 
-        # print(f"Remove 2: {min_point} {max_point}")
-        # print("Remove: ", min_point, max_point)
+        :return: List of close-by sprites, each listed once
+        :rtype: List
 
-        # iterate over the rectangular region
-        for i in range(min_point[0], max_point[0] + 1):
-            for j in range(min_point[1], max_point[1] + 1):
-                bucket = self.contents.setdefault((i, j), [])
-                try:
-                    bucket.remove(sprite_to_delete)
-                    # print(f"Removing {sprite_to_delete.guid} from ({i}, {j}) bucket. {sprite_to_delete._position} "
-                    #       f"{min_point} {max_point}")
 
-                except ValueError:
-                    print(f"Warning, tried to remove item {sprite_to_delete.guid} from spatial hash {i} {j} when "
-                          f"it wasn't there. {min_point} {max_point}")
+        """
+        if self.auto_cell_size:
+            self._check_cell_size()
 
-    def get_objects_for_box(self, check_object: Sprite) -> List[Sprite]:
+        return self._get_objects_in_cells(*self._get_cell_range(check_object))
+
+    def get_objects_for_rect(self, left: float, bottom: float, right: float, top: float) -> List[Sprite]:
         """
-        Returns colliding Sprites.
+        Returns Sprites in or close to a rectangle.
 
-        :param Sprite check_object: Sprite we are checking to see if there are
+        :param float left: Left edge of the rectangle
+        :param float bottom: Bottom edge of the rectangle
+        :param float right: Right edge of the rectangle
+        :param float top: Top edge of the rectangle
+
+        :return: List of close-by sprites, each listed once
+        :rtype: List
+        """
+        if self.auto_cell_size:
+            self._check_cell_size()
+
+        min_x, min_y = self._hash((left, bottom))
+        max_x, max_y = self._hash((right, top))
+        return self._get_objects_in_cells(min_x, min_y, max_x, max_y)
+
+    def _get_objects_in_cells(self, min_x: int, min_y: int, max_x: int, max_y: int) -> List[Sprite]:
+        """ Sprites in a range of cells, each listed once. """
+        contents = self.contents
+
+        if min_x == max_x and min_y == max_y:
+            bucket = contents.get((min_x, min_y))
+            return list(bucket) if bucket else []
+
+        # Sprites spanning several of the cells are only kept once,
+        # in the order they are first found.
+        close_by_sprites = {}
+        for i in range(min_x, max_x + 1):
+            for j in range(min_y, max_y + 1):
+                bucket = contents.get((i, j))
+                if bucket:
+                    close_by_sprites.update(bucket)
+
+        return list(close_by_sprites)
+
+    def get_objects_for_point(self, check_point: Point) -> List[Sprite]:
+        """
+        Returns Sprites at or close to a point.
+
+        :param Point check_point: Point we are checking to see if there are
             other sprites in the same box(es)
 
         :return: List of close-by sprites
@@ -226,30 +468,242 @@ def get_objects_for_box(self, check_object: Sprite) -> List[Sprite]:
 
 
         """
-        # Get the corners
-        min_x = check_object.left
-        max_x = check_object.right
-        min_y = check_object.bottom
-        max_y = check_object.top
+        if self.auto_cell_size:
+            self._check_cell_size()
 
-        min_point = (min_x, min_y)
-        max_point = (max_x, max_y)
+        bucket = self.contents.get(self._hash(check_point))
+        if bucket is None:
+            return []
+        return list(bucket)
 
-        # hash the minimum and maximum points
-        min_point, max_point = self._hash(min_point), self._hash(max_point)
+    def get_objects_for_segment(self, start: Point, end: Point) -> List[Sprite]:
+        """
+        Returns Sprites in the cells a line segment passes through.
 
-        close_by_sprites: List[Sprite] = []
-        # iterate over the rectangular region
-        for i in range(min_point[0], max_point[0] + 1):
-            for j in range(min_point[1], max_point[1] + 1):
-                # print(f"Checking {i}, {j}")
-                # append to each intersecting cell
-                new_items = self.contents.setdefault((i, j), [])
-                # for item in new_items:
-                #     print(f"Found {item.guid} in {i}, {j}")
-                close_by_sprites.extend(new_items)
+        :param Point start: Start of the segment
+        :param Point end: End of the segment
 
-        return close_by_sprites
+        :return: List of close-by sprites, each listed once, roughly in the order
+                 they are passed going from start to end.
+        :rtype: List
+        """
+        if self.auto_cell_size:
+            self._check_cell_size()
+
+        contents = self.contents
+        close_by_sprites = {}
+        for cell_x, cell_y in _get_cells_on_segment(start, end, self.cell_size):
+            # The hash rounds towards zero, so cells -1 and 0 are the same cell
+            bucket = contents.get((cell_x + (cell_x < 0), cell_y + (cell_y < 0)))
+            if bucket:
+                close_by_sprites.update(bucket)
+        return list(close_by_sprites)
+
+
+class _StaticSpatialIndex:
+    """
+    Structure for fast collision checking against sprites that don't move,
+    such as the tiles of a map.
+
+    The sprites are put in a dense grid, built in one go from every sprite
+    in the list. The cells are as large as a typical sprite, so each sprite
+    only lands in a few of them. A query works out the cells it needs by
+    arithmetic, without hashing any keys.
+
+    Adding, moving or removing a sprite doesn't change the grid. It gets
+    rebuilt the next time it is queried instead, which is fine for sprites
+    that change now and then, and slow for sprites that move every frame.
+    """
+
+    def __init__(self, sprite_list: 'SpriteList'):
+        self.sprite_list = sprite_list
+        self._cell_size = 1.0
+
+        # Grid origin and dimensions, in cells
+        self._origin = (0.0, 0.0)
+        self._columns = 0
+        self._rows = 0
+
+        # Sprites in each cell, row by row from the bottom left
+        self._cells: List[Tuple[Sprite, ...]] = []
+        self._stale = True
+
+    @property
+    def cell_size(self) -> float:
+        """ Width and height of the cells, picked when the grid is built. """
+        if self._stale:
+            self._build()
+        return self._cell_size
+
+    def _build(self):
+        """ Put all the sprites of the list in a new grid. """
+        self._stale = False
+        sprites = self.sprite_list.sprite_list
+        if not sprites:
+            self._columns = self._rows = 0
+            self._cells = []
+            return
+
+        boxes = np.array([(sprite.left, sprite.bottom, sprite.right, sprite.top) for sprite in sprites],
+                         dtype=np.float64)
+
+        # Stretch boxes to take in the center of off center hit boxes, so
+        # every sprite can be found by its position.
+        positions = self.sprite_list._get_positions()
+        boxes[:, :2] = np.minimum(boxes[:, :2], positions)
+        boxes[:, 2:] = np.maximum(boxes[:, 2:], positions)
+        origin_x = boxes[:, 0].min()
+        origin_y = boxes[:, 1].min()
+        extent_x = boxes[:, 2].max() - origin_x
+        extent_y = boxes[:, 3].max() - origin_y
+
+        # Size the cells after the typical sprite, but don't let a few far away
+        # sprites make the grid much larger than the number of sprites.
+        sizes = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+        cell_size = max(float(np.median(sizes)), 1.0)
+        max_cells = max(4 * len(sprites), _STATIC_INDEX_MIN_CELLS)
+        cells_needed = (extent_x / cell_size + 1) * (extent_y / cell_size + 1)
+        if cells_needed > max_cells:
+            cell_size *= math.sqrt(cells_needed / max_cells)
+
+        # The upper edge is exclusive, so a tile exactly one cell wide only goes in one cell
+        cell_x_min = np.floor((boxes[:, 0] - origin_x) / cell_size).astype(np.intp)
+        cell_y_min = np.floor((boxes[:, 1] - origin_y) / cell_size).astype(np.intp)
+        cell_x_max = np.maximum(np.ceil((boxes[:, 2] - origin_x) / cell_size).astype(np.intp) - 1, cell_x_min)
+        cell_y_max = np.maximum(np.ceil((boxes[:, 3] - origin_y) / cell_size).astype(np.intp) - 1, cell_y_min)
+        columns = int(cell_x_max.max()) + 1
+        rows = int(cell_y_max.max()) + 1
+
+        # One entry per sprite and cell it covers
+        widths = cell_x_max - cell_x_min + 1
+        counts = widths * (cell_y_max - cell_y_min + 1)
+        sprite_indices = np.repeat(np.arange(len(sprites)), counts)
+        offsets = np.arange(len(sprite_indices)) - np.repeat(np.cumsum(counts) - counts, counts)
+        entry_x = cell_x_min[sprite_indices] + offsets % widths[sprite_indices]
+        entry_y = cell_y_min[sprite_indices] + offsets // widths[sprite_indices]
+        entry_cells = entry_y * columns + entry_x
+
+        # Group the entries by cell, keeping the order of the list within each cell
+        order = np.argsort(entry_cells, kind='stable')
+        sprite_indices = sprite_indices[order].tolist()
+        cell_starts = np.searchsorted(entry_cells[order], np.arange(columns * rows + 1)).tolist()
+
+        empty: Tuple[Sprite, ...] = ()
+        cells = [empty] * (columns * rows)
+        for cell in np.unique(entry_cells).tolist():
+            cells[cell] = tuple(sprites[i] for i in sprite_indices[cell_starts[cell]:cell_starts[cell + 1]])
+
+        self._cell_size = cell_size
+        self._origin = (float(origin_x), float(origin_y))
+        self._columns = columns
+        self._rows = rows
+        self._cells = cells
+
+    def _get_cell_range(self, left: float, bottom: float, right: float, top: float):
+        """
+        Range of cells touched by a box, clipped to the grid. Edges that only
+        touch a cell count, so sprites just touching the box are found too.
+        """
+        origin_x, origin_y = self._origin
+        cell_size = self._cell_size
+        min_x = max(math.ceil((left - origin_x) / cell_size) - 1, 0)
+        min_y = max(math.ceil((bottom - origin_y) / cell_size) - 1, 0)
+        max_x = min(math.floor((right - origin_x) / cell_size), self._columns - 1)
+        max_y = min(math.floor((top - origin_y) / cell_size), self._rows - 1)
+        return min_x, min_y, max_x, max_y
+
+    def reset(self):
+        """
+        Clear the index. It is rebuilt from the sprite list when next queried.
+        """
+        self._stale = True
+
+    def tune_cell_size(self) -> float:
+        """
+        Rebuild the grid now, sizing the cells after the sprites.
+
+        :return: The new cell size
+        """
+        self._build()
+        return self._cell_size
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Measure how full the cells are, to check the cell size suits the sprites.
+
+        :return: Same as the spatial hash gives, see ``_SpatialHash.get_stats``.
+        """
+        if self._stale:
+            self._build()
+        bucket_sizes = [len(cell) for cell in self._cells if cell]
+        entries = sum(bucket_sizes)
+        sprite_count = len(self.sprite_list.sprite_list)
+        return {
+            'cell_size': self._cell_size,
+            'sprites': sprite_count,
+            'cells': len(bucket_sizes),
+            'mean_bucket_size': entries / len(bucket_sizes) if bucket_sizes else 0.0,
+            'max_bucket_size': max(bucket_sizes, default=0),
+            'cells_per_sprite': entries / sprite_count if sprite_count else 0.0,
+        }
+
+    def defer_updates(self):
+        """ Nothing to do, as the index is only rebuilt when queried. """
+
+    def end_deferred_updates(self) -> Set[Sprite]:
+        """
+        Nothing to do, as the index is only rebuilt when queried.
+
+        :return: An empty set, no sprites need to be inserted again.
+        """
+        return set()
+
+    def insert_object_for_box(self, new_object: Sprite):
+        """
+        Note that a sprite was added or moved.
+        """
+        self._stale = True
+
+    def remove_object(self, sprite_to_delete: Sprite):
+        """
+        Note that a sprite was removed or is about to move.
+
+        :param Sprite sprite_to_delete: Pointer to sprite to be removed.
+        """
+        self._stale = True
+
+    def _get_objects_in_cells(self, min_x: int, min_y: int, max_x: int, max_y: int) -> List[Sprite]:
+        """ Sprites in a range of cells, each listed once. """
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        columns = self._columns
+        cells = self._cells
+        if min_x == max_x and min_y == max_y:
+            return list(cells[min_y * columns + min_x])
+
+        close_by_sprites = {}
+        for j in range(min_y, max_y + 1):
+            row = j * columns
+            for cell in cells[row + min_x:row + max_x + 1]:
+                if cell:
+                    close_by_sprites.update(dict.fromkeys(cell))
+        return list(close_by_sprites)
+
+    def get_objects_for_box(self, check_object: Sprite) -> List[Sprite]:
+        """
+        Returns colliding Sprites.
+
+        :param Sprite check_object: Sprite we are checking to see if there are
+            other sprites in the same box(es)
+
+        :return: List of close-by sprites, each listed once
+        :rtype: List
+        """
+        if self._stale:
+            self._build()
+        return self._get_objects_in_cells(*self._get_cell_range(check_object.left, check_object.bottom,
+                                                                 check_object.right, check_object.top))
 
     def get_objects_for_point(self, check_point: Point) -> List[Sprite]:
         """
@@ -260,17 +714,137 @@ def get_objects_for_point(self, check_point: Point) -> List[Sprite]:
 
         :return: List of close-by sprites
         :rtype: List
+        """
+        if self._stale:
+            self._build()
+        x, y = check_point
+        return self._get_objects_in_cells(*self._get_cell_range(x, y, x, y))
 
+    def get_objects_for_rect(self, left: float, bottom: float, right: float, top: float) -> List[Sprite]:
+        """
+        Returns Sprites in or close to a rectangle.
+
+        :param float left: Left edge of the rectangle
+        :param float bottom: Bottom edge of the rectangle
+        :param float right: Right edge of the rectangle
+        :param float top: Top edge of the rectangle
 
+        :return: List of close-by sprites, each listed once
+        :rtype: List
         """
+        if self._stale:
+            self._build()
+        return self._get_objects_in_cells(*self._get_cell_range(left, bottom, right, top))
 
-        hash_point = self._hash(check_point)
+    def get_objects_for_segment(self, start: Point, end: Point) -> List[Sprite]:
+        """
+        Returns Sprites in the cells a line segment passes through.
 
-        close_by_sprites: List[Sprite] = []
-        new_items = self.contents.setdefault(hash_point, [])
-        close_by_sprites.extend(new_items)
+        :param Point start: Start of the segment
+        :param Point end: End of the segment
+
+        :return: List of close-by sprites, each listed once, roughly in the order
+                 they are passed going from start to end.
+        :rtype: List
+        """
+        if self._stale:
+            self._build()
+        if not self._cells:
+            return []
+
+        # Only walk the part of the segment over the grid
+        origin_x, origin_y = self._origin
+        width = self._columns * self._cell_size
+        height = self._rows * self._cell_size
+        clipped = _clip_segment(start[0] - origin_x, start[1] - origin_y,
+                                end[0] - origin_x, end[1] - origin_y, width, height)
+        if clipped is None:
+            return []
+
+        columns = self._columns
+        cells = self._cells
+        close_by_sprites = {}
+        for cell_x, cell_y in _get_cells_on_segment(clipped[0], clipped[1], self._cell_size):
+            if 0 <= cell_x < columns and 0 <= cell_y < self._rows:
+                cell = cells[cell_y * columns + cell_x]
+                if cell:
+                    close_by_sprites.update(dict.fromkeys(cell))
+        return list(close_by_sprites)
+
+
+def _get_cells_on_segment(start: Point, end: Point, cell_size: float) -> Iterable[Tuple[int, int]]:
+    """
+    Walk the cells of a grid a line segment passes through, from start to end.
+    Cell (i, j) spans ``i * cell_size`` up to ``(i + 1) * cell_size`` in x,
+    likewise in y.
+
+    See: Amanatides and Woo, A Fast Voxel Traversal Algorithm for Ray Tracing
+    """
+    x, y = start
+    cell_x = math.floor(x / cell_size)
+    cell_y = math.floor(y / cell_size)
+    end_x = math.floor(end[0] / cell_size)
+    end_y = math.floor(end[1] / cell_size)
+    delta_x = end[0] - x
+    delta_y = end[1] - y
+
+    step_x = 1 if delta_x > 0 else -1
+    step_y = 1 if delta_y > 0 else -1
+
+    # Distance along the segment, as a fraction, to the next cell edge and between cell edges
+    if delta_x:
+        next_x = ((cell_x + (step_x > 0)) * cell_size - x) / delta_x
+        between_x = cell_size / abs(delta_x)
+    else:
+        next_x = between_x = math.inf
+    if delta_y:
+        next_y = ((cell_y + (step_y > 0)) * cell_size - y) / delta_y
+        between_y = cell_size / abs(delta_y)
+    else:
+        next_y = between_y = math.inf
+
+    yield cell_x, cell_y
+    for _ in range(abs(end_x - cell_x) + abs(end_y - cell_y)):
+        if next_x < next_y:
+            cell_x += step_x
+            next_x += between_x
+        else:
+            cell_y += step_y
+            next_y += between_y
+        yield cell_x, cell_y
 
-        return close_by_sprites
+
+def _clip_segment(x1: float, y1: float, x2: float, y2: float,
+                  width: float, height: float) -> Optional[Tuple[Point, Point]]:
+    """
+    Clip a line segment to the box from (0, 0) to (width, height).
+
+    :return: The part of the segment inside the box, or None if it misses the box.
+    """
+    delta_x = x2 - x1
+    delta_y = y2 - y1
+    start, end = 0.0, 1.0
+    for direction, distance in ((-delta_x, x1), (delta_x, width - x1),
+                                (-delta_y, y1), (delta_y, height - y1)):
+        if direction == 0:
+            if distance < 0:
+                return None
+        else:
+            fraction = distance / direction
+            if direction < 0:
+                start = max(start, fraction)
+            else:
+                end = min(end, fraction)
+    if start > end:
+        return None
+    return ((x1 + start * delta_x, y1 + start * delta_y),
+            (x1 + end * delta_x, y1 + end * delta_y))
+
+
+def _release_textures(slot_textures: Dict[int, Tuple[TextureAtlas, Hashable]]):
+    """ Tell the atlases the textures of a sprite list that is gone aren't used by it any more. """
+    for atlas, key in slot_textures.values():
+        atlas.release(key)
 
 
 _SpriteType = TypeVar('_SpriteType', bound=Sprite)
@@ -282,10 +856,10 @@ class SpriteList(Generic[_SpriteType]):
     and doing collision detection. For optimization reasons, use_spatial_hash and
     is_static are very important.
     """
-    array_of_images: Optional[List[Any]]
     next_texture_id = 0
 
-    def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static=False):
+    def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static=False,
+                 static_spatial_index=False):
         """
         Initialize the sprite list
 
@@ -293,10 +867,17 @@ def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static
                in the SpriteList slower, but it will speed up collision detection
                with items in the SpriteList. Great for doing collision detection
                with static walls/platforms.
-        :param int spatial_hash_cell_size:
+        :param int spatial_hash_cell_size: Width and height of the cells of the
+               spatial hash. Set to None to have the hash size its cells after
+               the sprites in it, and resize them if the sprites change a lot.
         :param bool is_static: Speeds drawing if the sprites in the list do not
                move. Will result in buggy behavior if the sprites move when this
                is set to True.
+        :param bool static_spatial_index: Use a grid built once from all the
+               sprites for collision detection, instead of the spatial hash.
+               Faster for large maps whose sprites don't move. The grid picks
+               its own cell size. Any change to the sprites rebuilds it the next
+               time it is used, so don't use this for sprites that move.
         """
         # List of sprites in the sprite list
         self.sprite_list = []
@@ -305,43 +886,64 @@ def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static
         # Used in drawing optimization via OpenGL
         self.program = None
 
-        self._sprite_pos_data = None
-        self._sprite_pos_buf = None
-        self._sprite_pos_desc = None
-        self._sprite_pos_changed = False
+        # One record per slot, laid out as _SPRITE_DTYPE, interleaved in a
+        # single buffer. The *_data attributes are views of its columns.
+        self._sprite_data = None
+        self._sprite_buf = None
+        self._sprite_desc = None
+        self._sprite_dirty = set()
 
+        self._sprite_pos_data = None
         self._sprite_size_data = None
-        self._sprite_size_buf = None
-        self._sprite_size_desc = None
-        self._sprite_size_changed = False
-
         self._sprite_angle_data = None
-        self._sprite_angle_buf = None
-        self._sprite_angle_desc = None
-        self._sprite_angle_changed = False
-
         self._sprite_color_data = None
-        self._sprite_color_buf = None
-        self._sprite_color_desc = None
-        self._sprite_color_changed = False
-
         self._sprite_sub_tex_data = None
-        self._sprite_sub_tex_buf = None
-        self._sprite_sub_tex_desc = None
-        self._sprite_sub_tex_changed = False
 
         self.texture_id = None
-        self._texture = None
         self._vao1 = None
         self.vbo_buf = None
 
-        self.array_of_texture_names = []
-        self.array_of_images = []
+        # The instance buffers are allocated with spare capacity, and every
+        # sprite owns a slot in them. Appending or removing a sprite only
+        # touches its own slot. Removed sprites leave an invisible hole that
+        # gets squeezed out the next time the slots are repacked.
+        self._buf_capacity = 0
+        self._sprite_slot = dict()
+        self._slot_count = 0
+        self._free_slots = set()
+        self._slots_out_of_order = False
+        self._sprite_slots_changed = False
+        self._sprite_buffers_stale = False
+
+        # Positions saved by store_positions(), by slot, for drawing sprites
+        # part of the way between two updates. The in-between records are
+        # put together in a scratch array, and the slots the buffer holds
+        # in-between positions for are sent again on the next plain draw.
+        self._previous_pos_data = None
+        self._interpolated_data = None
+        self._interpolated_slots = set()
+
+        # Textures are drawn from an atlas shared with the other sprite lists.
+        # Slots are pointed at their texture again whenever the atlas grows.
+        self.atlas: TextureAtlas = get_default_atlas()
+        self._atlas_version = None
+
+        # Atlas and key of the texture each slot uses, so the atlas knows
+        # which textures are still drawn. Released when the list is collected.
+        self._slot_textures: Dict[int, Tuple[TextureAtlas, Hashable]] = dict()
+        weakref.finalize(self, _release_textures, self._slot_textures)
+        self._atlas_changed = False
+        self._filter = gl.GL_LINEAR
+
+        # Nesting depth of batch_update() blocks
+        self._batch_depth = 0
 
         # Used in collision detection optimization
         self.is_static = is_static
-        self.use_spatial_hash = use_spatial_hash
-        if use_spatial_hash:
+        self.use_spatial_hash = use_spatial_hash or static_spatial_index
+        if static_spatial_index:
+            self.spatial_hash = _StaticSpatialIndex(self)
+        elif use_spatial_hash:
             self.spatial_hash = _SpatialHash(cell_size=spatial_hash_cell_size)
         else:
             self.spatial_hash = None
@@ -356,7 +958,7 @@ def append(self, item: _SpriteType):
         self.sprite_list.append(item)
         self.sprite_idx[item] = idx
         item.register_sprite_list(self)
-        self._vao1 = None
+        self._add_slot(item)
         if self.use_spatial_hash:
             self.spatial_hash.insert_object_for_box(item)
 
@@ -381,7 +983,9 @@ def insert(self, index: int, item: _SpriteType):
         for idx, sprite in enumerate(self.sprite_list[index:], start=index):
             self.sprite_idx[sprite] = idx
 
-        self._vao1 = None
+        # Draw order changed, so the slots need to be repacked before drawing
+        self._add_slot(item)
+        self._slots_out_of_order = True
         if self.use_spatial_hash:
             self.spatial_hash.insert_object_for_box(item)
 
@@ -393,7 +997,223 @@ def reverse(self):
         for idx, sprite in enumerate(self.sprite_list):
             self.sprite_idx[sprite] = idx
 
-        self._vao1 = None
+        self._slots_out_of_order = True
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Hold back spatial hash updates while moving many sprites.
+
+        Normally every change to a sprite's position, angle or size removes it
+        from the spatial hash and inserts it again. Inside this block a sprite
+        is only removed the first time it changes, and inserted once, at its
+        final location, when the block ends. Collision checks against this
+        list inside the block won't find the sprites that moved.
+
+        ::
+
+            with wall_list.batch_update():
+                for wall in wall_list:
+                    wall.center_x += 10
+                    wall.center_y += 5
+        """
+        if self.spatial_hash is None:
+            yield
+            return
+
+        self._batch_depth += 1
+        self.spatial_hash.defer_updates()
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                for sprite in self.spatial_hash.end_deferred_updates():
+                    if sprite in self.sprite_idx:
+                        self.spatial_hash.insert_object_for_box(sprite)
+
+    def tune_spatial_hash(self) -> Optional[float]:
+        """
+        Size the cells of the spatial hash after the sprites in the list now,
+        and put the sprites in the new cells.
+
+        :return: The new cell size, or None if the list doesn't use a spatial hash.
+        """
+        if self.spatial_hash is None:
+            return None
+        return self.spatial_hash.tune_cell_size()
+
+    def get_spatial_hash_stats(self) -> Optional[Dict[str, float]]:
+        """
+        Measure how the sprites are spread over the cells of the spatial hash.
+
+        The returned dict has the ``cell_size``, the number of ``sprites`` and
+        of non-empty ``cells``, the ``mean_bucket_size`` and ``max_bucket_size``,
+        which are numbers of sprites in a cell, and ``cells_per_sprite``.
+        Crowded cells slow down collision checks, sprites spread over many
+        cells slow down moving them.
+
+        :return: Dict of statistics, or None if the list doesn't use a spatial hash.
+        """
+        if self.spatial_hash is None:
+            return None
+        return self.spatial_hash.get_stats()
+
+    def nearest(self, point: Point, k: int = 1) -> List[Tuple[_SpriteType, float]]:
+        """
+        Find the sprites whose centers are closest to a point.
+
+        With a spatial hash, the search starts in the cells around the point
+        and widens until it holds ``k`` sprites closer than its edges.
+        Otherwise the distance to every sprite is worked out with NumPy.
+
+        :param Point point: Point to measure from
+        :param int k: Number of sprites to find
+
+        :return: Up to ``k`` ``(sprite, distance)`` pairs, closest first.
+                 Sprites at the same distance are in list order.
+        """
+        if k <= 0 or not self.sprite_list:
+            return []
+
+        x, y = point
+        if self.spatial_hash is not None:
+            cell_size = self.spatial_hash.cell_size
+            radius = cell_size
+            # Past this size, looking through the cells is more work than
+            # looking at every sprite.
+            while (2 * radius / cell_size + 1) ** 2 <= len(self.sprite_list):
+                found = self._get_sprites_in_square(x, y, radius)
+                if len(found) >= k:
+                    found.sort()
+                    return [(self.sprite_list[index], math.sqrt(distance2)) for distance2, index in found[:k]]
+                radius *= 2
+
+        distances2 = self._get_distances2(x, y)
+        closest = np.argsort(distances2, kind='stable')[:k]
+        return [(self.sprite_list[index], math.sqrt(distance2))
+                for index, distance2 in zip(closest.tolist(), distances2[closest].tolist())]
+
+    def within_radius(self, point: Point, radius: float) -> List[_SpriteType]:
+        """
+        Find the sprites whose centers are within a distance of a point.
+
+        :param Point point: Point to measure from
+        :param float radius: Largest distance from the point
+
+        :return: List of sprites, in list order.
+        """
+        if not self.sprite_list:
+            return []
+
+        x, y = point
+        if self.spatial_hash is not None \
+                and (2 * radius / self.spatial_hash.cell_size + 1) ** 2 <= len(self.sprite_list):
+            return [self.sprite_list[index] for index in sorted(index for _, index in
+                                                                 self._get_sprites_in_square(x, y, radius))]
+
+        within = np.nonzero(self._get_distances2(x, y) <= radius * radius)[0]
+        return [self.sprite_list[index] for index in within.tolist()]
+
+    def _get_sprites_in_square(self, x: float, y: float, radius: float) -> List[Tuple[float, int]]:
+        """
+        Look up the sprites around a point in the spatial hash.
+
+        :return: ``(squared distance, list index)`` of every sprite within radius of the point.
+        """
+        radius2 = radius * radius
+        sprite_idx = self.sprite_idx
+        found = []
+        for sprite in self.spatial_hash.get_objects_for_rect(x - radius, y - radius, x + radius, y + radius):
+            sprite_x, sprite_y = sprite.position
+            distance2 = (sprite_x - x) * (sprite_x - x) + (sprite_y - y) * (sprite_y - y)
+            if distance2 <= radius2:
+                found.append((distance2, sprite_idx[sprite]))
+        return found
+
+    def _get_distances2(self, x: float, y: float) -> np.ndarray:
+        """ Squared distance from a point to the center of every sprite, in list order. """
+        offsets = self._get_positions() - (x, y)
+        return offsets[:, 0] * offsets[:, 0] + offsets[:, 1] * offsets[:, 1]
+
+    def raycast(self, start: Point, end: Point) -> Optional[Tuple[_SpriteType, Point, float]]:
+        """
+        Find the first sprite a line from start to end runs into, such as
+        the target of a hitscan weapon. Hit boxes are used for the test.
+
+        With a spatial hash, only the sprites in the cells along the line
+        are checked, nearest cells first.
+
+        :param Point start: Start of the line
+        :param Point end: End of the line
+
+        :return: ``(sprite, hit point, distance from start)`` or None if nothing is hit.
+        """
+        if self.spatial_hash is None:
+            hits = self._get_segment_hits(start, end, self.sprite_list)
+            return self._format_hit(start, end, min(hits)) if hits else None
+
+        # Check the line a piece at a time, so a hit close to the start
+        # doesn't need the rest of it looked up.
+        length = math.hypot(end[0] - start[0], end[1] - start[1])
+        pieces = max(1, math.ceil(length / (self.spatial_hash.cell_size * _RAYCAST_CHUNK_CELLS)))
+        piece_start = start
+        for piece in range(1, pieces + 1):
+            piece_end = (start[0] + (end[0] - start[0]) * piece / pieces,
+                         start[1] + (end[1] - start[1]) * piece / pieces)
+            candidates = self.spatial_hash.get_objects_for_segment(piece_start, piece_end)
+            # Sprites hit further along may have something in front of them in the next pieces
+            hits = [hit for hit in self._get_segment_hits(start, end, candidates) if hit[0] <= piece / pieces]
+            if hits:
+                return self._format_hit(start, end, min(hits))
+            piece_start = piece_end
+        return None
+
+    def segment_query(self, start: Point, end: Point) -> List[Tuple[_SpriteType, Point, float]]:
+        """
+        Find every sprite a line from start to end runs into, such as
+        everything a laser beam passes through.
+
+        :param Point start: Start of the line
+        :param Point end: End of the line
+
+        :return: List of ``(sprite, hit point, distance from start)``, ordered
+                 by distance. Sprites hit at the same distance are in list order.
+        """
+        if self.spatial_hash is None:
+            candidates = self.sprite_list
+        else:
+            candidates = self.spatial_hash.get_objects_for_segment(start, end)
+        hits = self._get_segment_hits(start, end, candidates)
+        hits.sort()
+        return [self._format_hit(start, end, hit) for hit in hits]
+
+    def _get_segment_hits(self, start: Point, end: Point, sprites: Iterable[_SpriteType]) -> List[Tuple[float, int]]:
+        """
+        Test a line against the hit boxes of sprites.
+
+        :return: ``(fraction of the line to the hit, list index)`` of each sprite hit
+        """
+        min_x, max_x = min(start[0], end[0]), max(start[0], end[0])
+        min_y, max_y = min(start[1], end[1]), max(start[1], end[1])
+        sprite_idx = self.sprite_idx
+        hits = []
+        for sprite in sprites:
+            # Skip sprites whose bounding box is nowhere near the line
+            if sprite.right < min_x or sprite.left > max_x or sprite.top < min_y or sprite.bottom > max_y:
+                continue
+            fraction = get_segment_polygon_intersection(start, end, sprite.get_adjusted_hit_box())
+            if fraction is not None:
+                hits.append((fraction, sprite_idx[sprite]))
+        return hits
+
+    def _format_hit(self, start: Point, end: Point, hit: Tuple[float, int]) -> Tuple[_SpriteType, Point, float]:
+        """ Turn a hit into the sprite, the point hit and the distance to it. """
+        fraction, index = hit
+        delta_x = end[0] - start[0]
+        delta_y = end[1] - start[1]
+        point = (start[0] + delta_x * fraction, start[1] + delta_y * fraction)
+        return self.sprite_list[index], point, math.hypot(delta_x, delta_y) * fraction
 
     def _recalculate_spatial_hash(self, item: _SpriteType):
         """ Recalculate the spatial hash for a particular item. """
@@ -412,22 +1232,41 @@ def remove(self, item: _SpriteType):
         Remove a specific sprite from the list.
         :param Sprite item: Item to remove from the list
         """
-        self.sprite_list.remove(item)
+        index = self.sprite_idx.pop(item, None)
+        if index is None:
+            raise ValueError("Sprite is not in the SpriteList.")
+
+        del self.sprite_list[index]
         item.sprite_lists.remove(self)
 
-        # Rebuild index list
-        self.sprite_idx[item] = dict()
-        for idx, sprite in enumerate(self.sprite_list):
+        # Rebuild index list for the sprites after the removed one
+        for idx, sprite in enumerate(self.sprite_list[index:], start=index):
             self.sprite_idx[sprite] = idx
 
-        self._vao1 = None
+        self._remove_slot(item)
         if self.use_spatial_hash:
             self.spatial_hash.remove_object(item)
 
     def update(self):
         """
         Call the update() method on each sprite in the list.
+
+        When none of the sprites override :meth:`Sprite.update`, the list
+        applies their velocity and change in angle to all of them at once.
         """
+        if self._uses_default_method('update', 'position', 'angle'):
+            if len(self.sprite_list) == 0:
+                return
+
+            state = np.array([(sprite.center_x, sprite.center_y,
+                               sprite.change_x, sprite.change_y,
+                               sprite.angle, sprite.change_angle)
+                              for sprite in self.sprite_list], dtype=np.float64)
+            # Leave the angles, and the rotated hit boxes cached for them, alone when nothing turns
+            angles = state[:, 4] + state[:, 5] if state[:, 5].any() else None
+            self._set_sprite_state(state[:, 0:2] + state[:, 2:4], angles=angles)
+            return
+
         for sprite in self.sprite_list:
             sprite.update()
 
@@ -435,9 +1274,20 @@ def on_update(self, delta_time: float = 1/60):
         """
         Update the sprite. Similar to update, but also takes a delta-time.
         """
+        # Sprite.on_update() does nothing, don't call it for every sprite
+        if self._uses_default_method('on_update'):
+            return
+
         for sprite in self.sprite_list:
             sprite.on_update(delta_time)
 
+    def _uses_default_method(self, *names: str) -> bool:
+        """ Check if no sprite in the list overrides any of these methods or properties of Sprite. """
+        sprite_types = {type(sprite) for sprite in self.sprite_list}
+        return all(getattr(sprite_type, name) is getattr(Sprite, name)
+                   for sprite_type in sprite_types
+                   for name in names)
+
     def update_animation(self, delta_time: float = 1/60):
         """
         Call the update_animation in every sprite in the sprite list.
@@ -455,8 +1305,18 @@ def _get_center(self) -> Tuple[float, float]:
 
     def rescale(self, factor: float) -> None:
         """ Rescale all sprites in the list relative to the spritelists center. """
-        for sprite in self.sprite_list:
-            sprite.rescale_relative_to_point(self.center, factor)
+        if len(self.sprite_list) == 0:
+            return
+
+        positions = self._get_positions()
+        center = positions.mean(axis=0)
+        if not self._uses_default_method('rescale_relative_to_point', 'position', 'scale'):
+            for sprite in self.sprite_list:
+                sprite.rescale_relative_to_point(tuple(center), factor)
+            return
+
+        scales = np.array([sprite.scale for sprite in self.sprite_list], dtype=np.float64)
+        self._set_sprite_state((positions - center) * factor + center, scales=scales * factor)
 
     def move(self, change_x: float, change_y: float):
         """
@@ -465,9 +1325,96 @@ def move(self, change_x: float, change_y: float):
         :param float change_x: Amount to change all x values by
         :param float change_y: Amount to change all y values by
         """
-        for sprite in self.sprite_list:
-            sprite.center_x += change_x
-            sprite.center_y += change_y
+        if len(self.sprite_list) == 0:
+            return
+
+        if not self._uses_default_method('position', 'center_x', 'center_y'):
+            for sprite in self.sprite_list:
+                sprite.center_x += change_x
+                sprite.center_y += change_y
+            return
+
+        self._set_sprite_state(self._get_positions() + (change_x, change_y))
+
+    def _get_positions(self) -> np.ndarray:
+        """ Get the positions of all sprites, in list order, as an array of shape (n, 2). """
+        positions = np.array([sprite.position for sprite in self.sprite_list], dtype=np.float64)
+        return positions.reshape(-1, 2)
+
+    def _set_sprite_state(self,
+                          positions: np.ndarray,
+                          angles: Optional[np.ndarray] = None,
+                          scales: Optional[np.ndarray] = None):
+        """
+        Change every sprite in the list at once, in list order.
+
+        The sprites are updated without going through their property setters,
+        so the instance buffer of this list is brought up to date in one pass,
+        instead of once per sprite and coordinate. Only the sprites that
+        actually moved, turned or changed size are touched, and are moved in
+        the spatial hashes and the other lists holding them.
+
+        :param np.ndarray positions: New positions, shape (n, 2)
+        :param np.ndarray angles: New angles in degrees, shape (n,). Unchanged if None.
+        :param np.ndarray scales: New scales, shape (n,). Unchanged if None.
+        """
+        sprites = self.sprite_list
+        changed = (positions != self._get_positions()).any(axis=1)
+        if angles is not None:
+            changed |= angles != np.array([sprite._angle for sprite in sprites], dtype=np.float64)
+        if scales is not None:
+            changed |= scales != np.array([sprite._scale for sprite in sprites], dtype=np.float64)
+
+        indices = np.flatnonzero(changed)
+        if len(indices) == 0:
+            return
+        sprites = [sprites[i] for i in indices.tolist()]
+        positions = positions[indices]
+        if angles is not None:
+            angles = angles[indices]
+        if scales is not None:
+            scales = scales[indices]
+
+        for sprite in sprites:
+            for sprite_list in sprite.sprite_lists:
+                if sprite_list.use_spatial_hash:
+                    sprite_list.spatial_hash.remove_object(sprite)
+
+        for sprite, position in zip(sprites, positions.tolist()):
+            sprite._position = tuple(position)
+            sprite._point_list_cache = None
+
+        if angles is not None:
+            for sprite, angle in zip(sprites, angles.tolist()):
+                if angle != sprite._angle:
+                    sprite._angle = angle
+                    sprite._local_hit_box_cache = None
+
+        if scales is not None:
+            for sprite, scale in zip(sprites, scales.tolist()):
+                sprite._scale = scale
+                sprite._local_hit_box_cache = None
+                if sprite.texture:
+                    sprite._width = sprite.texture.width * scale
+                    sprite._height = sprite.texture.height * scale
+
+        if self._vao1 is not None:
+            slots = np.fromiter(map(self._sprite_slot.__getitem__, sprites), dtype=np.intp, count=len(sprites))
+            self._sprite_pos_data[slots] = positions
+            if angles is not None:
+                self._sprite_angle_data[slots] = np.radians(angles)
+            if scales is not None:
+                self._sprite_size_data[slots] = [(sprite.width, sprite.height) for sprite in sprites]
+            self._sprite_dirty.update(slots.tolist())
+
+        for sprite in sprites:
+            for sprite_list in sprite.sprite_lists:
+                if sprite_list.use_spatial_hash:
+                    sprite_list.spatial_hash.insert_object_for_box(sprite)
+                if sprite_list is not self:
+                    sprite_list.update_position(sprite)
+                    if scales is not None:
+                        sprite_list.update_size(sprite)
 
     def preload_textures(self, texture_names: List):
         """
@@ -476,257 +1423,66 @@ def preload_textures(self, texture_names: List):
 
         :param array texture_names: List of file names to load in as textures.
         """
-        self.array_of_texture_names.extend(texture_names)
-        self.array_of_images = None
+        for texture_name in texture_names:
+            self.atlas.add(load_texture(texture_name))
 
     def _calculate_sprite_buffer(self):
+        """
+        Build the instance buffers and the VAO for every sprite in the list
+        from scratch.
+        """
+        if len(self.sprite_list) == 0:
+            return
 
-        if self.is_static:
-            usage = 'static'
-        else:
-            usage = 'stream'
-
-        def _calculate_pos_buffer():
-            self._sprite_pos_data = array.array('f')
-            # print("A")
-            for sprite in self.sprite_list:
-                self._sprite_pos_data.append(sprite.center_x)
-                self._sprite_pos_data.append(sprite.center_y)
-
-            self._sprite_pos_buf = shader.buffer(
-                self._sprite_pos_data.tobytes(),
-                usage=usage
-            )
-            variables = ['in_pos']
-            self._sprite_pos_desc = shader.BufferDescription(
-                self._sprite_pos_buf,
-                '2f',
-                variables,
-                instanced=True)
-            self._sprite_pos_changed = False
-
-        def _calculate_size_buffer():
-            self._sprite_size_data = array.array('f')
-            for sprite in self.sprite_list:
-                self._sprite_size_data.append(sprite.width)
-                self._sprite_size_data.append(sprite.height)
+        if self.texture_id is None:
+            self.texture_id = SpriteList.next_texture_id
+        self._atlas_version = self.atlas.version
 
-            self._sprite_size_buf = shader.buffer(
-                self._sprite_size_data.tobytes(),
-                usage=usage
-            )
-            variables = ['in_size']
-            self._sprite_size_desc = shader.BufferDescription(
-                self._sprite_size_buf,
-                '2f',
-                variables,
-                instanced=True)
-            self._sprite_size_changed = False
-
-        def _calculate_angle_buffer():
-            self._sprite_angle_data = array.array('f')
-            for sprite in self.sprite_list:
-                self._sprite_angle_data.append(math.radians(sprite.angle))
+        capacity = _INITIAL_BUFFER_CAPACITY
+        while capacity < len(self.sprite_list):
+            capacity *= 2
+        self._set_sprite_data(np.zeros(capacity, dtype=_SPRITE_DTYPE))
+        self._previous_pos_data = None
 
-            self._sprite_angle_buf = shader.buffer(
-                self._sprite_angle_data.tobytes(),
-                usage=usage
-            )
-            variables = ['in_angle']
-            self._sprite_angle_desc = shader.BufferDescription(
-                self._sprite_angle_buf,
-                '1f',
-                variables,
-                instanced=True)
-            self._sprite_angle_changed = False
-
-        def _calculate_colors():
-            self._sprite_color_data = array.array('B')
-            for sprite in self.sprite_list:
-                self._sprite_color_data.append(int(sprite.color[0]))
-                self._sprite_color_data.append(int(sprite.color[1]))
-                self._sprite_color_data.append(int(sprite.color[2]))
-                self._sprite_color_data.append(int(sprite.alpha))
-
-            self._sprite_color_buf = shader.buffer(
-                self._sprite_color_data.tobytes(),
-                usage=usage
-            )
-            variables = ['in_color']
-            self._sprite_color_desc = shader.BufferDescription(
-                self._sprite_color_buf,
-                '4B',
-                variables,
-                normalized=['in_color'], instanced=True)
-            self._sprite_color_changed = False
-
-        def _calculate_sub_tex_coords():
-            """
-            Create a sprite sheet, and set up subtexture coordinates to point
-            to images in that sheet.
-            """
-            new_array_of_texture_names = []
-            new_array_of_images = []
-            new_texture = False
-            if self.array_of_images is None:
-                new_texture = True
-
-            # print()
-            # print("New texture start: ", new_texture)
+        self._repack()
+        self._create_buffers()
 
+    def _calculate_sub_tex_coords(self):
+        """
+        Point every slot at the atlas coordinates of its sprite's texture,
+        adding textures the atlas doesn't have yet.
+        """
+        self._atlas_changed = False
+        while True:
+            self._atlas_version = self.atlas.version
             for sprite in self.sprite_list:
+                self._write_sub_tex(self._sprite_slot[sprite], sprite)
 
-                # noinspection PyProtectedMember
-                if sprite.texture is None:
-                    raise Exception("Error: Attempt to draw a sprite without a texture set.")
-
-                name_of_texture_to_check = sprite.texture.name
-                if name_of_texture_to_check not in self.array_of_texture_names:
-                    new_texture = True
-                    # print("New because of ", name_of_texture_to_check)
-
-                if name_of_texture_to_check not in new_array_of_texture_names:
-                    new_array_of_texture_names.append(name_of_texture_to_check)
-                    if sprite.texture is None:
-                        raise ValueError(f"Sprite has no texture.")
-                    if sprite.texture.image is None:
-                        raise ValueError(f"Sprite texture {sprite.texture.name} has no image.")
-                    image = sprite.texture.image
-                    new_array_of_images.append(image)
-
-            # print("New texture end: ", new_texture)
-            # print(new_array_of_texture_names)
-            # print(self.array_of_texture_names)
-            # print()
-
-            if new_texture:
-                # Add back in any old textures. Chances are we'll need them.
-                for index, old_texture_name in enumerate(self.array_of_texture_names):
-                    if old_texture_name not in new_array_of_texture_names and self.array_of_images is not None:
-                        new_array_of_texture_names.append(old_texture_name)
-                        image = self.array_of_images[index]
-                        new_array_of_images.append(image)
-
-                self.array_of_texture_names = new_array_of_texture_names
-
-                self.array_of_images = new_array_of_images
-                # print(f"New Texture Atlas with names {self.array_of_texture_names}")
-
-            # Get their sizes
-            widths, heights = zip(*(i.size for i in self.array_of_images))
-
-            grid_item_width, grid_item_height = max(widths), max(heights)
-            image_count = len(self.array_of_images)
-            root = math.sqrt(image_count)
-            grid_width = int(math.sqrt(image_count))
-            # print(f"\nimage_count={image_count}, root={root}")
-            if root == grid_width:
-                # Perfect square
-                grid_height = grid_width
-                # print("\nA")
-            else:
-                grid_height = grid_width
-                grid_width += 1
-                if grid_width * grid_height < image_count:
-                    grid_height += 1
-                # print("\nB")
-
-            # Figure out sprite sheet size
-            MARGIN = 1
-
-            sprite_sheet_width = (grid_item_width + MARGIN) * grid_width
-            sprite_sheet_height = (grid_item_height + MARGIN) * grid_height
-
-            if new_texture:
-
-                # TODO: This code isn't valid, but I think some releasing might be in order.
-                # if self.texture is not None:
-                #     shader.Texture.release(self.texture_id)
-
-                # Make the composite image
-                new_image2 = Image.new('RGBA', (sprite_sheet_width, sprite_sheet_height))
-
-                x_offset = 0
-                for index, image in enumerate(self.array_of_images):
-
-                    x = (index % grid_width) * (grid_item_width + MARGIN)
-                    y = (index // grid_width) * (grid_item_height + MARGIN)
-
-                    # print(f"Pasting {new_array_of_texture_names[index]} at {x, y}")
-
-                    new_image2.paste(image, (x, y))
-                    x_offset += image.size[0]
-
-                # Create a texture out the composite image
-                texture_bytes2 = new_image2.tobytes()
-                self._texture = shader.texture(
-                     (new_image2.width, new_image2.height),
-                     4,
-                     texture_bytes2
-                )
-
-                if self.texture_id is None:
-                    self.texture_id = SpriteList.next_texture_id
+            if self._atlas_changed:
+                raise Exception("Error: Attempt to draw a sprite without a texture set.")
 
-                # new_image2.save("sprites.png")
+            # Adding a texture can grow the atlas, moving the ones written before it
+            if self._atlas_version == self.atlas.version:
+                break
 
-            # Create a list with the coordinates of all the unique textures
-            tex_coords = []
+        self._sprite_slots_changed = True
 
-            for index, image in enumerate(self.array_of_images):
-                column = index % grid_width
-                row = index // grid_width
-
-                # Texture coordinates are reversed in y axis
-                row = grid_height - row - 1
-
-                x = column * (grid_item_width + MARGIN)
-                y = row * (grid_item_height + MARGIN)
-
-                # Because, coordinates are reversed
-                y += (grid_item_height - (image.height - MARGIN))
-
-                normalized_x = x / sprite_sheet_width
-                normalized_y = y / sprite_sheet_height
-
-                start_x = normalized_x
-                start_y = normalized_y
-
-                normalized_width = image.width / sprite_sheet_width
-                normalized_height = image.height / sprite_sheet_height
-
-                # print(f"Fetching {new_array_of_texture_names[index]} at {row}, {column} => {x}, {y} normalized to {start_x:.2}, {start_y:.2} size {normalized_width}, {normalized_height}")
-
-                tex_coords.append([start_x, start_y, normalized_width, normalized_height])
-
-            # Go through each sprite and pull from the coordinate list, the proper
-            # coordinates for that sprite's image.
-            array_of_sub_tex_coords = array.array('f')
-            for sprite in self.sprite_list:
-                index = self.array_of_texture_names.index(sprite.texture.name)
-                for coord in tex_coords[index]:
-                    array_of_sub_tex_coords.append(coord)
-
-            self._sprite_sub_tex_buf = shader.buffer(
-                array_of_sub_tex_coords.tobytes(),
-                usage=usage
-            )
-
-            self._sprite_sub_tex_desc = shader.BufferDescription(
-                self._sprite_sub_tex_buf,
-                '4f',
-                ['in_sub_tex_coords'],
-                instanced=True)
-            self._sprite_sub_tex_changed = False
-
-        if len(self.sprite_list) == 0:
-            return
+    def _create_buffers(self):
+        """
+        Create the OpenGL buffers and the VAO out of the current instance data.
+        Only needed on the first build, and when the capacity has grown.
+        """
+        if self.is_static:
+            usage = 'static'
+        else:
+            usage = 'stream'
 
-        _calculate_pos_buffer()
-        _calculate_size_buffer()
-        _calculate_angle_buffer()
-        _calculate_sub_tex_coords()
-        _calculate_colors()
+        self._sprite_buf = shader.buffer(self._sprite_data.tobytes(), usage=usage)
+        self._sprite_desc = shader.BufferDescription(
+            self._sprite_buf,
+            '2f 2f 1f 4f 4B',
+            ['in_pos', 'in_size', 'in_angle', 'in_sub_tex_coords', 'in_color'],
+            normalized=['in_color'], instanced=True)
 
         vertices = array.array('f', [
             #  x,    y,   u,   v
@@ -745,13 +1501,201 @@ def _calculate_sub_tex_coords():
 
         # Can add buffer to index vertices
         vao_content = [vbo_buf_desc,
-                       self._sprite_pos_desc,
-                       self._sprite_size_desc,
-                       self._sprite_angle_desc,
-                       self._sprite_sub_tex_desc,
-                       self._sprite_color_desc]
+                       self._sprite_desc]
         self._vao1 = shader.vertex_array(self.program, vao_content)
 
+        self._sprite_dirty.clear()
+        self._interpolated_slots.clear()
+        self._sprite_slots_changed = False
+        self._sprite_buffers_stale = False
+
+    def _grow(self):
+        """
+        Double the capacity of the instance buffers. Existing slots keep their
+        data, the OpenGL buffers are recreated on the next draw.
+        """
+        data = np.zeros(self._buf_capacity * 2, dtype=_SPRITE_DTYPE)
+        data[:self._buf_capacity] = self._sprite_data
+        if self._previous_pos_data is not None:
+            previous = np.zeros_like(data['pos'])
+            previous[:self._buf_capacity] = self._previous_pos_data
+            self._previous_pos_data = previous
+        self._set_sprite_data(data)
+
+        self._sprite_buffers_stale = True
+
+    def _set_sprite_data(self, data: np.ndarray):
+        """ Use a new array of sprite records, and point the column views at it. """
+        self._sprite_data = data
+        self._buf_capacity = len(data)
+        self._sprite_pos_data = data['pos']
+        self._sprite_size_data = data['size']
+        self._sprite_angle_data = data['angle']
+        self._sprite_color_data = data['color']
+        self._sprite_sub_tex_data = data['sub_tex']
+
+    def _repack(self):
+        """
+        Give every sprite a slot matching its position in the list, which
+        squeezes out holes and restores the draw order.
+        """
+        while self._buf_capacity < len(self.sprite_list):
+            self._grow()
+
+        self._sprite_slot = dict()
+        self._free_slots = set()
+        for slot, sprite in enumerate(self.sprite_list):
+            self._sprite_slot[sprite] = slot
+            self._write_slot(slot, sprite)
+        self._slot_count = len(self.sprite_list)
+        self._slots_out_of_order = False
+
+        for slot in [slot for slot in self._slot_textures if slot >= self._slot_count]:
+            self._release_slot_texture(slot)
+
+    def _add_slot(self, item: _SpriteType):
+        """ Give a newly added sprite a slot after the ones in use. """
+        if self._vao1 is None:
+            return
+
+        if self._slot_count == self._buf_capacity:
+            if self._free_slots:
+                # Reuse the room left by removed sprites. This assigns item a slot too.
+                self._repack()
+                return
+            self._grow()
+
+        slot = self._slot_count
+        self._slot_count += 1
+        self._sprite_slot[item] = slot
+        self._write_slot(slot, item)
+
+    def _remove_slot(self, item: _SpriteType):
+        """ Release the slot of a removed sprite, leaving a hole in its place. """
+        if self._vao1 is None:
+            return
+
+        slot = self._sprite_slot.pop(item)
+        self._release_slot_texture(slot)
+
+        # An instance with a size of zero is never rasterized
+        self._sprite_size_data[slot] = 0
+        self._sprite_dirty.add(slot)
+        self._sprite_slots_changed = True
+
+        # Holes at the end can be dropped right away
+        self._free_slots.add(slot)
+        while self._slot_count - 1 in self._free_slots:
+            self._slot_count -= 1
+            self._free_slots.remove(self._slot_count)
+
+    def _write_slot(self, slot: int, sprite: Sprite):
+        """ Copy the position, size, angle, color and texture of a sprite into a slot. """
+        self._sprite_pos_data[slot] = sprite.position
+        self._sprite_size_data[slot] = sprite.width, sprite.height
+        self._sprite_angle_data[slot] = math.radians(sprite.angle)
+        self._sprite_color_data[slot] = _get_rgba(sprite)
+        self._sprite_dirty.add(slot)
+        if self._previous_pos_data is not None:
+            # Nothing to move from for a sprite new to the slot
+            self._previous_pos_data[slot] = sprite.position
+
+        self._write_sub_tex(slot, sprite)
+        self._sprite_slots_changed = True
+
+    def _write_sub_tex(self, slot: int, sprite: Sprite):
+        """ Point a slot at the atlas coordinates of its sprite's texture. """
+        if sprite.texture is None:
+            # Might still get one before the next draw, which checks again
+            self._release_slot_texture(slot)
+            self._atlas_changed = True
+            return
+
+        self._sprite_sub_tex_data[slot] = self.atlas.get_tex_coords(sprite.texture)
+        self._sprite_dirty.add(slot)
+
+        key = self.atlas.get_key(sprite.texture)
+        used = self._slot_textures.get(slot)
+        if used is None or used[1] != key or used[0] is not self.atlas:
+            self.atlas.retain(key)
+            self._slot_textures[slot] = self.atlas, key
+            if used is not None:
+                used[0].release(used[1])
+
+    def _release_slot_texture(self, slot: int):
+        """ Stop counting the texture of a slot as used. """
+        used = self._slot_textures.pop(slot, None)
+        if used is not None:
+            used[0].release(used[1])
+
+    def _upload(self):
+        """
+        Send the dirty slots to the GPU. Only the changed spans are written,
+        unless so much changed that re-sending everything is cheaper. The
+        records are handed to OpenGL straight out of the array, without
+        copying them first.
+        """
+        dirty = self._sprite_dirty
+        dirty |= self._interpolated_slots
+        self._interpolated_slots.clear()
+        if not dirty:
+            return
+
+        if len(dirty) > self._slot_count * _FULL_UPLOAD_FRACTION:
+            self._sprite_buf.orphan()
+            self._sprite_buf.write(self._sprite_data[:self._slot_count])
+        else:
+            record_size = _SPRITE_DTYPE.itemsize
+            for start, end in _get_dirty_spans(dirty):
+                self._sprite_buf.write(self._sprite_data[start:end], offset=start * record_size)
+        dirty.clear()
+
+    def _upload_interpolated(self, interpolation: float):
+        """
+        Send the sprites that moved since store_positions() to the GPU, with
+        their position blended between the saved one and the current one.
+        Dirty slots, and the slots blended on the previous draw, go along.
+        """
+        count = self._slot_count
+        current = self._sprite_pos_data[:count]
+        previous = self._previous_pos_data[:count]
+        moving = np.flatnonzero((current != previous).any(axis=1)).tolist()
+
+        if self._interpolated_data is None or len(self._interpolated_data) != self._buf_capacity:
+            self._interpolated_data = np.empty(self._buf_capacity, dtype=_SPRITE_DTYPE)
+        data = self._interpolated_data
+        positions = data['pos']
+
+        dirty = self._sprite_dirty
+        dirty |= self._interpolated_slots
+        dirty.update(moving)
+        record_size = _SPRITE_DTYPE.itemsize
+        for start, end in _get_dirty_spans(dirty):
+            data[start:end] = self._sprite_data[start:end]
+            mixed = positions[start:end]
+            np.subtract(current[start:end], previous[start:end], out=mixed)
+            mixed *= interpolation
+            mixed += previous[start:end]
+            self._sprite_buf.write(data[start:end], offset=start * record_size)
+        dirty.clear()
+
+        # The next plain draw has to send the real positions again
+        self._interpolated_slots = set(moving)
+
+    def store_positions(self):
+        """
+        Remember where the sprites are now, so :meth:`draw` can draw them
+        part of the way between here and where they move to next.
+
+        Call this at the start of ``on_fixed_update``, before moving the
+        sprites, and draw with ``interpolation=window.fixed_update_alpha``.
+        Sprite movement then looks smooth, however the fixed updates line
+        up with the frames. Nothing is stored before the list was first drawn.
+        """
+        if self._vao1 is None:
+            return
+        self._previous_pos_data = self._sprite_pos_data.copy()
+
     def _dump(self, buffer):
         """
         Debugging method used to dump raw byte data in the OpenGL buffer.
@@ -770,31 +1714,30 @@ def _update_positions(self):
         if self._vao1 is None:
             return
 
-        for i, sprite in enumerate(self.sprite_list):
-            self._sprite_pos_data[i * 2] = sprite.position[0]
-            self._sprite_pos_data[i * 2 + 1] = sprite.position[1]
-            self._sprite_pos_changed = True
-
+        for sprite in self.sprite_list:
+            i = self._sprite_slot[sprite]
+            self._sprite_pos_data[i] = sprite.position
             self._sprite_angle_data[i] = math.radians(sprite.angle)
-            self._sprite_angle_changed = True
-
-            self._sprite_color_data[i * 4] = sprite.color[0]
-            self._sprite_color_data[i * 4 + 1] = sprite.color[1]
-            self._sprite_color_data[i * 4 + 2] = sprite.color[2]
-            self._sprite_color_data[i * 4 + 3] = sprite.alpha
-            self._sprite_color_changed = True
+            self._sprite_color_data[i] = _get_rgba(sprite)
+            self._sprite_size_data[i] = sprite.width, sprite.height
+            self._sprite_dirty.add(i)
 
-            self._sprite_size_data[i * 2] = sprite.width
-            self._sprite_size_data[i * 2 + 1] = sprite.height
-            self._sprite_size_changed = True
-
-    def update_texture(self, _sprite):
+    def update_texture(self, sprite):
         """ Make sure we update the texture for this sprite for the next batch
         drawing"""
         if self._vao1 is None:
             return
 
-        self._calculate_sprite_buffer()
+        i = self._sprite_slot[sprite]
+
+        # A new texture usually comes with a new size
+        self._sprite_size_data[i] = sprite.width, sprite.height
+        self._sprite_dirty.add(i)
+
+        self._write_sub_tex(i, sprite)
+
+        # Static lists redraw animated sprites too
+        self._sprite_slots_changed = True
 
     def update_position(self, sprite: Sprite):
         """
@@ -807,20 +1750,12 @@ def update_position(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
-
-        self._sprite_pos_data[i * 2] = sprite.position[0]
-        self._sprite_pos_data[i * 2 + 1] = sprite.position[1]
-        self._sprite_pos_changed = True
+        i = self._sprite_slot[sprite]
 
+        self._sprite_pos_data[i] = sprite.position
         self._sprite_angle_data[i] = math.radians(sprite.angle)
-        self._sprite_angle_changed = True
-
-        self._sprite_color_data[i * 4] = int(sprite.color[0])
-        self._sprite_color_data[i * 4 + 1] = int(sprite.color[1])
-        self._sprite_color_data[i * 4 + 2] = int(sprite.color[2])
-        self._sprite_color_data[i * 4 + 3] = int(sprite.alpha)
-        self._sprite_color_changed = True
+        self._sprite_color_data[i] = _get_rgba(sprite)
+        self._sprite_dirty.add(i)
 
     def update_color(self, sprite: Sprite):
         """
@@ -833,13 +1768,10 @@ def update_color(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
+        i = self._sprite_slot[sprite]
 
-        self._sprite_color_data[i * 4] = int(sprite.color[0])
-        self._sprite_color_data[i * 4 + 1] = int(sprite.color[1])
-        self._sprite_color_data[i * 4 + 2] = int(sprite.color[2])
-        self._sprite_color_data[i * 4 + 3] = int(sprite.alpha)
-        self._sprite_color_changed = True
+        self._sprite_color_data[i] = _get_rgba(sprite)
+        self._sprite_dirty.add(i)
 
     def update_size(self, sprite: Sprite):
         """
@@ -851,11 +1783,10 @@ def update_size(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
+        i = self._sprite_slot[sprite]
 
-        self._sprite_size_data[i * 2] = sprite.width
-        self._sprite_size_data[i * 2 + 1] = sprite.height
-        self._sprite_size_changed = True
+        self._sprite_size_data[i] = sprite.width, sprite.height
+        self._sprite_dirty.add(i)
 
     def update_height(self, sprite: Sprite):
         """
@@ -867,10 +1798,10 @@ def update_height(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
+        i = self._sprite_slot[sprite]
 
-        self._sprite_size_data[i * 2 + 1] = sprite.height
-        self._sprite_size_changed = True
+        self._sprite_size_data[i, 1] = sprite.height
+        self._sprite_dirty.add(i)
 
     def update_width(self, sprite: Sprite):
         """
@@ -882,10 +1813,10 @@ def update_width(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
+        i = self._sprite_slot[sprite]
 
-        self._sprite_size_data[i * 2] = sprite.width
-        self._sprite_size_changed = True
+        self._sprite_size_data[i, 0] = sprite.width
+        self._sprite_dirty.add(i)
 
     def update_location(self, sprite: Sprite):
         """
@@ -897,11 +1828,10 @@ def update_location(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
+        i = self._sprite_slot[sprite]
 
-        self._sprite_pos_data[i * 2] = sprite.position[0]
-        self._sprite_pos_data[i * 2 + 1] = sprite.position[1]
-        self._sprite_pos_changed = True
+        self._sprite_pos_data[i] = sprite.position
+        self._sprite_dirty.add(i)
 
     def update_angle(self, sprite: Sprite):
         """
@@ -913,9 +1843,9 @@ def update_angle(self, sprite: Sprite):
         if self._vao1 is None:
             return
 
-        i = self.sprite_idx[sprite]
+        i = self._sprite_slot[sprite]
         self._sprite_angle_data[i] = math.radians(sprite.angle)
-        self._sprite_angle_changed = True
+        self._sprite_dirty.add(i)
 
     def draw(self, **kwargs):
         """
@@ -923,6 +1853,9 @@ def draw(self, **kwargs):
 
         :param filter: Optional parameter to set OpenGL filter, such as
                        `gl.GL_NEAREST` to avoid smoothing.
+        :param interpolation: Optional fraction from 0 to 1. Draw the sprites that
+                              far from the positions saved by :meth:`store_positions`
+                              towards their current ones.
         """
         if self.program is None:
             # Used in drawing optimization via OpenGL
@@ -936,20 +1869,31 @@ def draw(self, **kwargs):
 
         if self._vao1 is None:
             self._calculate_sprite_buffer()
+        elif self._slots_out_of_order:
+            self._repack()
 
-        self._texture.use(0)
+        if self._atlas_changed or self._atlas_version != self.atlas.version:
+            self._calculate_sub_tex_coords()
+
+        if self._sprite_buffers_stale:
+            self._create_buffers()
+
+        self.atlas.use(0)
 
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
 
+        # The atlas is shared, so the filter of this list is set on every draw
         if "filter" in kwargs:
-            gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, kwargs["filter"])
-            gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, kwargs["filter"])
+            self._filter = kwargs["filter"]
+        gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, self._filter)
+        gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, self._filter)
         # gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
         # gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
 
         with self._vao1:
             self.program['Texture'] = self.texture_id
+            self.program['Margin'] = self.atlas.margin
             self.program['Projection'] = get_projection().flatten()
             texture_transform = None
             if len(self.sprite_list) > 0:
@@ -961,33 +1905,16 @@ def draw(self, **kwargs):
                 texture_transform = Matrix3x3()
             self.program['TextureTransform'] = texture_transform.v
 
-            if not self.is_static:
-                if self._sprite_pos_changed:
-                    self._sprite_pos_buf.orphan()
-                    self._sprite_pos_buf.write(self._sprite_pos_data.tobytes())
-                    self._sprite_pos_changed = False
-
-                if self._sprite_size_changed:
-                    self._sprite_size_buf.orphan()
-                    self._sprite_size_buf.write(self._sprite_size_data.tobytes())
-                    self._sprite_size_changed = False
-
-                if self._sprite_angle_changed:
-                    self._sprite_angle_buf.orphan()
-                    self._sprite_angle_buf.write(self._sprite_angle_data.tobytes())
-                    self._sprite_angle_changed = False
-
-                if self._sprite_color_changed:
-                    self._sprite_color_buf.orphan()
-                    self._sprite_color_buf.write(self._sprite_color_data.tobytes())
-                    self._sprite_color_changed = False
-
-                if self._sprite_sub_tex_changed:
-                    self._sprite_sub_tex_buf.orphan()
-                    self._sprite_sub_tex_buf.write(self._sprite_sub_tex_data.tobytes())
-                    self._sprite_sub_tex_changed = False
+            # Static lists only need an upload when sprites were added or removed
+            if not self.is_static or self._sprite_slots_changed:
+                interpolation = kwargs.get("interpolation")
+                if interpolation is not None and self._previous_pos_data is not None:
+                    self._upload_interpolated(interpolation)
+                else:
+                    self._upload()
+                self._sprite_slots_changed = False
 
-            self._vao1.render(gl.GL_TRIANGLE_STRIP, instances=len(self.sprite_list))
+            self._vao1.render(gl.GL_TRIANGLE_STRIP, instances=self._slot_count)
 
     def __len__(self) -> int:
         """ Return the length of the sprite list. """
@@ -1000,6 +1927,10 @@ def __iter__(self) -> Iterable[_SpriteType]:
     def __getitem__(self, i):
         return self.sprite_list[i]
 
+    def __contains__(self, sprite) -> bool:
+        """ Return if the sprite is in the sprite list. """
+        return sprite in self.sprite_idx
+
     def pop(self, index: int = -1) -> Sprite:
         """
         Pop off the last sprite, or the given index, from the list
@@ -1022,17 +1953,10 @@ def get_closest_sprite(sprite: Sprite, sprite_list: SpriteList) -> Optional[Tupl
     :return: Closest sprite.
     :rtype: Sprite
     """
-    if len(sprite_list) == 0:
+    closest = sprite_list.nearest(sprite.position)
+    if not closest:
         return None
-
-    min_pos = 0
-    min_distance = get_distance_between_sprites(sprite, sprite_list[min_pos])
-    for i in range(1, len(sprite_list)):
-        distance = get_distance_between_sprites(sprite, sprite_list[i])
-        if distance < min_distance:
-            min_pos = i
-            min_distance = distance
-    return sprite_list[min_pos], min_distance
+    return closest[0]
 
 
 def check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
@@ -1062,6 +1986,65 @@ def _check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
     :param Sprite sprite1: Sprite 1
     :param Sprite sprite2: Sprite 2
 
+    :returns: Boolean
+    """
+    if not _are_sprites_close(sprite1, sprite2):
+        return False
+
+    return _are_hit_boxes_intersecting(sprite1, sprite2)
+
+
+def _are_hit_boxes_intersecting(sprite1: Sprite, sprite2: Sprite) -> bool:
+    """
+    Check if the hit boxes of two sprites intersect. Sprites with
+    rectangular, unrotated hit boxes are compared by their edges,
+    everything else with :func:`are_polygons_intersecting`.
+
+    :param Sprite sprite1: Sprite 1
+    :param Sprite sprite2: Sprite 2
+
+    :returns: Boolean
+    """
+    overlap = _get_rect_overlap(sprite1, sprite2)
+    if overlap is not None:
+        return overlap[0] > 0 and overlap[1] > 0
+
+    return are_polygons_intersecting(sprite1.get_adjusted_hit_box(), sprite2.get_adjusted_hit_box())
+
+
+def _get_rect_overlap(sprite1: Sprite, sprite2: Sprite) -> Optional[Tuple[float, float]]:
+    """
+    Get how far the hit boxes of two sprites overlap in x and y, if both
+    are rectangles lined up with the axes. The sprites intersect if both
+    are above zero.
+
+    :param Sprite sprite1: Sprite 1
+    :param Sprite sprite2: Sprite 2
+
+    :returns: ``(overlap_x, overlap_y)``, or None if a hit box isn't an axis-aligned rectangle.
+    """
+    sprite1._get_local_hit_box()
+    sprite2._get_local_hit_box()
+    if not (sprite1._local_hit_box_is_rect and sprite2._local_hit_box_is_rect):
+        return None
+
+    x1, y1 = sprite1.position
+    x2, y2 = sprite2.position
+    left1, bottom1, right1, top1 = sprite1._local_hit_box_bounds
+    left2, bottom2, right2, top2 = sprite2._local_hit_box_bounds
+    overlap_x = min(right1 + x1, right2 + x2) - max(left1 + x1, left2 + x2)
+    overlap_y = min(top1 + y1, top2 + y2) - max(bottom1 + y1, bottom2 + y2)
+    return overlap_x, overlap_y
+
+
+def _are_sprites_close(sprite1: Sprite, sprite2: Sprite) -> bool:
+    """
+    Check if two sprites are within their collision radius of each other.
+    This is the quick check done before looking at hit boxes.
+
+    :param Sprite sprite1: Sprite 1
+    :param Sprite sprite2: Sprite 2
+
     :returns: Boolean
     """
     collision_radius_sum = sprite1.collision_radius + sprite2.collision_radius
@@ -1081,7 +2064,7 @@ def _check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
     if distance > collision_radius_sum * collision_radius_sum:
         return False
 
-    return are_polygons_intersecting(sprite1.get_adjusted_hit_box(), sprite2.get_adjusted_hit_box())
+    return True
 
 
 def check_for_collision_with_list(sprite: Sprite,
@@ -1105,9 +2088,20 @@ def check_for_collision_with_list(sprite: Sprite,
     else:
         sprite_list_to_check = sprite_list
 
-    collision_list = [sprite2
-                      for sprite2 in sprite_list_to_check
-                      if sprite is not sprite2 and _check_for_collision(sprite, sprite2)]
+    close_sprites = [sprite2
+                     for sprite2 in sprite_list_to_check
+                     if sprite is not sprite2 and _are_sprites_close(sprite, sprite2)]
+
+    if len(close_sprites) >= _BATCH_COLLISION_THRESHOLD:
+        # Move the hit boxes into place all at once
+        polygons, point_counts = pad_polygons([sprite2._get_local_hit_box() for sprite2 in close_sprites])
+        polygons += np.array([sprite2.position for sprite2 in close_sprites], dtype=np.float64)[:, None, :]
+        hits = are_polygons_intersecting_batch(sprite.get_adjusted_hit_box(), polygons, point_counts)
+        collision_list = [sprite2 for sprite2, hit in zip(close_sprites, hits.tolist()) if hit]
+    else:
+        collision_list = [sprite2
+                          for sprite2 in close_sprites
+                          if _are_hit_boxes_intersecting(sprite, sprite2)]
 
     # collision_list = []
     # for sprite2 in sprite_list_to_check:
@@ -1117,6 +2111,73 @@ def check_for_collision_with_list(sprite: Sprite,
     return collision_list
 
 
+def check_for_collision_between_lists(sprite_list_1: SpriteList,
+                                      sprite_list_2: SpriteList) -> List[Tuple[Sprite, Sprite]]:
+    """
+    Check for collisions between every sprite of one list and every sprite of
+    another, such as all bullets against all enemies.
+
+    This gives the same pairs as calling :func:`check_for_collision_with_list`
+    for each sprite of the first list, but does it in one pass. The sprites of
+    the second list are sorted by x, so each sprite of the first list is only
+    compared with those in its horizontal reach. Those are filtered with the
+    collision radius pre-check all at once, and only the pairs left get the
+    exact hit box check.
+
+    :param SpriteList sprite_list_1: First list of sprites
+    :param SpriteList sprite_list_2: Second list of sprites
+
+    :returns: List of ``(sprite from list 1, sprite from list 2)`` pairs that
+              collide, ordered as the sprites are in the first list and then the second.
+    """
+    if not isinstance(sprite_list_1, SpriteList):
+        raise TypeError(f"Parameter 1 is a {type(sprite_list_1)} instead of expected SpriteList.")
+    if not isinstance(sprite_list_2, SpriteList):
+        raise TypeError(f"Parameter 2 is a {type(sprite_list_2)} instead of expected SpriteList.")
+
+    sprites_1 = sprite_list_1.sprite_list
+    sprites_2 = sprite_list_2.sprite_list
+    if not sprites_1 or not sprites_2:
+        return []
+
+    positions_1 = sprite_list_1._get_positions()
+    positions_2 = sprite_list_2._get_positions()
+    radii_1 = np.array([sprite.collision_radius for sprite in sprites_1], dtype=np.float64)
+    radii_2 = np.array([sprite.collision_radius for sprite in sprites_2], dtype=np.float64)
+
+    # Sweep: sprites of list 2 close enough in x to touch each sprite of list 1
+    order = np.argsort(positions_2[:, 0], kind='stable')
+    sorted_x = positions_2[order, 0]
+    reach = radii_1 + radii_2.max()
+    start = np.searchsorted(sorted_x, positions_1[:, 0] - reach, side='left')
+    end = np.searchsorted(sorted_x, positions_1[:, 0] + reach, side='right')
+
+    # Expand the ranges into candidate pairs of indices
+    counts = end - start
+    total = int(counts.sum())
+    if total == 0:
+        return []
+    index_1 = np.repeat(np.arange(len(sprites_1)), counts)
+    run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    index_2 = order[np.repeat(start, counts) + run_offsets]
+
+    # Same collision radius pre-check as check_for_collision, for all pairs at once
+    diff = positions_1[index_1] - positions_2[index_2]
+    radius_sum = radii_1[index_1] + radii_2[index_2]
+    close = (diff * diff).sum(axis=1) <= radius_sum * radius_sum
+    index_1 = index_1[close]
+    index_2 = index_2[close]
+
+    sort = np.lexsort((index_2, index_1))
+    collisions = []
+    for i, j in zip(index_1[sort].tolist(), index_2[sort].tolist()):
+        sprite_1 = sprites_1[i]
+        sprite_2 = sprites_2[j]
+        if sprite_1 is not sprite_2 and _are_hit_boxes_intersecting(sprite_1, sprite_2):
+            collisions.append((sprite_1, sprite_2))
+    return collisions
+
+
 def get_sprites_at_point(point: Point,
                          sprite_list: SpriteList) -> List[Sprite]:
     """
@@ -1143,6 +2204,24 @@ def get_sprites_at_point(point: Point,
 
     return collision_list
 
+
+def has_line_of_sight(point_1: Point, point_2: Point, walls: SpriteList) -> bool:
+    """
+    Check if a straight line between two points is clear of walls, such as
+    whether an enemy can see the player.
+
+    :param Point point_1: Start of the line
+    :param Point point_2: End of the line
+    :param SpriteList walls: Sprites that block the line
+
+    :returns: True if no sprite in walls is in the way.
+    """
+    if not isinstance(walls, SpriteList):
+        raise TypeError(f"Parameter 3 is a {type(walls)} instead of expected SpriteList.")
+
+    return walls.raycast(point_1, point_2) is None
+
+
 def get_sprites_at_exact_point(point: Point,
                                sprite_list: SpriteList) -> List[Sprite]:
     """
@@ -232,7 +232,11 @@ def draw_text(text: str,
         text_sprite.height = image.height
 
         from arcade.sprite_list import SpriteList
+        from arcade.texture_atlas import TextureAtlas
         label.text_sprite_list = SpriteList()
+        # Every label gets an atlas just big enough for it, freed with the
+        # label, so the shared atlas doesn't fill up with text drawn once.
+        label.text_sprite_list.atlas = TextureAtlas(image.width + 1, image.height + 1)
         label.text_sprite_list.append(text_sprite)
 
         draw_text_cache[key] = label
@@ -4,6 +4,11 @@
 
 import os
 import math
+import json
+import atexit
+import threading
+import collections
+import concurrent.futures
 
 import PIL.Image
 import PIL.ImageOps
@@ -11,11 +16,33 @@
 
 from typing import Optional
 from typing import List
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Set
 
 from arcade import lerp
 from arcade import RectList
 from arcade import Color
 from arcade import calculate_points
+from arcade import PointList
+
+# What ":resources:" at the start of a file name stands for
+_RESOURCE_PATH = os.path.dirname(os.path.abspath(__file__)) + "/resources/"
+
+
+def _resolve_file_name(file_name):
+    """ Replace ``:resources:`` at the start of a file name with the folder of arcade's resources. """
+    if isinstance(file_name, str) and file_name.startswith(":resources:"):
+        return _RESOURCE_PATH + file_name[11:]
+    return file_name
+
+
+def _get_texture_name(file_name, x, y, width, height, flipped, mirrored) -> str:
+    """ Name of a texture loaded from a file. The separators keep names of different textures apart. """
+    return f"{file_name}|{x}|{y}|{width}|{height}|{flipped}|{mirrored}"
+
 
 def _lerp_color(start_color: Color, end_color: Color, u: float) -> Color:
     return (
@@ -179,6 +206,238 @@ def draw_scaled(self, center_x: float, center_y: float,
             self._sprite_list.draw()
 
 
+class TextureCache:
+    """
+    Textures loaded by :func:`load_texture` and :func:`load_textures`.
+
+    A whole image file is stored under its file name. Part of one is stored
+    under the tuple ``(file_name, x, y, width, height, flipped, mirrored)``
+    of the arguments it was loaded with.
+
+    The cache keeps every texture unless it is given a memory budget, such as
+    ``get_texture_cache().max_bytes = 256 * 1024 * 1024``. Each image is
+    counted as four bytes per pixel, once, even when several textures share
+    it. Whole images kept to cut more textures out of count too. When the
+    budget is exceeded, the least recently used textures are dropped until it
+    fits again. Pinned textures are never dropped.
+
+    A dropped texture is also dropped from the default texture atlas, unless
+    a sprite list still draws it. Sprites using it keep working, and loading
+    it again reads the file again. Textures dropped on another thread leave
+    the atlas the next time it is used on the main thread.
+
+    Attributes:
+        :max_bytes: Memory budget, or None for no limit.
+        :nbytes: Bytes used by the images in the cache.
+        :hits: Number of lookups that found a texture. :meth:`peek` isn't counted.
+        :misses: Number of lookups that didn't.
+        :evictions: Number of textures dropped to stay within the budget.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Create an empty cache.
+
+        :param int max_bytes: Memory budget in bytes, or None for no limit
+        """
+        self._max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Least recently used first. Each entry keeps the image it was counted
+        # with, in case the texture's image is replaced later.
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        # Number of entries sharing each image, by id
+        self._image_users: Dict[int, int] = dict()
+        self._pinned: Set[Hashable] = set()
+        # Textures dropped while holding the lock, to take out of the atlas once it is released
+        self._dropped: List[Texture] = []
+
+        # Textures can be loaded on several threads at once
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """ Memory budget of the cache, or None for no limit. """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+        self._remove_dropped()
+
+    def __len__(self) -> int:
+        """ Return the number of textures in the cache. """
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """ Return True if a texture with this key is in the cache. """
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """ Iterate over the keys of the textures, least recently used first. """
+        return iter(list(self._entries))
+
+    def __getitem__(self, key: Hashable) -> Texture:
+        texture = self.get(key)
+        if texture is None:
+            raise KeyError(key)
+        return texture
+
+    def __setitem__(self, key: Hashable, texture: Texture):
+        self.put(key, texture)
+
+    def __delitem__(self, key: Hashable):
+        if not self.remove(key):
+            raise KeyError(key)
+
+    def get(self, key: Hashable) -> Optional[Texture]:
+        """
+        Look up a texture, marking it as the most recently used.
+
+        :param key: Key of the texture
+        :returns: The texture, or None if it isn't in the cache
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def peek(self, key: Hashable) -> Optional[Texture]:
+        """
+        Look up a texture without counting a hit or miss, or marking it as used.
+
+        :param key: Key of the texture
+        :returns: The texture, or None if it isn't in the cache
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def put(self, key: Hashable, texture: Texture):
+        """
+        Add a texture, replacing any texture with the same key, then drop the
+        least recently used textures if the cache is over its budget.
+
+        :param key: Key to store the texture under
+        :param Texture texture: Texture to store
+        """
+        with self._lock:
+            self._discard(key, texture)
+            image = texture.image
+            self._entries[key] = texture, image
+            if image is not None:
+                users = self._image_users.get(id(image), 0)
+                if users == 0:
+                    self.nbytes += image.width * image.height * 4
+                self._image_users[id(image)] = users + 1
+            self._evict()
+        self._remove_dropped()
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Drop a texture from the cache, even if it is pinned.
+
+        :param key: Key of the texture
+        :returns: True if the texture was in the cache
+        """
+        with self._lock:
+            self._pinned.discard(key)
+            removed = self._discard(key)
+        self._remove_dropped()
+        return removed
+
+    def pin(self, key: Hashable):
+        """
+        Keep a texture in the cache, however long it goes unused.
+
+        :param key: Key of the texture
+        :raises KeyError: If the texture isn't in the cache
+        """
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._pinned.add(key)
+
+    def unpin(self, key: Hashable):
+        """
+        Let a pinned texture be dropped again when it is the least recently used.
+
+        :param key: Key of the texture
+        """
+        with self._lock:
+            self._pinned.discard(key)
+            self._evict()
+        self._remove_dropped()
+
+    def is_pinned(self, key: Hashable) -> bool:
+        """ Return True if the texture is pinned. """
+        return key in self._pinned
+
+    def clear(self):
+        """ Drop every texture, pinned or not. """
+        with self._lock:
+            self._dropped.extend(texture for texture, _ in self._entries.values())
+            self._entries.clear()
+            self._image_users.clear()
+            self._pinned.clear()
+            self.nbytes = 0
+        self._remove_dropped()
+
+    def _discard(self, key: Hashable, replacement: Optional[Texture] = None) -> bool:
+        """ Drop an entry and the bytes of its image, if no other entry uses it. """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        if entry[0] is not replacement:
+            self._dropped.append(entry[0])
+        image = entry[1]
+        if image is not None:
+            users = self._image_users.pop(id(image)) - 1
+            if users:
+                self._image_users[id(image)] = users
+            else:
+                self.nbytes -= image.width * image.height * 4
+        return True
+
+    def _evict(self):
+        """ Drop unpinned textures, least recently used first, until the cache fits its budget. """
+        if self._max_bytes is None:
+            return
+        for key in list(self._entries):
+            if self.nbytes <= self._max_bytes:
+                break
+            if key not in self._pinned:
+                self._discard(key)
+                self.evictions += 1
+
+    def _remove_dropped(self):
+        """ Take the textures dropped since the last call out of the default atlas. """
+        with self._lock:
+            dropped, self._dropped = self._dropped, []
+        for texture in dropped:
+            _remove_from_atlas(texture)
+
+
+def _remove_from_atlas(texture: Texture):
+    """ Free the room a texture takes up in the default atlas, unless a sprite list draws it. """
+    from arcade.texture_atlas import get_default_atlas
+    if threading.current_thread() is threading.main_thread():
+        get_default_atlas().remove(texture)
+    else:
+        # The atlas belongs to the main thread
+        get_default_atlas().remove_later(texture)
+
+
 def load_textures(file_name: str,
                   image_location_list: RectList,
                   mirrored: bool = False,
@@ -205,21 +464,16 @@ def load_textures(file_name: str,
 
     :raises: ValueError
     """
+    cache = load_texture.texture_cache  # type: ignore # dynamic attribute on function obj
+
     # See if we already loaded this texture file, and we can just use a cached version.
-    cache_file_name = "{}".format(file_name)
-    if cache_file_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-        texture = load_texture.texture_cache[cache_file_name]  # type: ignore # dynamic attribute on function obj
+    # Otherwise the file is read just for the crops, and released once they are made.
+    cache_file_name = f"{file_name}"
+    texture = cache.peek(cache_file_name)
+    if texture is not None:
         source_image = texture.image
     else:
-        # If we should pull from local resources, replace with proper path
-        if isinstance(file_name, str) and str(file_name).startswith(":resources:"):
-            import os
-            path = os.path.dirname(os.path.abspath(__file__))
-            file_name = f"{path}/resources/{file_name[11:]}"
-
-        source_image = PIL.Image.open(file_name)
-        result = Texture(cache_file_name, source_image)
-        load_texture.texture_cache[cache_file_name] = result  # type: ignore # dynamic attribute on function obj
+        source_image = PIL.Image.open(_resolve_file_name(file_name))
 
     source_image_width, source_image_height = source_image.size
     texture_info_list = []
@@ -247,10 +501,9 @@ def load_textures(file_name: str,
                              .format(y + height, source_image_height))
 
         # See if we already loaded this texture, and we can just use a cached version.
-        cache_name = "{}{}{}{}{}{}{}".format(file_name, x, y, width, height, flipped, mirrored)
-        if cache_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-            result = load_texture.texture_cache[cache_name]  # type: ignore # dynamic attribute on function obj
-        else:
+        key = (file_name, x, y, width, height, flipped, mirrored)
+        result = cache.get(key)
+        if result is None:
             image = source_image.crop((x, y, x + width, y + height))
             # image = _trim_image(image)
 
@@ -259,8 +512,8 @@ def load_textures(file_name: str,
 
             if flipped:
                 image = PIL.ImageOps.flip(image)
-            result = Texture(cache_name, image)
-            load_texture.texture_cache[cache_name] = result  # type: ignore # dynamic attribute on function obj
+            result = Texture(_get_texture_name(*key), image)
+            cache.put(key, result)
         texture_info_list.append(result)
 
     return texture_info_list
@@ -301,26 +554,27 @@ def load_texture(file_name: str,
     :raises: ValueError
     """
 
+    cache = load_texture.texture_cache  # type: ignore # dynamic attribute on function obj
+
     # See if we already loaded this texture, and we can just use a cached version.
-    cache_name = "{}{}{}{}{}{}{}".format(file_name, x, y, width, height, flipped, mirrored)
-    if can_cache and cache_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-        return load_texture.texture_cache[cache_name]  # type: ignore # dynamic attribute on function obj
+    # Keys are only built from the arguments, so a hit costs no string formatting.
+    key = (file_name, x, y, width, height, flipped, mirrored)
+    if can_cache:
+        result = cache.get(key)
+        if result is not None:
+            return result
 
     # See if we already loaded this texture file, and we can just use a cached version.
+    # Each call counts as one hit or miss, so this second lookup isn't counted.
     cache_file_name = f"{file_name}"
-    if cache_file_name in load_texture.texture_cache:  # type: ignore # dynamic attribute on function obj
-        texture = load_texture.texture_cache[cache_file_name]  # type: ignore # dynamic attribute on function obj
+    texture = cache.peek(cache_file_name)
+    if texture is not None:
         source_image = texture.image
     else:
-        # If we should pull from local resources, replace with proper path
-        if isinstance(file_name, str) and str(file_name).startswith(":resources:"):
-            import os
-            path = os.path.dirname(os.path.abspath(__file__))
-            file_name = f"{path}/resources/{file_name[11:]}"
-
-        source_image = PIL.Image.open(file_name).convert('RGBA')
-        result = Texture(cache_file_name, source_image)
-        load_texture.texture_cache[cache_file_name] = result  # type: ignore # dynamic attribute on function obj
+        source_image = PIL.Image.open(_resolve_file_name(file_name)).convert('RGBA')
+        # Kept for cutting out more textures, such as the other tiles of a tile
+        # map, and counted against the budget like any other image.
+        cache.put(cache_file_name, Texture(cache_file_name, source_image))
 
     source_image_width, source_image_height = source_image.size
 
@@ -353,13 +607,164 @@ def load_texture(file_name: str,
     if flipped:
         image = PIL.ImageOps.flip(image)
 
-    result = Texture(cache_name, image)
-    load_texture.texture_cache[cache_name] = result  # type: ignore # dynamic attribute on function obj
-    result.hit_box_points = calculate_points(image)
+    result = Texture(_get_texture_name(*key), image)
+    cache.put(key, result)
+
+    if _hit_box_cache is None:
+        result.hit_box_points = calculate_points(image)
+    else:
+        hit_box_key = _hit_box_cache.get_key(file_name, result.name)
+        points = _hit_box_cache.get(hit_box_key, image.size)
+        if points is None:
+            points = calculate_points(image)
+            _hit_box_cache.put(hit_box_key, image.size, points)
+        result.hit_box_points = points
     return result
 
 
-load_texture.texture_cache = dict()  # type: ignore
+load_texture.texture_cache = TextureCache()  # type: ignore
+
+
+def get_texture_cache() -> TextureCache:
+    """
+    Get the cache :func:`load_texture` and :func:`load_textures` keep textures in.
+    Use it to set a memory budget, pin textures or read the hit and miss counters.
+
+    :rtype: TextureCache
+    """
+    return load_texture.texture_cache  # type: ignore # dynamic attribute on function obj
+
+
+class HitBoxCache:
+    """
+    Hit boxes of loaded textures, kept in a JSON file between runs.
+
+    Entries are keyed by the texture's name, which holds the file name and
+    the crop, mirror and flip arguments, plus the size and modification
+    time of the file. Editing an image makes its old entries go unused.
+    """
+
+    def __init__(self, file_name: str):
+        """
+        Open a hit box cache. A missing or unreadable file starts an empty cache.
+
+        :param str file_name: File the hit boxes are read from and saved to
+        """
+        self.file_name = file_name
+        self._entries: Dict[str, dict] = dict()
+        self._changed = False
+
+        # Hit boxes can be added by load_textures_async threads while saving
+        self._lock = threading.Lock()
+
+        try:
+            with open(file_name) as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            entries = None
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def __len__(self) -> int:
+        """ Return the number of hit boxes in the cache. """
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(file_name: str, cache_name: str) -> Optional[str]:
+        """
+        Build the key of a texture, or return None if the image file can't be found.
+
+        :param str file_name: Name of the image file the texture is loaded from
+        :param str cache_name: Name of the texture in the texture cache
+        """
+        try:
+            stat = os.stat(_resolve_file_name(file_name))
+        except OSError:
+            return None
+        return f"{cache_name}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def get(self, key: Optional[str], size) -> Optional[PointList]:
+        """
+        Get the hit box stored for a texture.
+
+        :param str key: Key from :meth:`get_key`
+        :param size: Width and height of the texture's image
+        :returns: Hit box points, or None if there is no entry for an image of this size
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or tuple(entry.get("size", ())) != tuple(size):
+            return None
+        return [tuple(point) for point in entry["points"]]
+
+    def put(self, key: Optional[str], size, points: PointList):
+        """
+        Store the hit box of a texture. Use :meth:`save` to write it to disk.
+
+        :param str key: Key from :meth:`get_key`
+        :param size: Width and height of the texture's image
+        :param PointList points: Hit box points
+        """
+        if key is None:
+            return
+        entry = {"size": list(size), "points": [list(point) for point in points]}
+        with self._lock:
+            self._entries[key] = entry
+            self._changed = True
+
+    def save(self):
+        """ Write the cache to its file, if anything was added since it was loaded or saved. """
+        with self._lock:
+            if not self._changed:
+                return
+            entries = dict(self._entries)
+            self._changed = False
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.file_name))
+            os.makedirs(directory, exist_ok=True)
+
+            # Write a temporary file first, so a crash can't leave half a cache behind
+            temp_file_name = f"{self.file_name}.tmp"
+            with open(temp_file_name, "w") as file:
+                json.dump(entries, file, separators=(",", ":"))
+            os.replace(temp_file_name, self.file_name)
+        except OSError:
+            with self._lock:
+                self._changed = True
+            raise
+
+
+_hit_box_cache: Optional[HitBoxCache] = None
+
+
+def _save_hit_box_cache():
+    if _hit_box_cache is not None:
+        try:
+            _hit_box_cache.save()
+        except OSError:
+            pass
+
+
+atexit.register(_save_hit_box_cache)
+
+
+def set_hit_box_cache(file_name: Optional[str]) -> Optional[HitBoxCache]:
+    """
+    Keep the hit boxes calculated by :func:`load_texture` in a file, so the next
+    run of the program can skip calculating them. The cache is saved when the
+    program exits, or by calling :meth:`HitBoxCache.save`.
+
+    Images are still loaded from disk, as the pixels are needed for drawing.
+
+    :param str file_name: File to keep the hit boxes in, or None to stop using a cache
+    :returns: The cache, or None
+    :rtype: HitBoxCache
+    """
+    global _hit_box_cache
+    _save_hit_box_cache()
+    _hit_box_cache = None if file_name is None else HitBoxCache(file_name)
+    return _hit_box_cache
 
 
 def cleanup_texture_cache():
@@ -367,10 +772,62 @@ def cleanup_texture_cache():
     This cleans up the cache of textures. Useful when running unit tests so that
     the next test starts clean.
     """
-    load_texture.texture_cache = dict()
+    load_texture.texture_cache.clear()  # type: ignore # dynamic attribute on function obj
     import gc
     gc.collect()
 
+
+# Threads that load_textures_async decodes images on, created the first time it is used
+_texture_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def load_textures_async(file_names: Iterable[str],
+                        mirrored: bool = False,
+                        flipped: bool = False) -> List[concurrent.futures.Future]:
+    """
+    Start loading image files on background threads, so a window can keep
+    drawing while the textures of the next level load.
+
+    Each file is read, converted and given a hit box by :func:`load_texture`
+    on a worker thread, and lands in the same texture cache. The image is
+    copied to the graphics card later, on the main thread, the first time a
+    sprite list draws a sprite that uses it.
+
+    .. code-block:: python
+
+        futures = arcade.load_textures_async(file_names)
+        ...
+        if all(future.done() for future in futures):
+            textures = [future.result() for future in futures]
+
+    :param file_names: Names of the files to load
+    :param bool mirrored: If set to `True`, the images are mirrored left to right.
+    :param bool flipped: If set to `True`, the images are flipped upside down.
+
+    :returns: One :class:`concurrent.futures.Future` per file name, in the same order. \
+    The result of each is a :class:`Texture`, or the exception that loading raised.
+    """
+    global _texture_executor
+    if _texture_executor is None:
+        _texture_executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="arcade-texture")
+
+    futures = dict()
+    result = []
+    for file_name in file_names:
+        future = futures.get(file_name)
+        if future is None:
+            key = (file_name, 0, 0, 0, 0, flipped, mirrored)
+            texture = load_texture.texture_cache.peek(key)  # type: ignore # dynamic attribute on function obj
+            if texture is not None:
+                future = concurrent.futures.Future()
+                future.set_result(texture)
+            else:
+                future = _texture_executor.submit(load_texture, file_name, mirrored=mirrored, flipped=flipped)
+            futures[file_name] = future
+        result.append(future)
+    return result
+
+
 def load_spritesheet(file_name: str,
                      sprite_width: int,
                      sprite_height: int,
@@ -389,11 +846,7 @@ def load_spritesheet(file_name: str,
 
     texture_list = []
 
-    # If we should pull from local resources, replace with proper path
-    if isinstance(file_name, str) and str(file_name).startswith(":resources:"):
-        path = os.path.dirname(os.path.abspath(__file__))
-        file_name = f"{path}/resources/{file_name[11:]}"
-
+    file_name = _resolve_file_name(file_name)
     source_image = PIL.Image.open(file_name).convert('RGBA')
     for sprite_no in range(count):
         row = sprite_no // columns
@@ -0,0 +1,386 @@
+"""
+Texture atlas shared by all sprite lists.
+
+Every texture drawn through a sprite list is packed once into a single
+OpenGL texture. New textures are copied into their own region with
+``glTexSubImage2D``, so adding one never rebuilds the images already there.
+
+Sprite lists tell the atlas which textures their sprites use. Textures no
+list uses any more are dropped when the atlas runs out of room, so it
+doesn't fill up with images that are never drawn again.
+"""
+
+import array
+import collections
+from ctypes import byref
+
+import pyglet.gl as gl
+
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from arcade import shader
+from arcade import Texture
+
+# Empty pixels kept right of and below every image, so linear filtering
+# doesn't bleed neighbouring images into each other.
+_MARGIN = 1
+
+# Size a new atlas starts out with
+_INITIAL_ATLAS_SIZE = (1024, 1024)
+
+
+class TextureAtlas:
+    """
+    Pack textures into one OpenGL texture, so sprites using different
+    textures can be drawn together.
+
+    Images are placed on horizontal shelves. A texture goes on the shortest
+    shelf tall enough for it, or starts a new shelf below the others. When there is
+    no room left the atlas doubles its width or height, up to the largest
+    texture the graphics card supports.
+
+    Textures are told apart by name and image, as textures of different
+    images can share a name, such as solid colors of different sizes.
+
+    Sprite lists count how many of their sprites use each texture with
+    :meth:`retain` and :meth:`release`. Textures that aren't used stay in the
+    atlas, in case they are drawn again, until it is full. Then, if they take
+    up at least half of it, or it can't grow any more, they are dropped and
+    the rest are packed again instead of growing the atlas.
+    """
+
+    def __init__(self, width: int = _INITIAL_ATLAS_SIZE[0], height: int = _INITIAL_ATLAS_SIZE[1]):
+        """
+        Create an empty atlas. The OpenGL texture is made the first time the
+        atlas is used for drawing.
+
+        :param int width: Starting width of the atlas, in pixels
+        :param int height: Starting height of the atlas, in pixels
+        """
+        self.width = width
+        self.height = height
+
+        # Transparent pixels right of and below every image
+        self.margin = _MARGIN
+
+        # Incremented every time the atlas is resized, as that changes the
+        # normalized coordinates of every region.
+        self.version = 0
+
+        # By the key of each texture. The images are kept as they were given,
+        # so the ids in the keys stay unique.
+        self._regions: Dict[Hashable, Tuple[int, int, int, int]] = dict()
+        self._images = dict()
+        self._tex_coords: Dict[Hashable, array.array] = dict()
+
+        # Each shelf is [y, height, x of the free space on it]
+        self._shelves: List[List[int]] = []
+        self._shelves_bottom = 0
+
+        # Number of sprite list slots using each texture, and the area of
+        # regions given up since the textures were last packed.
+        self._references: Dict[Hashable, int] = dict()
+        self._removed_area = 0
+
+        # Textures other threads asked to drop, dropped on the main thread
+        # the next time a texture is added or the atlas is drawn from.
+        self._pending_removals: collections.deque = collections.deque()
+
+        self._texture: Optional[shader.Texture] = None
+        self._texture_stale = False
+        self._object_space = None
+        self._max_size = None
+
+    def __len__(self) -> int:
+        """ Return the number of textures in the atlas. """
+        return len(self._regions)
+
+    def __contains__(self, texture: Texture) -> bool:
+        """ Return True if the texture is already in the atlas. """
+        return self.get_key(texture) in self._regions
+
+    @staticmethod
+    def get_key(texture: Texture) -> Hashable:
+        """
+        Get the key a texture is stored under, and counted by with
+        :meth:`retain` and :meth:`release`.
+
+        :param Texture texture: Texture to get the key of
+        """
+        return texture.name, id(texture.image)
+
+    def add(self, texture: Texture) -> array.array:
+        """
+        Add a texture to the atlas, unless it is in it already.
+
+        :param Texture texture: Texture to add
+        :return: Texture coordinates of the image in the atlas
+        :rtype: array
+        """
+        key = self.get_key(texture)
+        coords = self._tex_coords.get(key)
+        if coords is not None:
+            return coords
+
+        self._remove_pending()
+        if texture.image is None:
+            raise ValueError(f"Texture {texture.name} has no image.")
+
+        image = texture.image
+        x, y = self._allocate(image.width + self.margin, image.height + self.margin)
+        self._regions[key] = x, y, image.width, image.height
+        self._images[key] = image
+
+        coords = self._calculate_tex_coords(key)
+        if self._is_texture_current():
+            self._write_image(key)
+        return coords
+
+    def remove(self, texture: Texture) -> bool:
+        """
+        Drop a texture from the atlas, unless a sprite list is using it.
+        Its room is reused the next time the textures are packed again.
+
+        :param Texture texture: Texture to drop
+        :return: True if the texture was dropped
+        """
+        key = self.get_key(texture)
+        if key not in self._regions or key in self._references:
+            return False
+        self._drop(key)
+        return True
+
+    def remove_later(self, texture: Texture):
+        """
+        Drop a texture the next time the atlas is used on the main thread,
+        as :meth:`remove` does. Safe to call from any thread.
+
+        :param Texture texture: Texture to drop
+        """
+        self._pending_removals.append(texture)
+
+    def retain(self, key: Hashable):
+        """
+        Count one more use of a texture, which keeps it in the atlas.
+
+        :param key: Key of a texture in the atlas, from :meth:`get_key`
+        """
+        self._references[key] = self._references.get(key, 0) + 1
+
+    def release(self, key: Hashable):
+        """
+        Count one use of a texture less. Textures nothing uses may be dropped
+        to make room for others.
+
+        :param key: Key of a texture in the atlas, from :meth:`get_key`
+        """
+        count = self._references.get(key, 0) - 1
+        if count > 0:
+            self._references[key] = count
+        else:
+            self._references.pop(key, None)
+
+    def get_tex_coords(self, texture: Texture) -> array.array:
+        """
+        Get the location of a texture in the atlas, adding it if needed.
+
+        The coordinates are ``(x, y, width, height)`` normalized to the atlas
+        size, with y counted from the bottom of the atlas. They change when
+        the atlas grows, which is signalled by a change of :attr:`version`.
+
+        :param Texture texture: Texture to look up
+        :return: Texture coordinates of the image in the atlas
+        :rtype: array
+        """
+        coords = self._tex_coords.get(self.get_key(texture))
+        if coords is None:
+            coords = self.add(texture)
+        return coords
+
+    def use(self, texture_unit: int = 0):
+        """
+        Bind the atlas texture for drawing. The texture is created on first
+        use, and re-created if the OpenGL context changed since.
+
+        :param int texture_unit: Texture unit to bind to
+        """
+        self._remove_pending()
+        if not self._is_texture_current():
+            self._create_texture()
+        self._texture.use(texture_unit)
+
+    def _remove_pending(self):
+        """ Drop the textures queued by :meth:`remove_later`. """
+        while self._pending_removals:
+            self.remove(self._pending_removals.popleft())
+
+    def _is_texture_current(self) -> bool:
+        """ Check the OpenGL texture exists in this context and matches the atlas size. """
+        return (self._texture is not None
+                and not self._texture_stale
+                and gl.current_context is not None
+                and self._object_space is gl.current_context.object_space
+                and self._texture.width == self.width
+                and self._texture.height == self.height)
+
+    def _allocate(self, width: int, height: int) -> Tuple[int, int]:
+        """
+        Find room for a block of pixels. When the atlas is full, unused
+        textures are dropped or the atlas grows.
+        """
+        while True:
+            position = self._find_space(width, height)
+            if position is not None:
+                return position
+
+            if not self._reclaim():
+                self._grow()
+
+    def _find_space(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """ Place a block of pixels on a shelf, or return None if there is no room for it. """
+        # Smallest shelf with space left on it that is tall enough
+        best_shelf = None
+        for shelf in self._shelves:
+            if height <= shelf[1] and width <= self.width - shelf[2]:
+                if best_shelf is None or shelf[1] < best_shelf[1]:
+                    best_shelf = shelf
+
+        if best_shelf is not None:
+            x = best_shelf[2]
+            best_shelf[2] += width
+            return x, best_shelf[0]
+
+        if width <= self.width and height <= self.height - self._shelves_bottom:
+            y = self._shelves_bottom
+            self._shelves.append([y, height, width])
+            self._shelves_bottom += height
+            return 0, y
+
+        return None
+
+    def _reclaim(self) -> bool:
+        """
+        Drop the textures nothing uses and pack the others again, if that
+        frees enough room to be worth it. Return True if it was done.
+        """
+        unused = [key for key in self._regions if key not in self._references]
+        unused_area = self._removed_area
+        for key in unused:
+            _, _, width, height = self._regions[key]
+            unused_area += (width + self.margin) * (height + self.margin)
+
+        can_grow = self.width * 2 <= self._get_max_size() or self.height * 2 <= self._get_max_size()
+        if unused_area == 0 or (can_grow and unused_area * 2 < self.width * self.height):
+            return False
+
+        for key in unused:
+            self._drop(key)
+        self._pack()
+        return True
+
+    def _drop(self, key: Hashable):
+        """ Forget a texture, leaving its region empty. """
+        _, _, width, height = self._regions.pop(key)
+        del self._images[key]
+        del self._tex_coords[key]
+        self._removed_area += (width + self.margin) * (height + self.margin)
+
+    def _pack(self):
+        """
+        Place every texture again, tallest first. The OpenGL texture is
+        re-created the next time the atlas is used.
+        """
+        self._shelves = []
+        self._shelves_bottom = 0
+        self._removed_area = 0
+        regions = sorted(self._regions.items(), key=lambda item: item[1][3], reverse=True)
+        for key, (_, _, width, height) in regions:
+            position = self._find_space(width + self.margin, height + self.margin)
+            while position is None:
+                self._grow()
+                position = self._find_space(width + self.margin, height + self.margin)
+            self._regions[key] = position[0], position[1], width, height
+
+        for key in self._tex_coords:
+            self._calculate_tex_coords(key)
+        self.version += 1
+        self._texture_stale = True
+
+    def _get_max_size(self) -> int:
+        """ Largest texture size OpenGL allows for the atlas. """
+        if self._max_size is None:
+            if gl.current_context is None:
+                # Without a context we can't ask. This is what every desktop card supports.
+                return 4096
+            value = gl.GLint()
+            gl.glGetIntegerv(gl.GL_MAX_TEXTURE_SIZE, byref(value))
+            self._max_size = value.value
+        return self._max_size
+
+    def _grow(self):
+        """
+        Double the smaller side of the atlas. Regions keep their pixel position,
+        the OpenGL texture is re-created the next time the atlas is used.
+        """
+        max_size = self._get_max_size()
+        if self.width <= self.height and self.width * 2 <= max_size:
+            self.width *= 2
+        elif self.height * 2 <= max_size:
+            self.height *= 2
+        elif self.width * 2 <= max_size:
+            self.width *= 2
+        else:
+            raise ValueError(f"Texture atlas is full at {self.width}x{self.height} "
+                             f"pixels with {len(self._regions)} textures.")
+
+        for key in self._tex_coords:
+            self._calculate_tex_coords(key)
+        self.version += 1
+
+    def _calculate_tex_coords(self, key: Hashable) -> array.array:
+        """ Normalize the region of a texture, with y flipped for OpenGL. """
+        x, y, width, height = self._regions[key]
+        coords = array.array('f', [x / self.width,
+                                   (self.height - y - height) / self.height,
+                                   width / self.width,
+                                   height / self.height])
+        self._tex_coords[key] = coords
+        return coords
+
+    def _create_texture(self):
+        """ Create the OpenGL texture and copy every image into it. """
+        if self._texture is not None and self._object_space is not gl.current_context.object_space:
+            # The old texture belongs to a context that may be gone.
+            # Make sure it isn't deleted from the current one by mistake.
+            self._texture.texture_id.value = 0
+
+        # Start out fully transparent, which the margins between images rely on
+        self._texture = shader.texture((self.width, self.height), 4, bytes(self.width * self.height * 4))
+        self._object_space = gl.current_context.object_space
+        self._texture_stale = False
+        for key in self._regions:
+            self._write_image(key)
+
+    def _write_image(self, key: Hashable):
+        """ Copy the image of a texture into its region of the OpenGL texture. """
+        x, y, width, height = self._regions[key]
+        image = self._images[key]
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        self._texture.write(image.tobytes(), x, y, width, height)
+
+
+_default_atlas = TextureAtlas()
+
+
+def get_default_atlas() -> TextureAtlas:
+    """
+    Get the texture atlas sprite lists draw from, unless told otherwise.
+
+    :rtype: TextureAtlas
+    """
+    return _default_atlas
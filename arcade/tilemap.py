@@ -339,8 +339,10 @@ def _create_sprite_from_tile(map_object: pytiled_parser.objects.TileMap,
 def _process_object_layer(map_object: pytiled_parser.objects.TileMap,
                           layer: pytiled_parser.objects.ObjectLayer,
                           scaling: float = 1,
-                          base_directory: str = "") -> SpriteList:
-    sprite_list: SpriteList = SpriteList()
+                          base_directory: str = "",
+                          sprite_list: Optional[SpriteList] = None) -> SpriteList:
+    if sprite_list is None:
+        sprite_list = SpriteList()
 
     for cur_object in layer.tiled_objects:
         if cur_object.gid is None:
@@ -382,8 +384,10 @@ def _process_object_layer(map_object: pytiled_parser.objects.TileMap,
 def _process_tile_layer(map_object: pytiled_parser.objects.TileMap,
                         layer: pytiled_parser.objects.TileLayer,
                         scaling: float = 1,
-                        base_directory: str = "") -> SpriteList:
-    sprite_list: SpriteList = SpriteList()
+                        base_directory: str = "",
+                        sprite_list: Optional[SpriteList] = None) -> SpriteList:
+    if sprite_list is None:
+        sprite_list = SpriteList()
     map_array = layer.data
 
     # Loop through the layer and add in the wall list
@@ -417,7 +421,9 @@ def _process_tile_layer(map_object: pytiled_parser.objects.TileMap,
 def process_layer(map_object: pytiled_parser.objects.TileMap,
                   layer_name: str,
                   scaling: float = 1,
-                  base_directory: str = "") -> SpriteList:
+                  base_directory: str = "",
+                  use_spatial_hash: bool = False,
+                  static_spatial_index: bool = False) -> SpriteList:
     """
     This takes a map layer returned by the read_tmx function, and creates Sprites for it.
 
@@ -428,6 +434,10 @@ def process_layer(map_object: pytiled_parser.objects.TileMap,
                     if numbers don't evenly divide.)
     :param base_directory: Base directory of the file, that we start from to
                            load images.
+    :param use_spatial_hash: Put the sprites in a spatial hash, for faster collision detection.
+    :param static_spatial_index: Put the sprites in a grid built once for the whole
+                                 layer, for faster collision detection with sprites
+                                 that don't move. See :class:`SpriteList`.
     :returns: A SpriteList.
 
     """
@@ -440,11 +450,13 @@ def process_layer(map_object: pytiled_parser.objects.TileMap,
         print(f"Warning, no layer named '{layer_name}'.")
         return SpriteList()
 
+    sprite_list = SpriteList(use_spatial_hash=use_spatial_hash, static_spatial_index=static_spatial_index)
+
     if isinstance(layer, pytiled_parser.objects.TileLayer):
-        return _process_tile_layer(map_object, layer, scaling, base_directory)
+        return _process_tile_layer(map_object, layer, scaling, base_directory, sprite_list)
 
     elif isinstance(layer, pytiled_parser.objects.ObjectLayer):
-        return _process_object_layer(map_object, layer, scaling, base_directory)
+        return _process_object_layer(map_object, layer, scaling, base_directory, sprite_list)
 
     print(f"Warning, layer '{layer_name}' has unexpected type. '{type(layer)}'")
     return SpriteList()
@@ -0,0 +1,12 @@
+import PIL.Image
+import pytest
+
+import arcade
+
+
+@pytest.fixture
+def make_texture():
+    """ Make a texture of a given name and size, filled with red. """
+    def make_texture(name, width, height):
+        return arcade.Texture(name, PIL.Image.new('RGBA', (width, height), (255, 0, 0, 255)))
+    return make_texture
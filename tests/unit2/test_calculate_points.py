@@ -1,5 +1,9 @@
+import PIL.Image
+import pytest
+
 import arcade
 
+
 def test_calculate_points():
     texture = arcade.load_texture(":resources:images/items/coinGold.png")
     result = arcade.calculate_points(texture.image)
@@ -8,3 +12,22 @@ def test_calculate_points():
     texture = arcade.load_texture(":resources:images/animated_characters/female_person/femalePerson_idle.png")
     result = arcade.calculate_points(texture.image)
     print(result)
+
+
+def test_calculate_points_of_a_plus_sign():
+    image = PIL.Image.new('RGBA', (5, 5), (0, 0, 0, 0))
+    for i in range(5):
+        image.putpixel((2, i), (255, 0, 0, 255))
+        image.putpixel((i, 2), (255, 0, 0, 255))
+
+    assert arcade.calculate_points(image) == [(0.5, 2.5), (-1.5, 2.5), (1.5, -0.5), (1.5, 1.5),
+                                              (-1.5, -1.5), (0.5, -1.5), (-2.5, 1.5), (-2.5, -0.5)]
+
+    # The hull goes round the outer corners of the pixels
+    assert arcade.calculate_points(image, "Hull") == [(-2.5, -0.5), (-0.5, -2.5), (0.5, -2.5), (2.5, -0.5),
+                                                      (2.5, 0.5), (0.5, 2.5), (-0.5, 2.5), (-2.5, 0.5)]
+
+    with pytest.raises(ValueError):
+        arcade.calculate_points(image, "Detailed")
+    with pytest.raises(TypeError):
+        arcade.calculate_points(image.convert('RGB'))
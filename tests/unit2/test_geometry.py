@@ -0,0 +1,38 @@
+import arcade
+
+
+def test_polygons_intersecting_batch():
+    triangle = [[0, 0], [10, 0], [5, 10]]
+    polygons = [
+        [[4, 4], [6, 4], [6, 6], [4, 6]],                 # Inside
+        [[20, 20], [30, 20], [30, 30], [20, 30]],         # Far away
+        [[8, 8], [12, 8], [12, 12], [8, 12]],             # Overlaps the bounding box only
+        [[-5, -5], [6, -5], [-5, 6]],                     # Overlaps a corner
+        [[9, 1], [15, 0], [15, 6], [12, 9], [9, 6]],      # Overlaps an edge
+    ]
+    expected = [arcade.are_polygons_intersecting(triangle, polygon) for polygon in polygons]
+    assert expected == [True, False, False, True, True]
+
+    padded, point_counts = arcade.pad_polygons(polygons)
+    assert padded.shape == (5, 5, 2)
+    assert list(point_counts) == [4, 4, 4, 3, 5]
+    assert padded[0, 4].tolist() == [4, 4]
+
+    result = arcade.are_polygons_intersecting_batch(triangle, padded, point_counts)
+    assert result.tolist() == expected
+
+    # Without padding the point counts can be left out
+    padded, _ = arcade.pad_polygons(polygons[:3])
+    assert arcade.are_polygons_intersecting_batch(triangle, padded).tolist() == expected[:3]
+
+
+def test_segment_polygon_intersection():
+    square = [[0, 0], [10, 0], [10, 10], [0, 10]]
+
+    assert arcade.get_segment_polygon_intersection((-10, 5), (10, 5), square) == 0.5
+    assert arcade.get_segment_polygon_intersection((15, 20), (15, -20), square) is None
+    assert arcade.get_segment_polygon_intersection((-10, 5), (-1, 5), square) is None
+    # Starting inside counts as a hit right away
+    assert arcade.get_segment_polygon_intersection((5, 5), (50, 5), square) == 0
+    # Through a corner
+    assert arcade.get_segment_polygon_intersection((-5, -5), (5, 5), square) == 0.5
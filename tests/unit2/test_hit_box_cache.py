@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+import arcade
+import arcade.texture
+
+IMAGE = ":resources:images/enemies/bee.png"
+
+
+def test_it_reuses_hit_boxes_from_the_file(tmp_path, monkeypatch):
+    file_name = str(tmp_path / "hit_boxes.json")
+    try:
+        arcade.cleanup_texture_cache()
+        cache = arcade.set_hit_box_cache(file_name)
+        texture = arcade.load_texture(IMAGE, mirrored=True)
+        cache.save()
+
+        with open(file_name) as file:
+            entries = json.load(file)
+        assert len(entries) == 1
+        assert list(entries.values())[0]["size"] == list(texture.image.size)
+
+        # A warm start finds every hit box in the file
+        def calculate_points(image):
+            raise AssertionError("Hit box was calculated again")
+
+        monkeypatch.setattr(arcade.texture, "calculate_points", calculate_points)
+        arcade.cleanup_texture_cache()
+        arcade.set_hit_box_cache(file_name)
+        assert arcade.load_texture(IMAGE, mirrored=True).hit_box_points == texture.hit_box_points
+
+        with pytest.raises(AssertionError):
+            arcade.load_texture(IMAGE)
+    finally:
+        arcade.set_hit_box_cache(None)
+        arcade.cleanup_texture_cache()
+
+
+def test_it_ignores_a_broken_file(tmp_path):
+    file_name = tmp_path / "hit_boxes.json"
+    file_name.write_text("{not json")
+
+    assert len(arcade.HitBoxCache(str(file_name))) == 0
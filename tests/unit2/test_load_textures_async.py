@@ -0,0 +1,26 @@
+import pytest
+
+import arcade
+
+IMAGES = [":resources:images/enemies/bee.png",
+          ":resources:images/enemies/fishGreen.png",
+          ":resources:images/enemies/bee.png"]
+
+
+def test_load_textures_async():
+    arcade.cleanup_texture_cache()
+    futures = arcade.load_textures_async(IMAGES, mirrored=True)
+    textures = [future.result(timeout=10) for future in futures]
+
+    # Repeated files are loaded once, and end up in the texture cache
+    assert futures[0] is futures[2]
+    assert textures[0] is arcade.load_texture(IMAGES[0], mirrored=True)
+    assert textures[1].hit_box_points == arcade.load_texture(IMAGES[1], mirrored=True, can_cache=False).hit_box_points
+
+    # Textures already in the cache don't go to the threads
+    assert arcade.load_textures_async(IMAGES[:1], mirrored=True)[0].result(timeout=0) is textures[0]
+
+    future = arcade.load_textures_async(["missing.png"])[0]
+    with pytest.raises(FileNotFoundError):
+        future.result(timeout=10)
+    arcade.cleanup_texture_cache()
@@ -58,3 +58,52 @@ def test_main():
     window.switch()
     window.test(20)
     window.close()
+
+
+def test_fast_sprites_stop_at_walls():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    floor = arcade.SpriteSolidColor(200, 4, arcade.color.BLACK)
+    floor.position = (100, 100)
+    wall_list.append(floor)
+    wall = arcade.SpriteSolidColor(4, 200, arcade.color.BLACK)
+    wall.position = (500, 100)
+    wall_list.append(wall)
+
+    # Falls further than the floor and bullet are thick in one update
+    bullet = arcade.SpriteSolidColor(8, 8, arcade.color.RED)
+    bullet.position = (100, 300)
+    bullet.change_y = -250
+    physics_engine = arcade.PhysicsEngineSimple(bullet, wall_list)
+    assert physics_engine.update() == [floor]
+    assert bullet.bottom == floor.top
+    assert bullet.change_y == 0
+
+    bullet.position = (300, 100)
+    bullet.change_x = 500
+    assert physics_engine.update() == [wall]
+    assert bullet.right == wall.left
+
+    # Starting inside a wall, it is pushed out the shortest way
+    bullet.position = (100, 99)
+    bullet.change_x = 0
+    physics_engine.update()
+    assert bullet.position == (100, 94)
+    assert arcade.check_for_collision_with_list(bullet, wall_list) == []
+
+    # Walls of any shape stop it too
+    ramp = arcade.SpriteSolidColor(40, 40, arcade.color.BLACK)
+    ramp.set_hit_box([(-20, -20), (20, -20), (20, 20)])
+    ramp.position = (100, 300)
+    wall_list.append(ramp)
+    bullet.position = (100, 500)
+    bullet.change_y = -300
+    assert physics_engine.update() == [ramp]
+    assert bullet.bottom == ramp.top
+    assert arcade.check_for_collision_with_list(bullet, wall_list) == []
+
+    # Landing on a slope lifts it out of the slope, not the whole box
+    bullet.position = (106, 316)
+    bullet.change_y = -5
+    assert physics_engine.update() == [ramp]
+    assert bullet.position == (106, 314)
+    assert arcade.check_for_collision_with_list(bullet, wall_list) == []
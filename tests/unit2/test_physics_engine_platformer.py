@@ -1,5 +1,6 @@
 import arcade
 import os
+import pytest
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -64,3 +65,39 @@ def test_main():
     window.test()
     multi_jump(window)
     window.close()
+
+
+def test_platformer_with_many_sprites():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(0, 400, 32):
+        wall = arcade.SpriteSolidColor(32, 32, arcade.color.BLACK)
+        wall.position = (x, 16)
+        wall_list.append(wall)
+
+    # A tower of boxes falling onto each other
+    box_list = arcade.SpriteList()
+    for i in range(4):
+        box = arcade.SpriteSolidColor(20, 20, arcade.color.RED)
+        box.position = (100 + i * 3, 60 + i * 30)
+        box_list.append(box)
+
+    with pytest.raises(TypeError):
+        arcade.PhysicsEnginePlatformerMulti(box_list, wall_list[0])
+
+    physics_engine = arcade.PhysicsEnginePlatformerMulti(box_list, wall_list, gravity_constant=1)
+    for _ in range(60):
+        physics_engine.update()
+
+    assert [box.bottom for box in box_list] == [32, 52, 72, 92]
+    assert [box.change_y for box in box_list] == [0, 0, 0, 0]
+    assert arcade.check_for_collision_between_lists(box_list, box_list) == []
+
+    # Jump counters are kept for each sprite
+    physics_engine.enable_multi_jump(2)
+    top = box_list[3]
+    assert physics_engine.can_jump(top)
+    physics_engine.jump(top, 10)
+    physics_engine.update()
+    physics_engine.increment_jump_counter(top)
+    assert not physics_engine.can_jump(top)
+    assert physics_engine.can_jump(box_list[0])
@@ -105,3 +105,74 @@ def test_sprite_collides_with_list():
     player.center_x = 5
     result = player.collides_with_list(coins)
     assert len(result) == 2, "Should collide with two"
+
+
+def test_collisions_between_lists():
+    bullets = arcade.SpriteList()
+    enemies = arcade.SpriteList(use_spatial_hash=True)
+    for i in range(40):
+        bullet = arcade.SpriteSolidColor(4, 12, arcade.csscolor.RED)
+        bullet.position = ((i * 37) % 300, (i * 53) % 200)
+        bullets.append(bullet)
+    for i in range(25):
+        enemy = arcade.SpriteSolidColor(20 + i % 3 * 30, 20, arcade.csscolor.BLUE)
+        enemy.position = ((i * 71) % 300, (i * 29) % 200)
+        enemy.angle = i * 15
+        enemies.append(enemy)
+
+    expected = [(bullet, enemy)
+                for bullet in bullets
+                for enemy in enemies
+                if arcade.check_for_collision(bullet, enemy)]
+    assert len(expected) > 0
+    assert arcade.check_for_collision_between_lists(bullets, enemies) == expected
+
+    # A sprite in both lists doesn't collide with itself
+    shared = enemies[0]
+    bullets.append(shared)
+    result = arcade.check_for_collision_between_lists(bullets, enemies)
+    assert (shared, shared) not in result
+    assert arcade.check_for_collision_between_lists(bullets, arcade.SpriteList()) == []
+
+
+def test_sprite_collides_with_crowded_list():
+    # Enough sprites near the player to have their hit boxes checked in one go
+    walls = arcade.SpriteList()
+    for i in range(100):
+        wall = arcade.SpriteSolidColor(8, 8, arcade.csscolor.RED)
+        wall.position = ((i % 10) * 6, (i // 10) * 6)
+        wall.angle = i * 7
+        walls.append(wall)
+
+    player = arcade.SpriteSolidColor(20, 20, arcade.csscolor.BLUE)
+    player.position = (27, 27)
+    player.angle = 30
+
+    expected = [wall for wall in walls if arcade.check_for_collision(player, wall)]
+    assert 0 < len(expected) < len(walls)
+    assert arcade.check_for_collision_with_list(player, walls) == expected
+
+
+def test_rectangles_collide_by_their_edges():
+    from arcade.sprite_list import _get_rect_overlap
+
+    wall = arcade.SpriteSolidColor(64, 64, arcade.csscolor.RED)
+    wall.position = (32, 32)
+    player = arcade.SpriteSolidColor(20, 40, arcade.csscolor.BLUE)
+    player.position = (50, 80)
+
+    assert _get_rect_overlap(player, wall) == (20, 4)
+    assert arcade.check_for_collision(player, wall) is True
+
+    # Touching edges don't collide, same as with the polygon check
+    player.bottom = wall.top
+    assert _get_rect_overlap(player, wall) == (20, 0)
+    assert arcade.check_for_collision(player, wall) is False
+
+    # Rotated hit boxes go through the polygon check
+    player.center_y -= 10
+    player.angle = 45
+    assert _get_rect_overlap(player, wall) is None
+    assert arcade.check_for_collision(player, wall) is True
+    player.angle = 90
+    assert _get_rect_overlap(player, wall) is not None
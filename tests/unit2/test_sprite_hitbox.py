@@ -39,4 +39,33 @@ def __init__(self):
 
 
 def test_sprite():
-    Test()
\ No newline at end of file
+    Test()
+
+
+def test_hit_box_follows_moves_and_rotation():
+    my_sprite = arcade.Sprite()
+    my_sprite.set_hit_box([[-10, -5], [10, -5], [10, 5], [-10, 5]])
+    my_sprite.angle = 90
+    my_sprite.position = (100, 100)
+    assert my_sprite.get_adjusted_hit_box() == [[105, 90], [105, 110], [95, 110], [95, 90]]
+    local_hit_box = my_sprite._get_local_hit_box()
+
+    # Moving keeps the rotated points, only the offset changes
+    my_sprite.center_x = 200
+    assert my_sprite._get_local_hit_box() is local_hit_box
+    assert my_sprite.get_adjusted_hit_box() == [[205, 90], [205, 110], [195, 110], [195, 90]]
+    assert (my_sprite.left, my_sprite.right, my_sprite.bottom, my_sprite.top) == (195, 205, 90, 110)
+
+    # Updating the list with no change in angle keeps them too
+    sprite_list = arcade.SpriteList()
+    sprite_list.append(my_sprite)
+    my_sprite.change_x = 1
+    sprite_list.update()
+    assert my_sprite._get_local_hit_box() is local_hit_box
+
+    my_sprite.change_x = 0
+    my_sprite.angle = 0
+    assert my_sprite.get_adjusted_hit_box() == [[191, 95], [211, 95], [211, 105], [191, 105]]
+
+    my_sprite.set_hit_box([[-1, -1], [1, -1], [1, 1], [-1, 1]])
+    assert my_sprite.get_adjusted_hit_box() == [[200, 99], [202, 99], [202, 101], [200, 101]]
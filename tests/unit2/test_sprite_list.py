@@ -1,3 +1,5 @@
+import pytest
+
 import arcade
 
 
@@ -56,3 +58,381 @@ def test_it_can_pop_at_a_given_index():
     assert spritelist._vao1 is None
 
 
+def test_it_keeps_gpu_buffers_on_append_and_remove():
+    window = arcade.Window(200, 200, "Test")
+    spritelist = arcade.SpriteList()
+    for i in range(10):
+        sprite = arcade.Sprite(":resources:images/items/coinGold.png", center_x=i * 10)
+        spritelist.append(sprite)
+    spritelist.draw()
+    vao = spritelist._vao1
+    capacity = spritelist._buf_capacity
+
+    # Appending and removing only touches the affected slots
+    sprite = arcade.Sprite(":resources:images/items/coinGold.png")
+    spritelist.append(sprite)
+    spritelist.remove(spritelist[3])
+    spritelist.draw()
+    assert spritelist._vao1 is vao
+    assert spritelist._slot_count == 11
+    assert spritelist._sprite_slot[sprite] == 10
+
+    # Removing from the end drops the trailing slots
+    spritelist.pop()
+    spritelist.draw()
+    assert spritelist._slot_count == 10
+
+    # The VAO is only recreated when the capacity grows
+    while len(spritelist) <= capacity:
+        spritelist.append(arcade.Sprite(":resources:images/items/coinGold.png"))
+    spritelist.draw()
+    assert spritelist._vao1 is not vao
+    assert spritelist._buf_capacity == capacity * 2
+    assert [spritelist._sprite_slot[s] for s in spritelist] == list(range(len(spritelist)))
+
+    window.close()
+
+
+def test_it_swaps_textures_in_place():
+    window = arcade.Window(200, 200, "Test")
+    spritelist = arcade.SpriteList()
+    for i in range(10):
+        spritelist.append(arcade.Sprite(":resources:images/items/coinGold.png", center_x=i * 10))
+    spritelist.draw()
+    vao = spritelist._vao1
+
+    sprite = spritelist[4]
+    sprite.texture = arcade.load_texture(":resources:images/tiles/boxCrate_double.png")
+    assert spritelist._sprite_dirty == {4}
+    assert list(spritelist._sprite_sub_tex_data[4]) == list(spritelist.atlas.get_tex_coords(sprite.texture))
+    assert list(spritelist._sprite_size_data[4]) == [128, 128]
+
+    spritelist.draw()
+    assert spritelist._vao1 is vao
+    assert not spritelist._sprite_dirty
+
+    window.close()
+
+
+def test_it_moves_and_rescales_the_whole_list():
+    window = arcade.Window(200, 200, "Test")
+    spritelist = arcade.SpriteList(use_spatial_hash=True)
+    other = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.Sprite(":resources:images/items/coinGold.png", center_x=x) for x in (0, 100)]
+    spritelist.extend(sprites)
+    other.append(sprites[0])
+    spritelist.draw()
+    other.draw()
+
+    spritelist.move(10, 5)
+    assert [s.position for s in sprites] == [(10, 5), (110, 5)]
+    assert list(spritelist._sprite_pos_data[1]) == [110, 5]
+    assert list(other._sprite_pos_data[0]) == [10, 5]
+    assert arcade.get_sprites_at_point((110, 5), spritelist) == [sprites[1]]
+    assert arcade.get_sprites_at_point((10, 5), other) == [sprites[0]]
+
+    width = sprites[0].width
+    spritelist.rescale(2)
+    assert [s.position for s in sprites] == [(-40, 5), (160, 5)]
+    assert [s.scale for s in sprites] == [2, 2]
+    assert sprites[0].width == width * 2
+    assert list(spritelist._sprite_size_data[0]) == [width * 2, width * 2]
+    assert list(other._sprite_size_data[0]) == [width * 2, width * 2]
+    assert arcade.get_sprites_at_point((-40, 5), other) == [sprites[0]]
+
+    window.close()
+
+
+def test_it_moves_only_what_changed_and_honours_setters(monkeypatch):
+    class Snapping(arcade.Sprite):
+        @property
+        def center_x(self):
+            return self._position[0]
+
+        @center_x.setter
+        def center_x(self, new_value):
+            self.position = (round(new_value / 10) * 10, self._position[1])
+
+    spritelist = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.Sprite(":resources:images/items/coinGold.png", center_x=x) for x in (0, 100)]
+    sprites[0].change_x = 5
+    spritelist.extend(sprites)
+
+    # The still sprite stays where it is in the spatial hash
+    removed = []
+    remove_object = spritelist.spatial_hash.remove_object
+    monkeypatch.setattr(spritelist.spatial_hash, "remove_object",
+                        lambda sprite: removed.append(sprite) or remove_object(sprite))
+    spritelist.update()
+    assert removed == [sprites[0]]
+    assert arcade.get_sprites_at_point((100, 0), spritelist) == [sprites[1]]
+
+    snapping = arcade.SpriteList()
+    snapping.append(Snapping(":resources:images/items/coinGold.png"))
+    snapping.move(7, 6)
+    assert snapping[0].position == (10, 6)
+
+
+def test_it_updates_plain_sprites_at_once():
+    class Follower(arcade.Sprite):
+        def update(self):
+            self.center_x = 42
+
+    spritelist = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.Sprite(":resources:images/items/coinGold.png", center_x=x) for x in (0, 100)]
+    sprites[0].change_x = 5
+    sprites[0].change_y = -5
+    sprites[1].change_angle = 30
+    spritelist.extend(sprites)
+
+    spritelist.update()
+    assert [s.position for s in sprites] == [(5, -5), (100, 0)]
+    assert [s.angle for s in sprites] == [0, 30]
+    assert arcade.get_sprites_at_point((5, -5), spritelist) == [sprites[0]]
+
+    # Lists with overridden update() still call it on every sprite
+    follower = Follower(":resources:images/items/coinGold.png")
+    spritelist.append(follower)
+    spritelist.update()
+    assert [tuple(s.position) for s in sprites] == [(10, -10), (100, 0)]
+    assert follower.center_x == 42
+
+
+def test_it_rehashes_once_after_a_batch_update():
+    spritelist = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.Sprite(":resources:images/items/coinGold.png", center_x=x) for x in (0, 200, 400)]
+    spritelist.extend(sprites)
+
+    with spritelist.batch_update():
+        with spritelist.batch_update():
+            for _ in range(3):
+                sprites[0].center_x += 10
+                sprites[0].center_y += 10
+        sprites[2].angle = 45
+        spritelist.remove(sprites[1])
+        # Moved sprites are out of the hash until the block ends
+        assert arcade.get_sprites_at_point((0, 0), spritelist) == []
+        assert arcade.get_sprites_at_point((30, 30), spritelist) == []
+
+    assert arcade.get_sprites_at_point((30, 30), spritelist) == [sprites[0]]
+    assert arcade.get_sprites_at_point((0, 0), spritelist) == []
+    assert arcade.get_sprites_at_point((200, 0), spritelist) == []
+    assert arcade.get_sprites_at_point((400, 0), spritelist) == [sprites[2]]
+
+
+def test_spatial_hash_keeps_only_occupied_cells():
+    from arcade.sprite_list import _SpatialHash
+
+    spatial_hash = _SpatialHash(cell_size=10)
+    sprite = arcade.SpriteSolidColor(15, 15, arcade.color.RED)
+    sprite.position = (20, 20)
+    spatial_hash.insert_object_for_box(sprite)
+    assert sorted(spatial_hash.contents) == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+    # Lookups in empty cells don't create them
+    assert spatial_hash.get_objects_for_point((500, 500)) == []
+    assert spatial_hash.get_objects_for_point((25, 25)) == [sprite]
+    assert len(spatial_hash.contents) == 4
+
+    # Removal uses the cells the sprite was put in, wherever it is now
+    sprite._position = (100, 100)
+    sprite._point_list_cache = None
+    spatial_hash.remove_object(sprite)
+    assert spatial_hash.contents == {}
+
+
+def test_it_finds_large_sprites_once():
+    walls = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=16)
+    platform = arcade.SpriteSolidColor(100, 20, arcade.color.RED)
+    platform.position = (50, 10)
+    walls.append(platform)
+    player = arcade.SpriteSolidColor(60, 40, arcade.color.BLUE)
+    player.position = (50, 30)
+
+    assert walls.spatial_hash.get_objects_for_box(player) == [platform]
+    assert arcade.check_for_collision_with_list(player, walls) == [platform]
+
+
+def test_static_spatial_index_matches_the_spatial_hash():
+    walls = arcade.SpriteList(static_spatial_index=True)
+    walls_hashed = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(20):
+        for y in range(10):
+            if (x + y) % 3:
+                for sprite_list in walls, walls_hashed:
+                    wall = arcade.SpriteSolidColor(32, 32, arcade.color.RED)
+                    wall.position = (x * 32 + 16, y * 32 + 16)
+                    sprite_list.append(wall)
+
+    def positions(sprites):
+        return sorted(sprite.position for sprite in sprites)
+
+    player = arcade.SpriteSolidColor(40, 50, arcade.color.BLUE)
+    for position in (100, 100), (16, 16), (300, 150), (-30, 40), (1000, 1000):
+        player.position = position
+        assert positions(arcade.check_for_collision_with_list(player, walls)) == \
+            positions(arcade.check_for_collision_with_list(player, walls_hashed))
+        assert positions(arcade.get_sprites_at_point(position, walls)) == \
+            positions(arcade.get_sprites_at_point(position, walls_hashed))
+
+    # Tiles fit the cells exactly, so each is in a single cell
+    assert walls.spatial_hash.cell_size == 32
+    assert sum(len(cell) for cell in walls.spatial_hash._cells) == len(walls)
+
+    # Changes to the list show up in the rebuilt grid
+    wall = walls[0]
+    wall.center_x = 2000
+    player.position = (2000, 16)
+    assert arcade.check_for_collision_with_list(player, walls) == [wall]
+    wall.remove_from_sprite_lists()
+    assert arcade.check_for_collision_with_list(player, walls) == []
+
+    # A segment along the bottom row passes the tiles of that row in order
+    row = walls.spatial_hash.get_objects_for_segment((0, 5), (640, 5))
+    assert [sprite.center_x for sprite in row] == sorted(sprite.center_x for sprite in row)
+    assert {sprite.center_y for sprite in row} == {16}
+    assert len(row) == len([sprite for sprite in walls if sprite.center_y == 16])
+
+
+def test_spatial_hash_sizes_its_cells_after_the_sprites():
+    tiles = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=None)
+    for i in range(100):
+        tile = arcade.SpriteSolidColor(16, 16, arcade.color.RED)
+        tile.position = (i % 10 * 16 + 8, i // 10 * 16 + 8)
+        tiles.append(tile)
+    assert tiles.spatial_hash.cell_size == 128
+
+    # The cells are resized once the list is used
+    assert arcade.get_sprites_at_point((8, 8), tiles) == [tiles[0]]
+    stats = tiles.get_spatial_hash_stats()
+    assert stats['cell_size'] == 32
+    assert stats['sprites'] == 100
+    # Tiles on a cell edge count for the cells on both sides
+    assert stats['cells'] == 36
+    assert stats['max_bucket_size'] == 9
+    assert stats['mean_bucket_size'] == 6.25
+    assert stats['cells_per_sprite'] == 2.25
+
+    # And again when the sprites grow a lot
+    tiles.rescale(8)
+    assert arcade.get_sprites_at_point(tiles[0].position, tiles) == [tiles[0]]
+    assert tiles.spatial_hash.cell_size == 256
+
+    # A fixed cell size only changes when asked to
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    for i in range(20):
+        wall = arcade.SpriteSolidColor(10, 10, arcade.color.RED)
+        wall.position = (i * 10, 0)
+        walls.append(wall)
+    arcade.get_sprites_at_point((0, 0), walls)
+    assert walls.spatial_hash.cell_size == 128
+    assert walls.tune_spatial_hash() == 20
+    assert arcade.get_sprites_at_point((0, 0), walls) == [walls[0]]
+    assert arcade.SpriteList().tune_spatial_hash() is None
+
+
+def test_it_finds_nearest_sprites():
+    plain = arcade.SpriteList()
+    hashed = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=32)
+    for i in range(100):
+        for sprite_list in plain, hashed:
+            sprite = arcade.SpriteSolidColor(10, 10, arcade.color.RED)
+            sprite.position = (i % 10 * 50, i // 10 * 50)
+            sprite_list.append(sprite)
+
+    for sprite_list in plain, hashed:
+        nearest = sprite_list.nearest((120, 110), k=3)
+        assert [sprite.position for sprite, _ in nearest] == [(100, 100), (150, 100), (100, 150)]
+        assert [distance for _, distance in nearest] == pytest.approx([22.36, 31.62, 44.72], abs=0.01)
+
+        # Ties are broken by list order
+        nearest = sprite_list.nearest((125, 0), k=2)
+        assert [sprite.position for sprite, _ in nearest] == [(100, 0), (150, 0)]
+        assert len(sprite_list.nearest((0, 0), k=1000)) == 100
+
+        within = sprite_list.within_radius((100, 100), 50)
+        assert [sprite.position for sprite in within] == [(100, 50), (50, 100), (100, 100), (150, 100), (100, 150)]
+        assert sprite_list.within_radius((1000, 1000), 50) == []
+
+        target = arcade.SpriteSolidColor(10, 10, arcade.color.BLUE)
+        target.position = (460, 440)
+        closest, distance = arcade.get_closest_sprite(target, sprite_list)
+        assert closest.position == (450, 450)
+
+    assert arcade.SpriteList().nearest((0, 0)) == []
+    assert arcade.get_closest_sprite(target, arcade.SpriteList()) is None
+
+
+def test_it_casts_rays():
+    plain = arcade.SpriteList()
+    hashed = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=32)
+    for x in (100, 200, 300):
+        for sprite_list in plain, hashed:
+            wall = arcade.SpriteSolidColor(20, 100, arcade.color.RED)
+            wall.position = (x, 50)
+            sprite_list.append(wall)
+
+    for walls in plain, hashed:
+        wall, point, distance = walls.raycast((0, 50), (1000, 50))
+        assert wall is walls[0]
+        assert point == pytest.approx((90, 50))
+        assert distance == pytest.approx(90)
+
+        # From the other side
+        wall, point, distance = walls.raycast((1000, 20), (0, 20))
+        assert wall is walls[2]
+        assert point == pytest.approx((310, 20))
+
+        assert walls.raycast((0, 150), (1000, 150)) is None
+        assert walls.raycast((0, 50), (50, 50)) is None
+
+        hits = walls.segment_query((150, 10), (1000, 90))
+        assert [hit[0] for hit in hits] == [walls[1], walls[2]]
+        assert hits[0][2] < hits[1][2]
+
+        assert arcade.has_line_of_sight((0, 150), (400, 150), walls)
+        assert not arcade.has_line_of_sight((0, 0), (400, 100), walls)
+
+
+def test_it_draws_interpolated_positions(monkeypatch):
+    window = arcade.Window(200, 200, "Test")
+    spritelist = arcade.SpriteList()
+    sprites = [arcade.Sprite(":resources:images/items/coinGold.png", center_x=x) for x in (0, 100)]
+    spritelist.extend(sprites)
+    spritelist.draw()
+
+    spritelist.store_positions()
+    sprites[0].center_x = 40
+    new_sprite = arcade.Sprite(":resources:images/items/coinGold.png", center_x=70)
+    spritelist.append(new_sprite)
+
+    written = []
+    monkeypatch.setattr(spritelist._sprite_buf, "write",
+                        lambda data, offset=0: written.append((offset, data.copy())))
+    spritelist.draw(interpolation=0.25)
+    assert written[-1][0] == 0
+    assert written[-1][1]['pos'][:, 0].tolist() == [10, 100, 70]
+    # The real positions are kept, and sent again on the next plain draw
+    assert spritelist._sprite_pos_data[0].tolist() == [40, 0]
+    spritelist.draw()
+    assert written[-1][1]['pos'][:, 0].tolist() == [40, 100, 70]
+
+    # Only the sprites that moved are sent
+    spritelist.store_positions()
+    new_sprite.center_x = 90
+    del written[:]
+    spritelist.draw(interpolation=0.5)
+    assert len(written) == 1
+    assert written[0][0] == 2 * written[0][1].itemsize
+    assert written[0][1]['pos'][:, 0].tolist() == [80]
+
+    window.close()
+
+
+def test_it_merges_dirty_slots_into_spans():
+    from arcade.sprite_list import _get_dirty_spans
+
+    assert _get_dirty_spans(set()) == []
+    assert _get_dirty_spans({5}) == [(5, 6)]
+    assert _get_dirty_spans({3, 1, 2, 10}) == [(1, 11)]
+    assert _get_dirty_spans({0, 1, 500, 1000, 1001}) == [(0, 2), (500, 501), (1000, 1002)]
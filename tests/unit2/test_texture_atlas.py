@@ -0,0 +1,108 @@
+import gc
+
+import pytest
+
+import arcade
+
+
+def test_it_adds_each_texture_once(make_texture):
+    atlas = arcade.TextureAtlas(64, 64)
+    texture = make_texture("a", 10, 10)
+    coords = atlas.add(texture)
+
+    assert atlas.add(texture) is coords
+    assert atlas.get_tex_coords(arcade.Texture("a", texture.image)) is coords
+    assert len(atlas) == 1
+    assert list(coords) == pytest.approx([0, 54 / 64, 10 / 64, 10 / 64])
+
+    # Another image under the same name gets a region of its own
+    other = make_texture("a", 20, 10)
+    assert list(atlas.add(other)) == pytest.approx([11 / 64, 54 / 64, 20 / 64, 10 / 64])
+    assert len(atlas) == 2
+
+
+def test_it_packs_textures_on_shelves(make_texture):
+    atlas = arcade.TextureAtlas(64, 64)
+    tall = make_texture("tall", 10, 20)
+    short = make_texture("short", 10, 10)
+    wide = make_texture("wide", 60, 5)
+    for texture in (tall, short, wide):
+        atlas.add(texture)
+
+    # Short textures share the shelf of the taller one, textures that don't
+    # fit next to it start a new shelf
+    assert atlas._regions[atlas.get_key(tall)] == (0, 0, 10, 20)
+    assert atlas._regions[atlas.get_key(short)] == (11, 0, 10, 10)
+    assert atlas._regions[atlas.get_key(wide)] == (0, 21, 60, 5)
+    assert atlas.version == 0
+
+
+def test_it_grows_when_full(make_texture):
+    atlas = arcade.TextureAtlas(32, 32)
+    a = make_texture("a", 20, 20)
+    b = make_texture("b", 20, 20)
+    atlas.add(a)
+    atlas.add(b)
+
+    assert (atlas.width, atlas.height) == (64, 32)
+    assert atlas.version == 1
+    assert atlas._regions[atlas.get_key(b)] == (21, 0, 20, 20)
+    assert list(atlas.get_tex_coords(a)) == pytest.approx([0, 12 / 32, 20 / 64, 20 / 32])
+
+    # Pretend the graphics card can't go beyond 64x64. Only textures in use
+    # are kept, so it is really full.
+    atlas._max_size = 64
+    atlas.retain(atlas.get_key(a))
+    atlas.retain(atlas.get_key(b))
+    with pytest.raises(ValueError):
+        atlas.add(make_texture("huge", 50, 50))
+
+
+def test_it_drops_unused_textures_when_full(make_texture):
+    atlas = arcade.TextureAtlas(32, 32)
+    atlas._max_size = 32
+    a = make_texture("a", 20, 10)
+    b = make_texture("b", 20, 10)
+    c = make_texture("c", 20, 10)
+    atlas.add(a)
+    atlas.add(b)
+    atlas.retain(atlas.get_key(b))
+    atlas.release(atlas.get_key(a))
+
+    # No room left, and the atlas can't grow, so "a" makes way
+    atlas.add(c)
+    assert a not in atlas
+    assert atlas._regions[atlas.get_key(b)] == (0, 0, 20, 10)
+    assert atlas._regions[atlas.get_key(c)] == (0, 11, 20, 10)
+    assert atlas.version == 1
+
+    assert not atlas.remove(b)
+    atlas.release(atlas.get_key(b))
+    assert atlas.remove(b)
+    assert len(atlas) == 1
+
+
+def test_sprite_lists_count_the_textures_they_use(make_texture):
+    atlas = arcade.TextureAtlas(64, 64)
+    sprite_list = arcade.SpriteList()
+    sprite_list.atlas = atlas
+    textures = {name: make_texture(name, 10, 10) for name in "abc"}
+    keys = {name: atlas.get_key(texture) for name, texture in textures.items()}
+    sprites = []
+    for name in "aab":
+        sprite = arcade.Sprite()
+        sprite.texture = textures[name]
+        sprite_list.append(sprite)
+        sprites.append(sprite)
+    sprite_list.draw()
+    assert atlas._references == {keys["a"]: 2, keys["b"]: 1}
+
+    sprite_list.remove(sprites[0])
+    sprites[2].texture = textures["c"]
+    sprite_list.update_texture(sprites[2])
+    assert atlas._references == {keys["a"]: 1, keys["c"]: 1}
+
+    # Sprites refer to their lists, so all of them have to go
+    del sprite_list, sprites, sprite
+    gc.collect()
+    assert atlas._references == {}
@@ -0,0 +1,130 @@
+import threading
+
+import PIL.Image
+import pytest
+
+import arcade
+
+
+def test_it_drops_the_least_recently_used_textures(make_texture):
+    cache = arcade.TextureCache(max_bytes=3 * 400)
+    for name in "abc":
+        cache.put(name, make_texture(name, 10, 10))
+    assert cache.nbytes == 1200
+
+    cache.get("a")
+    cache.put("d", make_texture("d", 10, 10))
+    assert list(cache) == ["c", "a", "d"]
+    assert cache.evictions == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cache.get("b") is None
+    assert cache.misses == 1
+
+    # Textures sharing an image are counted once
+    cache.put("c2", arcade.Texture("c2", cache["c"].image))
+    assert cache.nbytes == 1200
+    del cache["c"]
+    assert cache.nbytes == 1200
+    del cache["c2"]
+    assert cache.nbytes == 800
+
+
+def test_it_keeps_pinned_textures(make_texture):
+    cache = arcade.TextureCache(max_bytes=400)
+    cache.put("a", make_texture("a", 10, 10))
+    cache.pin("a")
+    cache.put("b", make_texture("b", 10, 10))
+    assert list(cache) == ["a"]
+
+    cache.unpin("a")
+    cache.put("c", make_texture("c", 10, 10))
+    assert list(cache) == ["c"]
+    assert cache.evictions == 2
+
+    with pytest.raises(KeyError):
+        cache.pin("a")
+
+
+def test_load_textures_releases_the_source_image():
+    arcade.cleanup_texture_cache()
+    file_name = ":resources:images/spritesheets/explosion.png"
+    textures = arcade.load_textures(file_name, [[0, 0, 256, 256], [256, 0, 256, 256]])
+
+    cache = arcade.get_texture_cache()
+    assert file_name not in cache
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * 256 * 256 * 4
+    assert arcade.load_textures(file_name, [[0, 0, 256, 256]])[0] is textures[0]
+    arcade.cleanup_texture_cache()
+
+
+def test_load_texture_keys_dont_collide(tmp_path):
+    arcade.cleanup_texture_cache()
+    PIL.Image.new('RGBA', (20, 4), (255, 0, 0, 255)).save(tmp_path / "a", "PNG")
+    PIL.Image.new('RGBA', (20, 4), (0, 0, 255, 255)).save(tmp_path / "a1", "PNG")
+
+    # Both used to be cached as ".../a12044FalseFalse"
+    red = arcade.load_texture(str(tmp_path / "a"), 12, 0, 4, 4)
+    blue = arcade.load_texture(str(tmp_path / "a1"), 2, 0, 4, 4)
+    assert red.image.getpixel((0, 0)) == (255, 0, 0, 255)
+    assert blue.image.getpixel((0, 0)) == (0, 0, 255, 255)
+    assert red.name != blue.name
+
+    assert arcade.load_texture(str(tmp_path / "a"), 12, 0, 4, 4) is red
+    assert (str(tmp_path / "a"), 12, 0, 4, 4, False, False) in arcade.get_texture_cache()
+    arcade.cleanup_texture_cache()
+
+
+def test_dropped_textures_leave_the_atlas(make_texture):
+    assert arcade.TextureCache().max_bytes is None
+
+    atlas = arcade.get_default_atlas()
+    cache = arcade.TextureCache(max_bytes=400)
+    texture = make_texture("test_dropped_textures_leave_the_atlas", 10, 10)
+    cache.put("a", texture)
+    atlas.add(texture)
+
+    cache.put("b", make_texture("b", 10, 10))
+    assert "a" not in cache
+    assert texture not in atlas
+
+    # Textures dropped on other threads wait for the main thread
+    texture = make_texture("test_dropped_textures_leave_the_atlas_2", 10, 10)
+    atlas.add(texture)
+    cache.put("c", texture)
+    thread = threading.Thread(target=cache.put, args=("d", make_texture("d", 10, 10)))
+    thread.start()
+    thread.join()
+    assert "c" not in cache
+    assert texture in atlas
+    atlas.add(make_texture("test_dropped_textures_leave_the_atlas_3", 10, 10))
+    assert texture not in atlas
+
+
+def test_load_texture_counts_one_lookup_per_call():
+    arcade.cleanup_texture_cache()
+    cache = arcade.get_texture_cache()
+    hits, misses = cache.hits, cache.misses
+    file_name = ":resources:images/spritesheets/explosion.png"
+    arcade.load_texture(file_name, 0, 0, 256, 256)
+    arcade.load_texture(file_name, 256, 0, 256, 256)
+    arcade.load_texture(file_name, 0, 0, 256, 256)
+    assert (cache.hits - hits, cache.misses - misses) == (1, 2)
+    arcade.cleanup_texture_cache()
+
+
+def test_cropped_loads_count_the_source_image():
+    arcade.cleanup_texture_cache()
+    file_name = ":resources:images/spritesheets/explosion.png"
+    arcade.load_texture(file_name, 0, 0, 256, 256)
+
+    cache = arcade.get_texture_cache()
+    source = cache[file_name].image
+    assert cache.nbytes == (source.width * source.height + 256 * 256) * 4
+
+    # The whole image is the first to go when the budget runs out
+    arcade.load_texture(file_name, 0, 0, 256, 256)
+    cache.max_bytes = cache.nbytes - 1
+    assert file_name not in cache
+    assert len(cache) == 1
+    arcade.cleanup_texture_cache()
@@ -116,3 +116,13 @@ def test_sprite_sheet():
     assert first_sprite.height == 16
     assert first_sprite.width == 16
 
+
+
+def test_static_spatial_index():
+    tmx_map = arcade.tilemap.read_tmx(":resources:/tmx_maps/test_map_1.tmx")
+    platforms_list = arcade.tilemap.process_layer(tmx_map, "Platforms", base_directory="test_data",
+                                                  static_spatial_index=True)
+    assert platforms_list.use_spatial_hash
+
+    first_sprite = platforms_list[0]
+    assert arcade.get_sprites_at_point(first_sprite.position, platforms_list) == [first_sprite]
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_window():
     import arcade
     width = 800
@@ -43,3 +46,48 @@ def f():
     arcade.open_window(width, height, title, resizable)
     arcade.quick_run(0.01)
 
+
+
+def test_fixed_update(monkeypatch):
+    import arcade
+    import arcade.application
+
+    class Clock:
+        now = 0.0
+
+        @staticmethod
+        def perf_counter():
+            return Clock.now
+
+    monkeypatch.setattr(arcade.application, "time", Clock)
+
+    class FixedView(arcade.View):
+        def __init__(self):
+            super().__init__()
+            self.steps = []
+
+        def on_fixed_update(self, delta_time):
+            self.steps.append(delta_time)
+
+    window = arcade.Window(200, 200, "Test", fixed_update_rate=1 / 100)
+    view = FixedView()
+    window.show_view(view)
+
+    window._run_fixed_updates(0.025)
+    assert view.steps == [1 / 100] * 2
+    assert window.fixed_update_alpha == pytest.approx(0.5)
+
+    # Frames drawn between steps are further along
+    Clock.now += 0.003
+    assert window.fixed_update_alpha == pytest.approx(0.8)
+    Clock.now += 0.01
+    assert window.fixed_update_alpha == 1.0
+
+    # Frames running late catch up, but only so far
+    window.set_fixed_update_rate(1 / 100, max_updates=3)
+    window._run_fixed_updates(0.1234)
+    assert len(view.steps) == 5
+    assert window.fixed_update_alpha == pytest.approx(0.34)
+
+    window.set_fixed_update_rate(None)
+    window.close()
@@ -57,6 +57,7 @@ def main():
                 "utils.py", \
                 "drawing_support.py", \
                 "texture.py", \
+                "texture_atlas.py", \
                 "buffered_draw_commands.py", \
                 "draw_commands.py", \
                 "geometry.py", \